@@ -0,0 +1,71 @@
+"""콜드 스타트 지연: 새 인터프리터에서 화면 단계·기법 모듈별 import 시간과 첫 화면 렌더링 시간.
+
+    python -m benchmarks.bench_import [--repeat 5] [--json OUT.json] [--baseline PREV.json]
+
+각 대상은 매번 새 프로세스에서 측정하며(중앙값), 함께 로드된 무거운 패키지(pandas, scipy, matplotlib,
+seaborn, docx, pyarrow)를 표시합니다. 첫 화면(main.py를 파일 업로드 없이 1회 실행)은 미리 불러오기를 끄고
+AppTest로 측정합니다. 첫 화면 단계에서 무거운 패키지가 로드되면 종료 코드 1을 반환합니다.
+--json으로 결과를 저장해 두고 다음 릴리스에서 --baseline으로 비교하면 변화량을 함께 출력합니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY = ("pandas", "scipy", "matplotlib", "seaborn", "docx", "pyarrow")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (이름, 측정 전에 불러올 모듈, 측정할 import 문)
+TARGETS = [
+    ("streamlit", "", "import streamlit"),
+    ("first page (main.py imports)", "import streamlit", "from statera import analyses, catalog, jobs, snapshot"),
+    ("after upload (ingest, results, streaming)", "import streamlit", "from statera import ingest, results, streaming"),
+    *[(f"method: {m}", "import streamlit; from statera import ingest, results", f"import statera.analyses.{m}")
+      for m in ("frequencies", "descriptive", "chi_square", "ttest", "anova", "correlation_matrix",
+                "reliability_analysis", "regression_analysis", "batch_analysis")],
+    ("report (python-docx)", "import streamlit; from statera import ingest, results", "import statera.report"),
+]
+FIRST_PAGE = """
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("main.py", default_timeout=60)
+t = time.perf_counter(); at.run(); seconds = time.perf_counter() - t
+assert not at.exception, at.exception
+"""
+
+
+def measure(setup, stmt):
+    code = (f"import sys, time, json\n{setup}\nbefore = set(sys.modules)\n"
+            + (stmt if "AppTest" in stmt else f"t = time.perf_counter()\n{stmt}\nseconds = time.perf_counter() - t\n")
+            + f"\nprint(json.dumps([seconds, [m for m in {HEAVY!r} if m in sys.modules and m not in before]]))")
+    env = dict(os.environ, STATERA_PREWARM="0", PYTHONPATH=ROOT)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--json", help="결과를 저장할 JSON 파일")
+    ap.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    args = ap.parse_args()
+    baseline = json.load(open(args.baseline, encoding="utf-8")) if args.baseline else {}
+    targets = TARGETS + [("first page render (AppTest)", "import streamlit", FIRST_PAGE)]
+    report, failed = {}, False
+    print(f"{'target':<44} {'median(s)':>9} {'min(s)':>8} {'vs base':>8}  heavy modules loaded")
+    for name, setup, stmt in targets:
+        runs = [measure(setup, stmt) for _ in range(args.repeat)]
+        times = [r[0] for r in runs]; heavy = runs[-1][1]
+        med = statistics.median(times); report[name] = {"median": med, "min": min(times), "heavy": heavy}
+        delta = f"{med - baseline[name]['median']:+8.3f}" if name in baseline else f"{'-':>8}"
+        print(f"{name:<44} {med:>9.3f} {min(times):>8.3f} {delta}  {', '.join(heavy) or '-'}")
+        if name.startswith("first page") and heavy: failed = True
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f: json.dump(report, f, indent=2, ensure_ascii=False)
+    if failed: print("FAIL: 첫 화면 단계에서 무거운 패키지가 로드되었습니다.")
+    sys.exit(int(failed))
+
+
+if __name__ == "__main__":
+    main()
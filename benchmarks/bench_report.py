@@ -0,0 +1,47 @@
+"""DOCX 결과표 기록 시간: 기존 셀 단위(t.cell) 방식 대비 일괄(add_bulk_table) 방식.
+
+    python -m benchmarks.bench_report [--max-legacy-cells 2000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from docx import Document
+
+from statera.report import add_bulk_table
+
+SIZES = [(10, 5), (50, 10), (100, 20), (300, 20), (1000, 20), (3000, 30)]
+
+
+def legacy_table(doc, r_df):
+    t = doc.add_table(r_df.shape[0]+1, r_df.shape[1]); t.style = 'Table Grid'
+    for j, c in enumerate(r_df.columns): t.cell(0,j).text = str(c)
+    for i in range(r_df.shape[0]):
+        for j in range(r_df.shape[1]): t.cell(i+1,j).text = str(r_df.values[i,j])
+    return t
+
+
+def timed(fn, r_df):
+    doc = Document(); start = time.perf_counter(); fn(doc, r_df)
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--max-legacy-cells", type=int, default=2_000, help="이 셀 수를 넘으면 기존 방식 측정을 생략")
+    args = ap.parse_args()
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>6} {'cols':>5} {'cells':>8} {'legacy(s)':>10} {'bulk(s)':>9} {'speedup':>8}")
+    for rows, cols in SIZES:
+        r_df = pd.DataFrame(rng.normal(size=(rows, cols)).round(3), columns=[f"V{j}" for j in range(cols)])
+        bulk = timed(add_bulk_table, r_df)
+        cells = rows * cols
+        if cells > args.max_legacy_cells:
+            print(f"{rows:>6} {cols:>5} {cells:>8} {'-':>10} {bulk:>9.3f} {'-':>8}"); continue
+        legacy = timed(legacy_table, r_df)
+        print(f"{rows:>6} {cols:>5} {cells:>8} {legacy:>10.3f} {bulk:>9.3f} {legacy / bulk:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""statera.regression.vif와 statsmodels variance_inflation_factor의 속도와 값 일치를 비교합니다.
+
+    python -m benchmarks.bench_vif [--rows N] [--max-legacy-cols P]
+
+상관된 예측변수(공통 요인 + 잡음)를 생성하여 열 수별로 두 방식의 시간과 최대 상대오차를 출력하고,
+완전 공선성(한 변수가 다른 두 변수의 합)인 설계에서도 대체 경로가 inf를 보고하는지 확인합니다.
+statsmodels는 앱 실행에 필요하지 않으므로 requirements-dev.txt로 설치합니다.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+from statsmodels.stats.outliers_influence import variance_inflation_factor
+
+from statera import regression
+
+
+def make_design(rows, cols, seed=0):
+    rng = np.random.default_rng(seed)
+    factor = rng.standard_normal((rows, 3))
+    X = factor @ rng.standard_normal((3, cols)) + rng.standard_normal((rows, cols))
+    return pd.DataFrame(X, columns=[f"x{i}" for i in range(cols)])
+
+
+def legacy(X):
+    Xc = sm.add_constant(X).values
+    return np.array([variance_inflation_factor(Xc, i) for i in range(1, Xc.shape[1])])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=50_000)
+    ap.add_argument("--max-legacy-cols", type=int, default=40)
+    args = ap.parse_args()
+    failed = False
+    print(f"{'rows':>8} {'cols':>5} {'legacy(s)':>10} {'gram(s)':>9} {'speedup':>8} {'max rel err':>12}")
+    for cols in (5, 20, 40, 80):
+        X = make_design(args.rows, cols)
+        t0 = time.perf_counter(); new = regression.vif(X).vif.to_numpy(); t_new = time.perf_counter() - t0
+        if cols > args.max_legacy_cols:
+            print(f"{args.rows:>8} {cols:>5} {'-':>10} {t_new:>9.3f} {'-':>8} {'-':>12}"); continue
+        t0 = time.perf_counter(); old = legacy(X); t_old = time.perf_counter() - t0
+        err = float(np.max(np.abs(new - old) / old)); failed |= not err < 1e-8
+        print(f"{args.rows:>8} {cols:>5} {t_old:>10.3f} {t_new:>9.3f} {t_old / t_new:>7.1f}x {err:>12.2e}")
+    X = make_design(2_000, 6); X["dup"] = X["x0"] + X["x1"]
+    res = regression.vif(X)
+    ok = res.singular and np.isinf(res.vif[["x0", "x1", "dup"]]).all() and np.isfinite(res.vif[["x2", "x3"]]).all()
+    failed |= not ok
+    print(f"\nsingular design: condition={res.condition:.2e} fallback={res.singular} "
+          f"VIF(x0,x1,dup)={res.vif[['x0', 'x1', 'dup']].tolist()} -> {'ok' if ok else 'FAIL'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""NIST StRD 일원분산분석 기준 데이터로 statera.groupstats의 정확도와 메모리 사용을 검증합니다.
+
+    python -m benchmarks.nist_anova [--data-dir DIR]
+
+- SmLs01–09: NIST가 공개한 구성 규칙(9개 집단, 집단당 21/201/2001개 관측, 공통 상수 1 / 1e6 / 1e12)대로
+  생성하며, 인증값은 그 구성에서 정확히 유도됩니다.
+- SiRstv, AtmWtAg 등: https://www.itl.nist.gov/div898/strd/anova/ 의 .dat 파일을 --data-dir에 두면
+  파일에 기록된 인증값과 함께 읽어 검증합니다.
+
+각 통계량의 LRE(log relative error, 일치하는 유효숫자 수)가 난이도별 기준 이상인지 확인하고,
+같은 DataFrame으로 반복 실행해도 열이 추가되거나 최대 메모리 사용량이 늘지 않는지 확인합니다.
+실패 시 종료 코드 1을 반환합니다.
+"""
+import argparse
+import glob
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from statera import groupstats
+
+# 난이도별 최소 LRE. 상수 1e12가 더해진 SmLs07–09는 입력을 float64로 읽는 순간 유효숫자 약 4자리가 남습니다.
+MIN_LRE = {"lower": 9.0, "average": 6.0, "higher": 3.0}
+STATS = ("ss_between", "ss_within", "ms_between", "ms_within", "F", "r2", "root_mse")
+
+
+@dataclass
+class Reference:
+    name: str
+    difficulty: str
+    frame: pd.DataFrame
+    certified: dict
+
+
+def smls(index):
+    """SmLs{index:02d}: 집단 1은 중심값 .4, 짝수 집단은 .3, 나머지 홀수 집단은 .5이며 첫 관측값 이후 ±.1이 번갈아 나옵니다."""
+    per_group = (21, 201, 2001)[(index - 1) % 3]
+    base = ("1", "1000000", "1000000000000")[(index - 1) // 3]
+    rows = []
+    for grp in range(1, 10):
+        mid = 4 if grp == 1 else 3 if grp % 2 == 0 else 5
+        digits = [mid] + [mid - 1 if i % 2 == 0 else mid + 1 for i in range(per_group - 1)]
+        rows += [(grp, float(f"{base}.{d}")) for d in digits]
+    frame = pd.DataFrame(rows, columns=["group", "y"])
+    ssb, ssw = 8 * 0.01 * per_group, 9 * (per_group - 1) * 0.01
+    dfw = 9 * (per_group - 1)
+    certified = dict(ss_between=ssb, ss_within=ssw, ms_between=ssb / 8, ms_within=ssw / dfw,
+                     F=(ssb / 8) / (ssw / dfw), r2=ssb / (ssb + ssw), root_mse=0.1)
+    return Reference(f"SmLs{index:02d}", ("lower", "average", "higher")[(index - 1) // 3], frame, certified)
+
+
+def _numbers(line):
+    out = []
+    for tok in line.split():
+        try: out.append(float(tok))
+        except ValueError: out = []
+    return out
+
+
+def read_dat(path, difficulty="average"):
+    """NIST StRD ANOVA .dat 파일에서 인증값과 (집단, 값) 데이터를 읽습니다."""
+    certified, rows, in_data = {}, [], False
+    with open(path, encoding="latin-1") as fh:
+        for line in fh:
+            text = line.strip()
+            # 머리말에도 "Data:" 줄(요인 수 등)이 있으므로 인증값은 위치와 관계없이 줄 머리로 찾습니다.
+            if text.startswith("Data:"): in_data = True; continue
+            nums = _numbers(text)
+            if text.startswith("Between") and len(nums) >= 4:
+                _, certified["ss_between"], certified["ms_between"], certified["F"] = nums[-4:]
+            elif text.startswith("Within") and len(nums) >= 3:
+                _, certified["ss_within"], certified["ms_within"] = nums[-3:]
+            elif "R-Squared" in text and nums:
+                certified["r2"] = nums[-1]
+            elif text.startswith("Standard Deviation") and nums:
+                certified["root_mse"] = nums[-1]
+            elif "Level of Difficulty" in text or "Stated Difficulty" in text:
+                for level in MIN_LRE:
+                    if level in text.lower(): difficulty = level
+            elif in_data and len(nums) == 2:
+                rows.append(nums)
+    name = os.path.splitext(os.path.basename(path))[0]
+    return Reference(name, difficulty, pd.DataFrame(rows, columns=["group", "y"]), certified)
+
+
+def lre(estimate, certified):
+    if estimate == certified: return 15.0
+    return float(min(15.0, -np.log10(abs(estimate - certified) / abs(certified))))
+
+
+def evaluate(ref):
+    fit = groupstats.oneway_anova(groupstats.group_stats(ref.frame["group"], ref.frame["y"]))
+    return {s: lre(getattr(fit, s), ref.certified[s]) for s in STATS if s in ref.certified}
+
+
+def memory_check(ref, repeats=5):
+    """반복 실행 시 DataFrame이 변경되지 않고 최대 메모리 사용량이 늘지 않는지 확인합니다."""
+    frame = ref.frame; before = frame.copy(); peaks = []
+    for _ in range(repeats):
+        tracemalloc.start()
+        groupstats.oneway_anova(groupstats.group_stats(frame["group"], frame["y"]))
+        peaks.append(tracemalloc.get_traced_memory()[1]); tracemalloc.stop()
+    unchanged = list(frame.columns) == list(before.columns) and frame.equals(before)
+    return unchanged, peaks
+
+
+def references(data_dir=None):
+    refs = [smls(i) for i in range(1, 10)]
+    if data_dir:
+        generated = {r.name for r in refs}
+        refs += [read_dat(p) for p in sorted(glob.glob(os.path.join(data_dir, "*.dat")))
+                 if os.path.splitext(os.path.basename(p))[0] not in generated]
+    return refs
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--data-dir", help="NIST StRD ANOVA .dat 파일 폴더 (SiRstv.dat, AtmWtAg.dat 등)")
+    args = ap.parse_args()
+    failed = False
+    print(f"{'dataset':<10} {'level':<8} " + " ".join(f"{s:>10}" for s in STATS) + f" {'mem':>6}")
+    for ref in references(args.data_dir):
+        scores = evaluate(ref)
+        unchanged, peaks = memory_check(ref)
+        mem_ok = unchanged and max(peaks[1:]) <= peaks[0] * 1.05 + 4096
+        ok = mem_ok and min(scores.values()) >= MIN_LRE[ref.difficulty]
+        failed |= not ok
+        print(f"{ref.name:<10} {ref.difficulty:<8} " + " ".join(f"{scores.get(s, float('nan')):>10.1f}" for s in STATS)
+              + f" {'ok' if mem_ok else 'GROW':>6}" + ("" if ok else "  <-- FAIL"))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
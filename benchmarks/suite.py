@@ -0,0 +1,258 @@
+"""전체 기법 성능·정확도 벤치마크: 크기(N)와 열 수를 늘린 합성 데이터, NIST StRD 기준 데이터.
+
+    python -m benchmarks.suite [--sizes 1000,10000,100000] [--widths 5,20] [--repeat 3] [--methods 기술통계,...]
+                               [--nist-dir DIR] [--json OUT.json] [--baseline PREV.json]
+
+- 합성 데이터: 각 기법을 작업 실행기와 같은 경로(statera.analyses.run)로 실행하고, statera.profiler로 단계별
+  시간(compute / assumptions / plot)을 기록합니다. 같은 데이터로 CSV 파싱, 그림 렌더링, DOCX 리포트 생성 시간도
+  함께 잽니다. STATERA_TRACE_MEMORY=1이면 단계별 최대 메모리도 기록합니다.
+- 정확도: 같은 데이터에서 계산 엔진의 결과를 독립적인 기준 구현(numpy/scipy 직접 계산)과 비교한
+  LRE(일치하는 유효숫자 수)의 최솟값입니다. 엔진이 scipy 함수를 그대로 호출하는 기법은 '-'로 표시합니다.
+- NIST StRD: 일원분산분석 SmLs01–09(및 --nist-dir의 .dat, benchmarks.nist_anova 재사용)와 단변량 요약통계
+  NumAcc1–4(구성 규칙으로 생성)의 평균·표준편차를 검증합니다.
+
+기준 LRE에 미달하거나 분석이 실패하면 종료 코드 1을 반환합니다. --json으로 결과를 저장하고 다음 측정에서
+--baseline으로 비교하면 시간 변화율을 함께 출력합니다.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import special, stats
+
+from benchmarks import nist_anova
+from statera import analyses, batch, catalog, contingency, correlation, frequency, groupstats, ingest, logistic, plots, profiler
+from statera import regression, reliability, report, streaming
+
+MIN_LRE = 7.0          # 서로 다른 알고리즘 간 float64 비교에서 요구하는 최소 일치 자릿수
+
+
+def lre(estimate, reference):
+    estimate, reference = float(estimate), float(reference)
+    if estimate == reference: return 15.0
+    if reference == 0: return float(min(15.0, -np.log10(abs(estimate))))
+    return nist_anova.lre(estimate, reference)
+
+
+def min_lre(pairs):
+    """벡터·행렬은 원소별이 아닌 노름 기준 LRE (0에 가까운 계수·상관의 상대오차가 과장되지 않도록)."""
+    est, ref = np.asarray(pairs[0], dtype=float).ravel(), np.asarray(pairs[1], dtype=float).ravel()
+    return lre(np.abs(ref).max() + np.abs(est - ref).max(), np.abs(ref).max())
+
+
+def make_frame(n, width, seed=0):
+    """공통 요인을 공유하는 연속형 열 x0..x{width-1}, 집단·범주 열, 0/1 결과 열로 이루어진 데이터."""
+    rng = np.random.default_rng(seed)
+    X = 0.6 * rng.standard_normal((n, 1)) + rng.standard_normal((n, width)) + 10.0
+    df = pd.DataFrame(X, columns=[f"x{i}" for i in range(width)])
+    df["g2"] = rng.choice(["A", "B"], n); df["g4"] = rng.choice(["P", "Q", "R", "S"], n)
+    df["x0"] += np.where(df["g4"] == "P", 0.2, 0.0) + np.where(df["g2"] == "A", 0.1, 0.0)
+    df["r5"] = rng.choice(list("abcde"), n); df["c4"] = rng.choice(list("wxyz"), n)
+    eta = 0.8 * (df["x0"] - 10) - 0.5 * (df["x1"] - 10)
+    df["bin"] = (rng.random(n) < special.expit(eta)).astype(int)
+    return df
+
+
+def _xs(width, limit=None):
+    return [f"x{i}" for i in range(width)][:limit]
+
+
+# ---- 정확도: 엔진 결과 vs 기준 구현 ---------------------------------------------------------------
+
+def acc_descriptive(df, width):
+    x = df["x0"].to_numpy(); m = streaming.Moments()
+    for part in np.array_split(x, 7): m.update(part)   # 청크 병합 경로
+    return min_lre(([m.mean, m.std, m.skew, m.kurt], [x.mean(), x.std(ddof=1), stats.skew(x, bias=False), stats.kurtosis(x, bias=False)]))
+
+
+def acc_frequencies(df, width):
+    table = frequency.frequencies(df, ["r5", "c4", "g4"])
+    ref = [df[v].value_counts()[c] for v, c in zip(table["Variable (변수명)"], table["Category (범주)"])]
+    return min_lre((table["Frequency (빈도)"].to_numpy(), ref))
+
+
+def acc_chi_square(df, width):
+    ct = contingency.crosstab(df["r5"], df["c4"])
+    return min_lre((ct.to_numpy(), pd.crosstab(df["r5"], df["c4"]).to_numpy()))
+
+
+def acc_ttest_ind(df, width):
+    gs = groupstats.group_stats(df["g2"], df["x0"]); a, b = (df["x0"][df["g2"] == lab] for lab in gs.labels)
+    est = [*groupstats.ttest_ind(gs, True), *groupstats.ttest_ind(gs, False), groupstats.levene(gs)[0]]
+    ref = [*stats.ttest_ind(a, b), *stats.ttest_ind(a, b, equal_var=False), stats.levene(a, b).statistic]
+    return min_lre((est, ref))
+
+
+def acc_anova(df, width):
+    gs = groupstats.group_stats(df["g4"], df["x0"]); fit = groupstats.oneway_anova(gs)
+    groups = [df["x0"][df["g4"] == lab] for lab in gs.labels]
+    return min_lre(([fit.F, fit.p, groupstats.levene(gs)[0]], [*stats.f_oneway(*groups), stats.levene(*groups).statistic]))
+
+
+def acc_correlation(df, width):
+    cols = _xs(width); X = df[cols].to_numpy()
+    pearson, spearman = correlation.corr(df[cols]), correlation.corr(df[cols], "spearman")
+    ref_s = stats.spearmanr(X).statistic if width > 2 else [[1, stats.spearmanr(X).statistic]]
+    return min(min_lre((pearson.r.to_numpy(), np.corrcoef(X, rowvar=False))), min_lre((spearman.r.to_numpy(), ref_s)))
+
+
+def acc_reliability(df, width):
+    cols = _xs(width); S = np.cov(df[cols].to_numpy(), rowvar=False)
+    ref = width / (width - 1) * (1 - np.trace(S) / S.sum())
+    return lre(reliability.analyze(df, cols, iterations=0).alpha, ref)
+
+
+def acc_linear(df, width):
+    xs = _xs(width)[1:]; X = np.column_stack([np.ones(len(df)), df[xs].to_numpy()]); y = df["x0"].to_numpy()
+    beta, *_ = np.linalg.lstsq(X, y, rcond=None); resid = y - X @ beta
+    bse = np.sqrt(np.diag(np.linalg.inv(X.T @ X)) * (resid @ resid) / (len(y) - X.shape[1]))
+    model = regression.ols(df, "x0", xs)
+    return min_lre(([*model.params, *model.bse], [*beta, *bse]))
+
+
+def acc_logistic(df, width):
+    xs = _xs(width, 10); X = np.column_stack([np.ones(len(df)), df[xs].to_numpy()]); y = df["bin"].to_numpy(float)
+    beta = np.zeros(X.shape[1])
+    for _ in range(50):   # 기준: 고정 횟수 Newton 반복 (수렴 판정 없음)
+        mu = special.expit(X @ beta); beta = beta + np.linalg.solve((X * (mu * (1 - mu))[:, None]).T @ X, X.T @ (y - mu))
+    return min_lre((logistic.fit(df, "bin", xs).params.to_numpy(), beta))
+
+
+def acc_batch(df, width):
+    table = batch.run(df, "anova", _xs(width), "g4").table
+    ref = [stats.f_oneway(*(df[c][df["g4"] == lab] for lab in ("P", "Q", "R", "S"))).statistic for c in _xs(width)]
+    return min_lre((table["F (F값)"].to_numpy(float), ref))
+
+
+# (이름, 기법, 위젯 값(width → params), 일괄 여부, 열 수에 따라 달라지는지, 정확도 함수)
+CASES = [
+    ("기술통계", "기술통계", lambda w: dict(v="x0"), False, False, acc_descriptive),
+    ("빈도분석", "빈도분석", lambda w: dict(vs=["r5", "c4", "g4"]), False, False, acc_frequencies),
+    ("카이제곱 검정", "카이제곱 검정", lambda w: dict(r="r5", c="c4", mc_iter=catalog.MC_ITERATIONS, mc_seed=catalog.MC_SEED), False, False, acc_chi_square),
+    ("단일표본 T-검정", "단일표본 T-검정", lambda w: dict(y="x0", ref_v=10.0), False, False, None),
+    ("독립표본 T-검정", "독립표본 T-검정", lambda w: dict(g="g2", y="x0"), False, False, acc_ttest_ind),
+    ("대응표본 T-검정", "대응표본 T-검정", lambda w: dict(y1="x0", y2="x1"), False, False, None),
+    ("분산분석(ANOVA)", "분산분석(ANOVA)", lambda w: dict(g="g4", y="x0"), False, False, acc_anova),
+    ("상관분석", "상관분석", lambda w: dict(sel_vs=_xs(w), corr_method="Pearson"), False, True, acc_correlation),
+    ("신뢰도 분석", "신뢰도 분석", lambda w: dict(sel_items=_xs(w)), False, True, acc_reliability),
+    ("선형 회귀분석", "회귀분석", lambda w: dict(rtype="선형 회귀분석 (Linear)", xs=_xs(w)[1:], y="x0"), False, True, acc_linear),
+    ("로지스틱 회귀분석", "회귀분석", lambda w: dict(rtype="로지스틱 회귀분석 (Logistic)", xs=_xs(w, 10), y="bin"), False, True, acc_logistic),
+    ("일괄 분산분석", "분산분석(ANOVA)", lambda w: dict(batch_key="anova", group="g4", outcomes=_xs(w), pre=[], post=[], correction="holm"), True, True, acc_batch),
+]
+
+
+def run_case(df, n, width, case, repeat):
+    name, method, params, batched, _, accuracy = case
+    analyses.load(method, batched)   # 모듈 import 시간은 bench_import에서 따로 잽니다.
+    runs = []
+    for rep in range(repeat):
+        # 반복마다 다른 data_key로 실행해 엔진 캐시(빈도 코드, 로지스틱 모형 등)를 재사용하지 않습니다.
+        src = analyses.Source(f"bench:{n}:{width}:{rep}:{time.perf_counter_ns()}", lambda cols: df)
+        with profiler.profile(name) as prof:
+            res = analyses.run(method, src, params(width), batched)
+            if res.plot_img is not None:
+                profiler.mark("plot")
+                res.plot_img.render(dpi=plots.PREVIEW_DPI + rep)   # 반복마다 해상도를 바꿔 렌더링 캐시를 피합니다.
+            profiler.mark("report")
+            report.create_pro_report(res.method, res.final_df, res.interp, "", None, "\n".join(res.assump_report), res.fit_tables)
+        runs.append(prof)
+    # 한 실행 안에서 같은 단계가 여러 번 나오면 합산한 뒤, 단계별로 반복 간 중앙값을 구합니다.
+    totals = [{} for _ in runs]; peak = 0
+    for total, prof in zip(totals, runs):
+        for stage, seconds, mem in prof.stages:
+            total[stage] = total.get(stage, 0.0) + seconds; peak = max(peak, mem or 0)
+    stages = [s for s in dict.fromkeys(s for t in totals for s in t) if s != "import"]
+    return {
+        "case": name, "n": n, "width": width, "seconds": statistics.median(p.seconds for p in runs),
+        "stages": {s: statistics.median(t.get(s, 0.0) for t in totals) for s in stages},
+        "peak_bytes": peak if profiler.TRACE_MEMORY else None,
+        "lre": None if accuracy is None else accuracy(df, width),
+    }
+
+
+def run_parse(df, n, width, repeat):
+    data = df.to_csv(index=False).encode(); times = []
+    for _ in range(repeat):
+        start = time.perf_counter(); ingest.parse_bytes("bench.csv", data); times.append(time.perf_counter() - start)
+    return {"case": "CSV 파싱", "n": n, "width": width, "seconds": statistics.median(times), "stages": {"parse": statistics.median(times)},
+            "peak_bytes": None, "lre": None, "bytes": len(data)}
+
+
+def numacc():
+    """NIST StRD NumAcc1–4: 인증 평균·표준편차가 구성에서 정확히 유도되는 단변량 기준 데이터."""
+    yield "NumAcc1", "lower", np.array([10000001.0, 10000003.0, 10000002.0]), 10000002.0, 1.0
+    for name, level, base in (("NumAcc2", "average", 1.2), ("NumAcc3", "average", 1000000.2), ("NumAcc4", "higher", 10000000.2)):
+        x = np.array([base] + [base - 0.1, base + 0.1] * 500)
+        yield name, level, x, base, 0.1
+
+
+def run_nist(data_dir, repeat):
+    rows = []
+    for ref in nist_anova.references(data_dir):
+        start = time.perf_counter()
+        for _ in range(repeat): scores = nist_anova.evaluate(ref)
+        rows.append({"case": f"NIST ANOVA {ref.name}", "n": len(ref.frame), "width": 1, "seconds": (time.perf_counter() - start) / repeat,
+                     "stages": {}, "peak_bytes": None, "lre": min(scores.values()), "min_lre": nist_anova.MIN_LRE[ref.difficulty]})
+    for name, level, x, mean, sd in numacc():
+        start = time.perf_counter(); m = streaming.Moments(); m.update(x); s = pd.Series(x)
+        score = min(lre(v, ref) for v, ref in ((m.mean, mean), (m.std, sd), (s.mean(), mean), (s.std(), sd)))
+        rows.append({"case": f"NIST 단변량 {name}", "n": len(x), "width": 1, "seconds": time.perf_counter() - start,
+                     "stages": {}, "peak_bytes": None, "lre": score, "min_lre": nist_anova.MIN_LRE[level]})
+    return rows
+
+
+def _ints(text):
+    return [int(float(v)) for v in text.split(",") if v]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="1000,10000,100000", help="사례 수 N 목록 (쉼표 구분)")
+    ap.add_argument("--widths", default="5,20", help="연속형 열 수 목록 (열 수에 따라 달라지는 기법만 반복)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--methods", help="실행할 항목 이름 (쉼표 구분, 기본: 전체)")
+    ap.add_argument("--nist-dir", help="NIST StRD ANOVA .dat 파일 폴더")
+    ap.add_argument("--json", help="결과를 저장할 JSON 파일")
+    ap.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    args = ap.parse_args()
+    only = set(args.methods.split(",")) if args.methods else None
+    baseline = {(r["case"], r["n"], r["width"]): r for r in json.load(open(args.baseline, encoding="utf-8"))} if args.baseline else {}
+    widths = _ints(args.widths); rows, failed = [], False
+
+    print(f"{'case':<22} {'N':>8} {'w':>3} {'median(ms)':>11} {'vs base':>8} {'LRE':>5}  stages(ms)")
+    def emit(row):
+        nonlocal failed
+        row.setdefault("min_lre", MIN_LRE); rows.append(row)
+        ok = row.get("error") is None and (row["lre"] is None or row["lre"] >= row["min_lre"]); failed |= not ok
+        base = baseline.get((row["case"], row["n"], row["width"]))
+        delta = f"{row['seconds'] / base['seconds'] - 1:+7.0%}" if base and base["seconds"] else f"{'-':>7}"
+        stages = " ".join(f"{s}={t * 1000:.1f}" for s, t in row["stages"].items())
+        if row["peak_bytes"]: stages += f" peak={row['peak_bytes'] / 2**20:.1f}MB"
+        lre_text = "-" if row["lre"] is None else f"{row['lre']:.1f}"
+        print(f"{row['case']:<22} {row['n']:>8} {row['width']:>3} {row['seconds'] * 1000:>11.2f} {delta:>8} {lre_text:>5}  "
+              f"{row.get('error') or stages}" + ("" if ok else "  <-- FAIL"), flush=True)
+
+    for n in _ints(args.sizes):
+        for width in widths:
+            df = make_frame(n, width)
+            if only is None or "CSV 파싱" in only: emit(run_parse(df, n, width, args.repeat))
+            for case in CASES:
+                if (only and case[0] not in only) or (not case[4] and width != widths[0]): continue
+                try: emit(run_case(df, n, width, case, args.repeat))
+                except Exception as e:
+                    emit({"case": case[0], "n": n, "width": width, "seconds": float("nan"), "stages": {}, "peak_bytes": None,
+                          "lre": None, "error": f"{type(e).__name__}: {e}"})
+    if only is None or "NIST" in only:
+        for row in run_nist(args.nist_dir, args.repeat): emit(row)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f: json.dump(rows, f, indent=2, ensure_ascii=False)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,36 +1,24 @@
+import os
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-from scipy import stats
-import statsmodels.api as sm
-from statsmodels.formula.api import ols
-from statsmodels.stats.anova import anova_lm
-from statsmodels.stats.multicomp import pairwise_tukeyhsd
-from statsmodels.stats.outliers_influence import variance_inflation_factor
-from statsmodels.stats.stattools import durbin_watson
-import io
-import matplotlib.pyplot as plt
-import seaborn as sns
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
+# [Performance] 첫 화면은 streamlit과 가벼운 모듈만으로 그립니다. pandas는 파일 업로드 후, scipy·matplotlib·
+# python-docx는 해당 기법을 처음 실행하거나 리포트를 만들 때 불러오며, 첫 화면 이후 백그라운드에서 미리 불러옵니다.
+from statera import analyses, cache, catalog, jobs, profiler, snapshot
 
 # -----------------------------------------------------------------------------
 # 1. UI 스타일링 및 테마 설정
 # -----------------------------------------------------------------------------
 st.set_page_config(page_title="STATERA", page_icon="🎓", layout="wide")
 
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['axes.unicode_minus'] = False
-sns.set_theme(style="whitegrid")
-
 ACRONYM_FULL = "STATistical Engine for Research & Analysis"
+# 원격 웹폰트 스타일시트 (빈 값이면 불러오지 않고 시스템 글꼴 사용)
+FONT_CSS = os.environ.get("STATERA_FONT_CSS", "https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css")
+FONT_IMPORT = f"@import url('{FONT_CSS}');" if FONT_CSS else ""
 
 st.markdown(f"""
 <style>
-    @import url('https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css');
-    * {{ font-family: 'Pretendard', sans-serif; }}
+    {FONT_IMPORT}
+    * {{ font-family: 'Pretendard', -apple-system, BlinkMacSystemFont, 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif; }}
     .main-header {{ color: #0d9488; text-align: center; font-size: 2.8rem; font-weight: 800; margin-bottom: 5px; }}
     .sub-header {{ text-align: center; color: #64748b; font-size: 1.1rem; margin-bottom: 40px; }}
     
@@ -65,10 +53,43 @@ st.markdown(f"""
 # -----------------------------------------------------------------------------
 # 2. 통계 멘토 가이드 데이터 및 유틸리티
 # -----------------------------------------------------------------------------
-def format_p(p): return "<.001" if p < .001 else f"{p:.3f}"
-def get_stars(p): return "***" if p < .001 else "**" if p < .01 else "*" if p < .05 else ""
-def get_plot_buffer():
-    buf = io.BytesIO(); plt.savefig(buf, format='png', bbox_inches='tight', dpi=300); buf.seek(0); plt.close(); return buf
+JOB_STATE = "_statera_job"  # 세션의 마지막 분석 작업 (결과 키, Job)
+
+def release_data(data_key=None):
+    """세션이 보던 데이터(data_key와 다르면)의 작업을 취소하고, 다른 세션이 보지 않으면 관련 캐시 항목을 지웁니다."""
+    job_key, job = st.session_state.get(JOB_STATE, (None, None))
+    if job_key is not None and job_key[0] != data_key:
+        if not job.done: job.cancel()
+        del st.session_state[JOB_STATE]
+    if data_key is None: cache.release(st.session_state)
+    else: cache.hold(st.session_state, data_key)
+
+@st.fragment(run_every=0.5)
+def show_job_progress(job):
+    """실행 중인 작업의 진행률과 취소 버튼만 주기적으로 갱신하고, 끝나면 전체 화면을 다시 그립니다."""
+    if job.done: st.rerun()
+    pos = job.position
+    text = f"⏳ 대기 중 (대기 순번 {pos}, 동시 실행 상한 {jobs.MAX_JOBS}개)" if pos else f"⚙️ {job.message} · {job.elapsed:.1f}초 경과"
+    st.progress(job.progress, text=text)
+    if st.button("⏹ 분석 취소", key=f"cancel_{job.id}"): job.cancel(); st.rerun()
+
+def show_debug_panel():
+    """이 세션의 마지막 분석 작업과 서버의 최근 계측 기록(파싱·분석·그림·리포트)을 단계별로 표시합니다."""
+    st.markdown('<div class="section-title"><span class="step-badge">DEBUG</span> 성능 계측 (단계별 시간 · 최대 메모리)</div>', unsafe_allow_html=True)
+    _, job = st.session_state.get(JOB_STATE, (None, None))
+    if job is not None and job.done and job.profile is not None:
+        st.caption(f"마지막 분석 작업: {job.label} · 대기 {job.profile.meta['queued_seconds']:.3f}초 · 실행 {job.profile.seconds:.3f}초 · {job.status}")
+        st.dataframe(job.profile.rows(), use_container_width=True, hide_index=True)
+    records = profiler.recent()[::-1]
+    if records:
+        st.caption(f"서버 최근 계측 기록 {len(records)}건 (최신순)")
+        st.dataframe([{"Record (기록)": r["label"], "Total ms (전체)": round((r["seconds"] or 0) * 1000, 2),
+                       "Stages (단계)": ", ".join(f"{x['stage']} {x['seconds'] * 1000:.1f}ms" for x in r["stages"]),
+                       "Peak MB (최대 메모리)": round(max((x["peak_bytes"] or 0 for x in r["stages"]), default=0) / 2**20, 2) if profiler.TRACE_MEMORY else None,
+                       "Error (오류)": r["error"] or ""} for r in records], use_container_width=True, hide_index=True)
+        st.download_button("📥 계측 로그 다운로드 (JSON Lines)", data=profiler.export_jsonl, file_name="statera_perf.jsonl",
+                           mime="application/x-ndjson", on_click="ignore")
+    if not profiler.TRACE_MEMORY: st.caption("최대 메모리는 서버를 STATERA_TRACE_MEMORY=1로 시작하면 tracemalloc으로 측정됩니다.")
 
 STAT_MENTOR = {
     "기술통계": {"purpose": "데이터의 중심 경향성과 분포 특성을 요약합니다.", "indicator": "평균은 자료의 수준을, 표준편차는 산포 정도를 나타냅니다.", "check": "왜도와 첨도를 통해 정규분포 가정을 검토하십시오."},
@@ -83,24 +104,6 @@ STAT_MENTOR = {
     "회귀분석": {"purpose": "독립변수가 종속변수에 미치는 영향력을 수치화합니다.", "indicator": "R2로 모형 설명력을, Beta로 영향력의 크기를 평가합니다.", "check": "다중공선성(VIF < 10)과 잔차 가정을 검토하십시오."}
 }
 
-def create_pro_report(m_name, r_df, interpretation, guide, plot_b=None, assump=""):
-    doc = Document(); doc.styles['Normal'].font.name = 'Malgun Gothic'
-    doc.styles['Normal']._element.rPr.rFonts.set(qn('w:eastAsia'), 'Malgun Gothic')
-    doc.add_heading(f'STATERA Report: {m_name}', 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
-    if assump: 
-        doc.add_heading('1. Assumption Checks', level=1)
-        clean_assump = assump.replace('<div class="assumption-pass">', '').replace('<div class="assumption-fail">', '').replace('</div>', '')
-        doc.add_paragraph(clean_assump).italic = True
-    doc.add_heading('2. Statistical Results', level=1)
-    t = doc.add_table(r_df.shape[0]+1, r_df.shape[1]); t.style = 'Table Grid'
-    for j, c in enumerate(r_df.columns): t.cell(0,j).text = str(c)
-    for i in range(r_df.shape[0]):
-        for j in range(r_df.shape[1]): t.cell(i+1,j).text = str(r_df.values[i,j])
-    if plot_b: doc.add_heading('3. Visualization', level=1); doc.add_picture(plot_b, width=Inches(4.5))
-    doc.add_heading('4. AI Interpretation', level=1); doc.add_paragraph(interpretation)
-    doc.add_heading('5. Thesis Writing Guide', level=1); doc.add_paragraph(guide)
-    bio = io.BytesIO(); doc.save(bio); bio.seek(0); return bio
-
 # -----------------------------------------------------------------------------
 # 3. 사이드바
 # -----------------------------------------------------------------------------
@@ -111,6 +114,13 @@ with st.sidebar:
     st.markdown("### 🚧 Research Beta Version")
     st.info("본 서비스는 연구 데이터 분석의 진입 장벽을 낮추기 위해 개발된 웹 기반 통계 솔루션입니다. 현재 분석 알고리즘의 타당도 검증 절차를 진행 중입니다.")
     st.markdown("---")
+    st.markdown("### ⚙️ 분석 옵션")
+    snapshot_mode = st.toggle("💾 대용량 모드 (열 단위 스냅샷)", disabled=not snapshot.AVAILABLE,
+                              help="업로드 파일을 세션 전용 임시 Arrow 파일로 변환한 뒤, 분석에 필요한 열만 읽어 서버 메모리 사용을 줄입니다.")
+    stream_mode = st.toggle("🌊 스트리밍 모드 (CSV 청크 처리)",
+                            help="CSV 전체를 메모리에 올리지 않고 청크 단위로 읽어 기술통계·빈도분석·상관분석·신뢰도 분석을 수행합니다.")
+    debug_mode = st.toggle("🛠️ 성능 디버그 패널", help="파싱 · 분석 · 가정 검정 · 그림 · 리포트 단계별 실행 시간과 최대 메모리를 화면 하단에 표시합니다.")
+    st.markdown("---")
     st.markdown("### 📬 Contact & Feedback")
     st.write("오류 제보 및 기능 제안은 언제나 환영합니다.")
     st.link_button("📧 메일 보내기", "mailto:nncj91@snu.ac.kr")
@@ -129,7 +139,7 @@ st.markdown(f"""
 <div class="guide-container">
     <div class="guide-box">
         <div class="guide-label">🔒 데이터 보안 안내</div>
-        <div class="guide-text">업로드된 데이터는 분석 즉시 메모리에서 삭제되며 서버에 저장되지 않아 보안이 철저히 유지됩니다.</div>
+        <div class="guide-text">업로드된 데이터는 서버 디스크에 저장되지 않습니다. 반복 분석을 빠르게 하기 위해 파싱된 데이터와 분석 결과를 서버 메모리에 임시로 보관하며, 파일을 해제하거나 다른 파일을 업로드하거나 세션이 종료되면 즉시 삭제합니다(같은 파일을 보고 있는 다른 세션이 없을 때). 화면용 그림과 리포트 파일은 용량 한도를 넘으면 오래된 것부터 자동으로 삭제됩니다.{" (대용량 모드의 임시 스냅샷은 세션 전용 폴더에만 기록되며, 파일 해제 또는 세션 종료 시 즉시 삭제됩니다.)" if snapshot_mode else ""}</div>
     </div>
     <div class="guide-box">
         <div class="guide-label">📄 데이터 형식 가이드</div>
@@ -140,21 +150,48 @@ st.markdown(f"""
 
 up_file = st.file_uploader("파일을 업로드하여 분석을 시작하십시오.", type=["xlsx", "csv"], label_visibility="collapsed")
 
+streamed = bool(up_file) and stream_mode and up_file.name.endswith('csv')
+if not (up_file and snapshot_mode) or streamed:
+    snapshot.release(st.session_state)
+if not up_file:
+    release_data()
+
 if up_file:
-    df = pd.read_excel(up_file) if up_file.name.endswith('xlsx') else pd.read_csv(up_file)
-    num_cols = df.select_dtypes(include=[np.number]).columns
-    all_cols = df.columns
-    st.success(f"데이터 로드 완료: 분석 대상 사례 수 N={len(df)}")
+    from statera import ingest, results, streaming
+    data_key = ingest.upload_key(up_file)
+    release_data(data_key)
+    snap = None
+    if snapshot_mode and not streamed:
+        try: snap = snapshot.for_session(st.session_state, up_file)
+        except (ValueError, TypeError): st.warning("Arrow 형식으로 변환할 수 없는 열이 있어 일반 모드로 분석합니다.")
+
+    # [Performance] 스트리밍 모드는 데이터프레임을 만들지 않고 분석마다 CSV를 청크 단위로 다시 읽으며,
+    # 대용량 모드는 분석에 필요한 열만 스냅샷에서 memory-map으로 읽고,
+    # 일반 모드는 업로드 내용 해시 기준으로 캐시된 데이터프레임을 재사용합니다.
+    if streamed:
+        meta, load_cols = streaming.scan_upload(up_file), None
+    elif snap is not None:
+        meta, load_cols = snap.meta, snap.read
+    else:
+        dataset = ingest.load_upload(up_file)
+        meta, load_cols = dataset.meta, (lambda cols, frame=dataset.frame: frame)
+    num_cols = list(meta.num_cols)
+    all_cols = list(meta.all_cols)
+    st.success(f"데이터 로드 완료: 분석 대상 사례 수 N={meta.n_rows}")
 
     # Step 01: 분석 기법 선택
     st.markdown('<div class="section-title"><span class="step-badge">01</span> 연구 목적에 따른 분석 기법 선택</div>', unsafe_allow_html=True)
     
-    group = st.selectbox("분석 범주를 선택하십시오.", [
+    groups = [
         "기초 데이터 분석 (Descriptive/Frequency)", 
         "집단 간 차이 검정 (T-test/ANOVA)", 
         "관계 및 영향력 분석 (Chi2/Corr/Regression)",
         "척도 신뢰도 분석 (Reliability)"
-    ])
+    ]
+    if streamed:
+        st.info("🌊 스트리밍 모드에서는 기술통계 · 빈도분석 · 상관분석 · 신뢰도 분석 · 선형 회귀분석을 지원합니다.")
+        groups = [gr for gr in groups if "차이" not in gr]
+    group = st.selectbox("분석 범주를 선택하십시오.", groups)
     
     if "기초" in group: 
         m_list = ["기술통계", "빈도분석"]
@@ -164,6 +201,8 @@ if up_file:
         m_list = ["카이제곱 검정", "상관분석", "회귀분석"]
     else: 
         m_list = ["신뢰도 분석"]
+    if streamed:
+        m_list = [m for m in m_list if m in catalog.STREAM_METHODS]
     
     method = st.radio("상세 분석 기법 선택", m_list, horizontal=True)
     
@@ -186,328 +225,118 @@ if up_file:
     anova_model_info = None  # ANOVA 요약 정보 저장을 위한 변수
     reg_anova_df = None # 회귀분석용 ANOVA 테이블
     extra_metric = None # 추가 메트릭 (자기상관계수 등)
-
-    # 기법별 상세 로직 구현
-    if method == "기술통계":
-        v = st.selectbox("분석할 변수 (연속형)", num_cols)
-        if st.button("통계 분석 실행"):
-            # 기본 기술통계량 계산
-            desc = df[[v]].describe().T.reset_index()
-            
-            # [Standardization] 컬럼명 한글 병기
-            final_df = desc.rename(columns={
-                'index': 'Variable (변수명)',
-                'count': 'N (사례수)',
-                'mean': 'Mean (평균)',
-                'std': 'SD (표준편차)',
-                'min': 'Min (최소)',
-                '25%': 'Q1 (25%)',
-                '50%': 'Median (중앙값)',
-                '75%': 'Q3 (75%)',
-                'max': 'Max (최대)'
-            }).round(4)
-            
-            # [NIST 검증용] 자기상관계수 (Autocorrelation Lag 1)
-            autocorr_val = df[v].autocorr(lag=1)
-            # 옵션 A: 결과표에는 넣지 않고, 별도 메트릭으로 하단 표시
-            extra_metric = {"label": "Autocorrelation Lag 1 (자기상관계수)", "value": f"{autocorr_val:.3f}"}
-
-            skew = df[v].skew(); kurt = df[v].kurt()
-            if abs(skew) < 3 and abs(kurt) < 10:
-                assump_report.append(f'<div class="assumption-pass">✅ 정규성 가정 충족: 왜도({skew:.2f})와 첨도({kurt:.2f})가 기준 이내입니다.</div>')
-            else:
-                assump_report.append(f'<div class="assumption-fail">⚠️ 정규성 가정 위배: 왜도/첨도 기준 초과. (데이터 변환 또는 비모수적 기술통계 고려 권장)</div>')
-            plt.figure(figsize=(6,3)); sns.histplot(df[v].dropna(), kde=True, color="#0d9488"); plot_img = get_plot_buffer()
-            interp = f"📌 {v}의 평균은 {df[v].mean():.2f}(SD={df[v].std():.2f})입니다."
+    fit_tables = [] # 보조 결과표 (제목, DataFrame): 로지스틱 추정 과정, 사후검정, 상관 유의확률 등
+    notices = [] # 안내 메시지
+
+    # [Performance] 일괄 분석: 여러 결과변수를 열 단위 벡터 연산으로 한 번에 분석하고 다중비교 보정 (스트리밍 모드 제외)
+    batch_key = {label: key for key, label in catalog.BATCH_METHODS.items()}.get(method)
+    batch_mode = batch_key is not None and not streamed and st.toggle("📚 일괄 분석 (여러 결과변수 한 번에)",
+                                                                     help="선택한 모든 결과변수에 같은 분석을 적용하고 다중비교 보정된 하나의 결과표와 리포트를 만듭니다.")
+
+    # 기법별 변수·옵션 선택 (계산은 statera.analyses에서 수행)
+    if batch_mode:
+        b_group, b_outcomes, b_pre, b_post = None, [], [], []
+        if batch_key in ("ttest_ind", "anova"):
+            b_group = st.selectbox("집단 변수 (범주형)", all_cols)
+        if batch_key == "ttest_rel":
+            b_pre = st.multiselect("사전 변수들 (연속형)", num_cols)
+            b_post = st.multiselect("사후 변수들 (연속형, 사전 변수와 같은 순서)", num_cols)
+        else:
+            b_candidates = [c for c in num_cols if c != b_group]
+            b_all = st.checkbox(f"연속형 변수 전체 선택 ({len(b_candidates)}개)")
+            b_outcomes = b_candidates if b_all else st.multiselect("결과변수들 (연속형)", b_candidates)
+        b_corr = "holm"
+        if batch_key != "describe":
+            b_corr = st.selectbox("다중비교 보정", list(catalog.CORRECTIONS), format_func=catalog.CORRECTIONS.get)
+        params = dict(batch_key=batch_key, group=b_group, outcomes=b_outcomes, pre=b_pre, post=b_post, correction=b_corr)
+        ready = bool(b_outcomes or b_pre or b_post)
+
+    elif method == "기술통계":
+        params, ready = dict(v=st.selectbox("분석할 변수 (연속형)", num_cols)), True
 
     elif method == "빈도분석":
         vs = st.multiselect("분석할 변수들 (범주형)", all_cols)
-        if st.button("통계 분석 실행") and vs:
-            res = []
-            for c in vs:
-                counts = df[c].value_counts().reset_index(); counts.columns = ['Category (범주)', 'Frequency (빈도)']
-                counts['Percent (비율)'] = (counts['Frequency (빈도)'] / counts['Frequency (빈도)'].sum() * 100).round(1)
-                counts.insert(0, 'Variable (변수명)', c); res.append(counts)
-            final_df = pd.concat(res)
-            assump_report.append('<div class="assumption-pass">✅ 가정 검정 해당 없음: 빈도분석은 비모수적 방법으로 별도의 가정이 필요하지 않습니다.</div>')
-            interp = "대상자의 일반적 분포를 확인하십시오."
+        params, ready = dict(vs=vs), bool(vs)
 
     elif method == "카이제곱 검정":
         r = st.selectbox("행 변수 (범주형)", all_cols)
         c = st.selectbox("열 변수 (범주형)", all_cols)
-        if st.button("통계 분석 실행"):
-            ct = pd.crosstab(df[r], df[c]); chi2, p, _, exp = stats.chi2_contingency(ct)
-            under_5_pct = (exp < 5).sum() / exp.size * 100
-            if under_5_pct <= 20:
-                assump_report.append(f'<div class="assumption-pass">✅ 기대빈도 가정 충족: 기대빈도 5 미만 셀이 {under_5_pct:.1f}%(20% 이하)입니다.</div>')
-            else:
-                assump_report.append(f'<div class="assumption-fail">⚠️ 기대빈도 가정 위배: 20% 초과. (대안으로 Fisher의 정확 검정(Fisher\'s Exact Test) 사용 권장)</div>')
-            
-            # 카이제곱은 결과표 자체가 교차표(Cross-tab)이므로 컬럼명 변경이 애매함. 요약정보 제공.
-            final_df = ct.astype(str) + " (" + (ct/ct.sum()*100).round(1).astype(str) + "%)"
-            p_val = p; interp = f"📌 {r}와 {c} 간 연관성 유의확률: p={format_p(p)}"
+        with st.expander("⚙️ 정확 검정 설정 (기대빈도 가정 위배 시 사용)"):
+            mc_iter = int(st.number_input("Monte-Carlo 반복 수", min_value=1000, max_value=1_000_000, value=catalog.MC_ITERATIONS, step=1000))
+            mc_seed = int(st.number_input("난수 시드", min_value=0, value=catalog.MC_SEED, step=1))
+        params, ready = dict(r=r, c=c, mc_iter=mc_iter, mc_seed=mc_seed), True
 
     elif method == "단일표본 T-검정":
         y = st.selectbox("검정 변수 (연속형)", num_cols)
         ref_v = st.number_input("비교할 기준값 (Test Value)", value=0.0)
-        if st.button("통계 분석 실행"):
-            data = df[y].dropna(); _, sp = stats.shapiro(data)
-            if sp > 0.05:
-                assump_report.append(f'<div class="assumption-pass">✅ 정규성 가정 충족: Shapiro-Wilk 검정(p={sp:.3f} > .05) 결과 정규분포를 따릅니다.</div>')
-            else:
-                assump_report.append(f'<div class="assumption-fail">⚠️ 정규성 가정 위배: p={sp:.3f} < .05. (대안으로 비모수 검정인 Wilcoxon Signed-Rank Test 사용 권장)</div>')
-            stat, p = stats.ttest_1samp(data, ref_v); p_val = p
-            
-            # [Standardization] 컬럼명 한글 병기
-            final_df = pd.DataFrame({
-                "Method (분석방법)": [method], 
-                "t Statistic (t값)": [stat], 
-                "df (자유도)": [len(data)-1], 
-                "p-value (유의확률)": [format_p(p)]
-            })
-            interp = f"📌 평균과 기준값 간의 차이는 {'유의합니다' if p < 0.05 else '유의하지 않습니다'}."
+        params, ready = dict(y=y, ref_v=ref_v), True
 
     elif method == "독립표본 T-검정":
         g = st.selectbox("집단 변수 (범주형: 2집단)", all_cols)
         y = st.selectbox("검정 변수 (연속형)", num_cols)
-        if st.button("통계 분석 실행"):
-            if len(df[g].unique()) != 2:
-                st.error("집단 변수는 정확히 2개의 범주를 가져야 합니다.")
-            else:
-                gps = df[g].unique(); g1, g2 = df[df[g]==gps[0]][y].dropna(), df[df[g]==gps[1]][y].dropna()
-                
-                _, sp1 = stats.shapiro(g1); _, sp2 = stats.shapiro(g2)
-                if sp1 > 0.05 and sp2 > 0.05:
-                      assump_report.append(f'<div class="assumption-pass">✅ 정규성 가정 충족: 두 집단 모두 정규분포를 따릅니다.</div>')
-                else:
-                      assump_report.append(f'<div class="assumption-fail">⚠️ 정규성 가정 위배: 한 집단 이상이 정규성을 만족하지 않습니다. (대안으로 Mann-Whitney U Test 사용 권장)</div>')
-
-                _, lp = stats.levene(g1, g2)
-                if lp > 0.05:
-                    assump_report.append(f'<div class="assumption-pass">✅ 등분산성 가정 충족: Levene 검정(p={lp:.3f} > .05) 결과 분산이 동일합니다.</div>')
-                    stat, p = stats.ttest_ind(g1, g2, equal_var=True)
-                else:
-                    assump_report.append(f'<div class="assumption-fail">⚠️ 등분산성 가정 위배: p={lp:.3f} < .05. (자동으로 Welch\'s T-test를 적용하여 분석을 수행했습니다)</div>')
-                    stat, p = stats.ttest_ind(g1, g2, equal_var=False)
-
-                p_val = p
-                # [Standardization] 컬럼명 한글 병기
-                final_df = pd.DataFrame({
-                    "Group (집단)": [gps[0], gps[1]], 
-                    "N (사례수)": [len(g1), len(g2)], 
-                    "Mean (평균)": [g1.mean(), g2.mean()], 
-                    "SD (표준편차)": [g1.std(), g2.std()]
-                })
-                plt.figure(figsize=(5,4)); sns.boxplot(x=g, y=y, data=df); plot_img = get_plot_buffer()
-                interp = f"📌 두 집단 간 {y}의 평균 차이는 t={stat:.3f}, p={format_p(p)}로 통계적으로 {'유의합니다' if p < 0.05 else '유의하지 않습니다'}."
+        params, ready = dict(g=g, y=y), True
 
     elif method == "대응표본 T-검정":
         y1 = st.selectbox("사전 변수 (연속형)", num_cols)
         y2 = st.selectbox("사후 변수 (연속형)", num_cols)
-        if st.button("통계 분석 실행"):
-            diff = df[y2] - df[y1]; _, sp = stats.shapiro(diff.dropna())
-            if sp > 0.05:
-                assump_report.append(f'<div class="assumption-pass">✅ 차이의 정규성 충족: Shapiro-Wilk 검정(p={sp:.3f} > .05)을 만족합니다.</div>')
-            else:
-                assump_report.append(f'<div class="assumption-fail">⚠️ 차이의 정규성 위배: p={sp:.3f} < .05. (대안으로 비모수 검정인 Wilcoxon Signed-Rank Test 사용 권장)</div>')
-            
-            stat, p = stats.ttest_rel(df[y1].dropna(), df[y2].dropna()); p_val = p
-            
-            # [Standardization] 컬럼명 한글 병기
-            final_df = pd.DataFrame({
-                "Variable (변수)": [y1, y2], 
-                "Mean (평균)": [df[y1].mean(), df[y2].mean()], 
-                "t Statistic (t값)": [f"{stat:.3f}", ""], 
-                "p-value (유의확률)": [format_p(p), ""]
-            })
-            interp = f"📌 사전 대비 사후의 수치 변화는 {'유의합니다' if p < 0.05 else '유의하지 않습니다'}."
+        params, ready = dict(y1=y1, y2=y2), True
 
     elif method == "분산분석(ANOVA)":
         g = st.selectbox("집단 변수 (범주형: 3집단 이상)", all_cols)
         y = st.selectbox("검정 변수 (연속형)", num_cols)
-        
-        if st.button("통계 분석 실행"):
-            # [Expert Patch] NIST 고정밀 검증 (Centering)
-            y_centered = f"_{y}_centered"
-            df[y_centered] = df[y] - df[y].iloc[0]
-
-            model = ols(f'{y_centered} ~ C({g})', data=df).fit()
-            
-            resid = model.resid; _, sp = stats.shapiro(resid)
-            
-            if sp > 0.05:
-                assump_report.append(f'<div class="assumption-pass">✅ 잔차 정규성 충족: Shapiro-Wilk p={sp:.3f}</div>')
-            else:
-                assump_report.append(f'<div class="assumption-fail">⚠️ 잔차 정규성 위배: p={format_p(sp)}. (NIST 등 인공 데이터가 아니라면 Kruskal-Wallis 권장)</div>')
-            
-            grps = [df[df[g] == k][y].dropna() for k in df[g].unique()]
-            _, lp = stats.levene(*grps)
-            if lp > 0.05:
-                assump_report.append(f'<div class="assumption-pass">✅ 등분산성 충족: Levene p={lp:.3f}</div>')
-            else:
-                assump_report.append(f'<div class="assumption-fail">⚠️ 등분산성 위배: p={lp:.3f}. (대안으로 Welch ANOVA 사용 권장)</div>')
-
-            res = anova_lm(model, typ=2)
-            if 'mean_sq' not in res.columns:
-                res['mean_sq'] = res['sum_sq'] / res['df']
-            
-            p_val = res.iloc[0, 3] # p값 추출
-            
-            final_df = res.reset_index()
-            # [Standardization] 컬럼명 한글 병기
-            final_df = final_df.rename(columns={
-                'index': 'Source (변동원)',
-                'sum_sq': 'Sum of Squares (제곱합)',
-                'df': 'df (자유도)',
-                'mean_sq': 'Mean Square (평균제곱)',
-                'F': 'F Statistic (F값)',
-                'PR(>F)': 'Significance (유의확률)'
-            })
-            
-            final_df['Source (변동원)'] = final_df['Source (변동원)'].replace({
-                f'C({g})': f'{g} (집단 간)', 
-                'Residual': 'Residual (잔차)'
-            })
-
-            final_df = final_df[['Source (변동원)', 'Sum of Squares (제곱합)', 'df (자유도)', 'Mean Square (평균제곱)', 'F Statistic (F값)', 'Significance (유의확률)']]
-            final_df = final_df.round(3)
-            final_df = final_df.fillna("") 
-
-            r2 = model.rsquared
-            rmse = np.sqrt(model.mse_resid)
-            anova_model_info = f"- **설명력 (R²):** {r2:.3f} (전체 변동의 {r2*100:.1f}% 설명)\n- **잔차 표준편차 (Root MSE):** {rmse:.3f}"
-
-            if p_val < 0.05:
-                tukey = pairwise_tukeyhsd(df[y].dropna(), df[g].dropna())
-                st.info("💡 사후검정(Tukey HSD) 결과가 하단에 출력됩니다.")
-                st.text(str(tukey))
-            
-            interp = f"📌 집단 간 차이 유의성 p={format_p(p_val)}"
+        params, ready = dict(g=g, y=y), True
 
     elif method == "상관분석":
         sel_vs = st.multiselect("분석할 변수군 선택 (연속형)", num_cols)
-        if st.button("통계 분석 실행") and len(sel_vs) >= 2:
-            final_df = df[sel_vs].corr().round(3)
-            
-            if len(sel_vs) == 2:
-                plt.figure(figsize=(6, 5))
-                sns.regplot(x=df[sel_vs[0]], y=df[sel_vs[1]], line_kws={"color": "red"})
-                plot_img = get_plot_buffer()
-                assump_report.append('<div class="assumption-pass">✅ 시각적 검토 준비 완료: 하단에 생성된 <b>산점도(Scatter Plot)와 회귀선</b>을 통해 두 변수가 직선 형태의 패턴을 보이는지 시각적으로 판단하십시오.</div>')
-            else:
-                plt.figure(figsize=(7, 5))
-                sns.heatmap(final_df, annot=True, cmap="coolwarm")
-                plot_img = get_plot_buffer()
-                assump_report.append('<div class="assumption-pass">ℹ️ 다변량 분석 안내: 전체적인 패턴 파악을 위해 히트맵을 제공합니다. 정밀한 선형성 검토가 필요한 경우, 변수를 2개씩 선택하여 산점도를 확인하십시오.</div>')
-
-            interp = "변수 간 선형적 상관계수 행렬입니다. 0.7 이상이면 강한 상관관계입니다."
+        # 스트리밍 모드는 순위 계산에 전체 데이터가 필요한 Spearman을 지원하지 않습니다.
+        corr_method = "Pearson" if streamed else st.radio("상관계수 종류", ["Pearson", "Spearman"], horizontal=True)
+        params, ready = dict(sel_vs=sel_vs, corr_method=corr_method), len(sel_vs) >= 2
 
     elif method == "신뢰도 분석":
         sel_items = st.multiselect("신뢰도 분석할 문항군 선택 (연속형)", num_cols)
-        if st.button("통계 분석 실행") and len(sel_items) >= 2:
-            items = df[sel_items].dropna(); k = items.shape[1]
-            alpha = (k/(k-1)) * (1 - (items.var(ddof=1).sum() / items.sum(axis=1).var(ddof=1)))
-            
-            if alpha >= 0.7:
-                assump_report.append(f'<div class="assumption-pass">✅ 신뢰도 양호: Cronbach Alpha {alpha:.3f} (기준 0.7 이상)</div>')
-            else:
-                assump_report.append(f'<div class="assumption-fail">⚠️ 신뢰도 낮음: Cronbach Alpha {alpha:.3f} (기준 0.7 미만). 문항 제거 또는 수정 필요.</div>')
-            
-            # [Standardization] 컬럼명 한글 병기
-            final_df = pd.DataFrame({"Measure (측정지표)": ["Cronbach α"], "Value (수치)": [f"{alpha:.3f}"]})
-            interp = f"📌 신뢰도 계수는 {alpha:.3f}로 확인되었습니다."
+        params, ready = dict(sel_items=sel_items), len(sel_items) >= 2
 
     elif method == "회귀분석":
         rtype = st.radio("회귀 유형", ["선형 회귀분석 (Linear)", "로지스틱 회귀분석 (Logistic)"])
         xs = st.multiselect("독립변수군 (연속형/더미)", num_cols)
         y = st.selectbox("종속변수 (Linear:연속형 / Logistic:0,1범주형)", num_cols)
-        
-        if st.button("통계 분석 실행") and xs:
-            if "선형" in rtype:
-                X = sm.add_constant(df[xs]); model = sm.OLS(df[y], X).fit(); p_val = model.f_pvalue
-                vifs = [variance_inflation_factor(X.values, i) for i in range(X.shape[1])]
-                max_vif = max(vifs[1:]) if len(vifs) > 1 else 1.0
-                if max_vif < 10:
-                    assump_report.append(f'<div class="assumption-pass">✅ 다중공선성 없음: 최대 VIF {max_vif:.2f} (기준 10 미만)</div>')
-                else:
-                    assump_report.append(f'<div class="assumption-fail">⚠️ 다중공선성 경고: 최대 VIF {max_vif:.2f} (변수 제거 또는 차원 축소 고려 권장)</div>')
-                dw = durbin_watson(model.resid)
-                if 1.5 < dw < 2.5:
-                      assump_report.append(f'<div class="assumption-pass">✅ 잔차 독립성 충족: Durbin-Watson {dw:.2f} (2에 근접)</div>')
-                else:
-                      assump_report.append(f'<div class="assumption-fail">⚠️ 잔차 독립성 주의: Durbin-Watson {dw:.2f} (시계열 분석 등 고려 필요)</div>')
-                
-                # [Standardization] 회귀분석용 ANOVA 테이블 (영문+한글 병기)
-                anova_data = {
-                    "Source (변동원)": ["Regression (회귀)", "Residual (잔차)", "Total (합계)"],
-                    "df (자유도)": [model.df_model, model.df_resid, model.df_model + model.df_resid],
-                    "Sum of Squares (제곱합)": [model.ess, model.ssr, model.ess + model.ssr],
-                    "Mean Square (평균제곱)": [model.mse_model, model.mse_resid, ""],
-                    "F Statistic (F값)": [model.fvalue, "", ""],
-                    "Significance (유의확률)": [format_p(model.f_pvalue), "", ""]
-                }
-                reg_anova_df = pd.DataFrame(anova_data)
-
-                # [Standardization] 회귀계수 결과 테이블 (컬럼명 영문+한글)
-                final_df = pd.DataFrame({
-                    "Variable (변수명)": ["const"] + list(xs),
-                    "Coef (비표준화 계수)": model.params,
-                    "SE (표준오차)": model.bse,
-                    "t (t값)": model.tvalues,
-                    "p (유의확률)": model.pvalues
-                }).round(3)
-                final_df = final_df.reset_index(drop=True)
-                final_df['p (유의확률)'] = final_df['p (유의확률)'].apply(lambda x: "<.001" if x < 0.001 else f"{x:.3f}")
-                
-                sig_vars = []
-                for var in xs:
-                    if var in model.pvalues and model.pvalues[var] < 0.05:
-                        coef = model.params[var]
-                        effect = "정(+)의 영향" if coef > 0 else "부(-)의 영향"
-                        sig_vars.append(f"<b>{var}</b>({effect})")
-                
-                var_msg = ("또한, " + ", ".join(sig_vars) + "을 미치는 것으로 나타났습니다.") if sig_vars else "유의한 독립변수는 발견되지 않았습니다."
-                
-                r2 = model.rsquared
-                adj_r2 = model.rsquared_adj
-                sig_text = "유의합니다" if p_val < 0.05 else "유의하지 않습니다"
-                
-                interp = (
-                    f"📌 모델의 설명력(R²)은 {r2:.3f}, 수정된 설명력(Adj R²)은 {adj_r2:.3f}입니다. "
-                    f"통계적으로 이 모형은 {sig_text}(p={format_p(p_val)}). {var_msg}"
-                )
-
-            else: # 로지스틱
-                X = sm.add_constant(df[xs]); model = sm.Logit(df[y], X).fit(disp=False); p_val = model.llr_pvalue
-                
-                params = model.params
-                conf = model.conf_int()
-                conf.columns = ['Lower CI', 'Upper CI']
-                
-                # [Standardization] 로지스틱 결과표 컬럼명
-                final_df = pd.DataFrame({
-                    "Coef (비표준화 계수)": params,
-                    "SE (표준오차)": model.bse,
-                    "OR (오즈비)": np.exp(params),
-                    "95% CI Lower": np.exp(conf['Lower CI']),
-                    "95% CI Upper": np.exp(conf['Upper CI']),
-                    "p (유의확률)": model.pvalues
-                }).round(3)
-                final_df = final_df.reset_index().rename(columns={'index': 'Variable (변수명)'})
-                final_df['p (유의확률)'] = final_df['p (유의확률)'].apply(lambda x: "<.001" if x < 0.001 else f"{x:.3f}")
-                
-                sig_vars = []
-                for var in xs:
-                    if var in model.pvalues and model.pvalues[var] < 0.05:
-                        or_val = np.exp(model.params[var])
-                        effect = "증가" if or_val > 1 else "감소"
-                        sig_vars.append(f"<b>{var}</b>(OR={or_val:.2f}, 확률 {effect})")
-                
-                var_msg = ("또한, " + ", ".join(sig_vars) + " 시키는 경향이 유의했습니다.") if sig_vars else "유의한 독립변수는 발견되지 않았습니다."
-                interp = f"📌 로지스틱 모형은 유의합니다(p={format_p(p_val)}). {var_msg}"
+        params, ready = dict(rtype=rtype, xs=xs, y=y), bool(xs)
+
+    # [Performance] 분석은 스크립트 스레드가 아닌 작업 실행기(서버 전체 동시 실행 상한 + 대기열)에서 실행하고,
+    # 결과는 (데이터 해시, 처리 모드, 기법, 변수, 옵션)별 세션 간 공유 저장소에 보관하여
+    # 위젯 조작으로 인한 재실행이나 이전 분석으로 돌아갈 때 모형·그림·리포트를 다시 계산하지 않음
+    run_key = results.key(data_key, "stream" if streamed else "frame", method, (batch_mode, sorted(params.items()))) if ready else None
+    saved = results.get(run_key) if ready else None
+    job_key, job = st.session_state.get(JOB_STATE, (None, None))
+    if st.button("통계 분석 실행") and ready and saved is None:
+        if job is not None and not job.done: job.cancel()
+        # 일반 모드는 캐시된 프레임, 대용량 모드는 memory-map 열을 복사 없이 작업 스레드와 공유합니다.
+        source = analyses.Source(data_key, load_cols, up_file.getvalue() if streamed else None)
+        job_key, job = run_key, jobs.submit(method, analyses.compute, run_key, method, source, params, batch_mode)
+        st.session_state[JOB_STATE] = (job_key, job)
+        job.wait(jobs.INLINE_WAIT)  # 짧은 분석은 같은 실행 안에서 바로 표시
+        saved = results.get(run_key)
+    # 결과가 저장소 상한보다 커서 저장되지 않았거나 다른 세션의 결과에 밀려났으면 끝난 작업의 결과를 표시합니다.
+    if saved is None and job is not None and job_key == run_key and job.status == jobs.DONE:
+        saved = job.result
+
+    if job is not None and job_key == run_key and saved is None:
+        if not job.done:
+            show_job_progress(job)
+        elif job.status == jobs.FAILED:
+            st.error(str(job.error) if isinstance(job.error, analyses.AnalysisError) else f"분석 중 오류가 발생했습니다: {job.error!r}")
+        elif job.status == jobs.CANCELLED:
+            st.warning("분석을 취소했습니다.")
+    if saved is not None:
+        method, final_df, p_val, interp, plot_img = saved.method, saved.final_df, saved.p_val, saved.interp, saved.plot_img
+        assump_report, fit_tables, notices = list(saved.assump_report), list(saved.fit_tables), list(saved.notices)
+        anova_model_info, reg_anova_df, extra_metric = saved.anova_model_info, saved.reg_anova_df, saved.extra_metric
+        if job_key != run_key: st.caption("💾 같은 데이터 · 변수 · 옵션으로 저장된 분석 결과를 표시합니다 (재계산 없음).")
+        for msg in notices: st.info(msg)
 
     # --- Step 03: 결과 대시보드 ---
     if final_df is not None:
+        from statera.report import deferred_report
         st.markdown('<div class="section-title"><span class="step-badge">03</span> 분석 결과 요약 및 학술적 해석</div>', unsafe_allow_html=True)
         
         if assump_report:
@@ -532,6 +361,9 @@ if up_file:
             # [추가] ANOVA 모형 요약 정보 표시
             if anova_model_info:
                  st.info(f"📊 모형 요약 정보\n{anova_model_info}")
+            for title, table in fit_tables:
+                with st.expander(f"📎 {title}"):
+                    st.dataframe(table, use_container_width=True, hide_index=True)
             
         with col_main_R:
             st.markdown("##### 💡 핵심 결론")
@@ -560,10 +392,13 @@ if up_file:
                 </div>
                 """, unsafe_allow_html=True)
 
+            # [Performance] 리포트는 다운로드 클릭 시에만 생성하며, 같은 결과는 캐시된 파일을 재사용
             st.download_button(
                 label="📄 워드 리포트 다운로드",
-                data=create_pro_report(method, final_df, interp, "통계 수치를 논문에 인용하세요.", plot_b=plot_img, assump="\n".join(assump_report)),
+                data=deferred_report(method, final_df, interp, "통계 수치를 논문에 인용하세요.", plot_b=plot_img, assump="\n".join(assump_report), extra_tables=fit_tables),
                 file_name=f"STATERA_{method}.docx",
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                on_click="ignore",
                 use_container_width=True, 
                 type="primary"
             )
@@ -571,7 +406,12 @@ if up_file:
         if plot_img:
             st.markdown("###")
             st.markdown("##### 📊 시각화 결과")
-            st.image(plot_img, use_container_width=True)
+            # [Performance] 화면에는 저해상도 미리보기만 렌더링하고, 인쇄용/벡터 그림은 요청 시 생성
+            st.image(plot_img.preview(), use_container_width=True)
+            st.download_button("🖼️ 벡터 그림(SVG) 다운로드", data=lambda: plot_img.export("svg"), file_name=f"STATERA_{method}.svg",
+                               mime="image/svg+xml", on_click="ignore")
+
+if debug_mode: show_debug_panel()
 
 # 하단 연구 윤리 가이드
 st.markdown(f"""
@@ -586,3 +426,6 @@ st.markdown(f"""
     STATistical Engine for Research & Analysis | ANDA Lab | nncj91@snu.ac.kr
 </div>
 """, unsafe_allow_html=True)
+
+# [Performance] 첫 화면을 보낸 뒤 기법 모듈(scipy, matplotlib 등)을 백그라운드에서 미리 불러옵니다 (프로세스당 1회).
+analyses.prewarm()
@@ -0,0 +1 @@
+"""STATERA 분석 엔진 패키지 (Streamlit UI와 분리된 계산/캐시 계층)."""
@@ -0,0 +1,62 @@
+"""Streamlit 없이 일괄 분석을 실행하는 명령행 진입점 (야간 파이프라인용).
+
+    python -m statera DATA.csv anova --group 학년 --outcomes y1 y2 y3 --csv out.csv --docx out.docx
+    python -m statera DATA.xlsx ttest_ind --group 성별            # 결과변수 생략 시 집단 변수를 뺀 모든 연속형 변수
+    python -m statera DATA.csv ttest_rel --pairs pre1:post1 pre2:post2 --correction fdr_bh
+
+결과표는 표준 출력에 표시하며, --csv는 반올림하지 않은 수치 결과(UTF-8 BOM), --docx는 대시보드와 같은
+Word 리포트를 저장합니다. 분석 계산은 statera.batch를 그대로 사용합니다.
+"""
+import argparse
+import os
+import sys
+
+from statera import batch, ingest
+from statera.report import report_bytes
+
+GUIDE = "통계 수치를 논문에 인용하세요."
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m statera", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("data", help="CSV 또는 XLSX 파일 (첫 행은 변수명)")
+    ap.add_argument("method", choices=list(batch.METHODS))
+    ap.add_argument("--group", help="집단 변수 (ttest_ind, anova)")
+    ap.add_argument("--outcomes", nargs="+", help="결과변수 목록 (생략 시 모든 연속형 변수)")
+    ap.add_argument("--pairs", nargs="+", metavar="PRE:POST", help="대응표본 변수 쌍 (ttest_rel)")
+    ap.add_argument("--correction", choices=list(batch.CORRECTIONS), default="holm")
+    ap.add_argument("--alpha", type=float, default=batch.ALPHA)
+    ap.add_argument("--csv", help="수치 결과표를 저장할 CSV 경로")
+    ap.add_argument("--docx", help="Word 리포트를 저장할 경로")
+    args = ap.parse_args(argv)
+
+    with open(args.data, "rb") as f: dataset = ingest.load_bytes(os.path.basename(args.data), f.read())
+    df, meta = dataset.frame, dataset.meta
+    if args.method in ("ttest_ind", "anova") and args.group not in meta.all_cols:
+        ap.error(f"--group에 데이터의 변수명을 지정하십시오: {args.group}")
+    if args.method == "ttest_rel" and not args.pairs: ap.error("ttest_rel에는 --pairs PRE:POST가 필요합니다.")
+    pairs = [tuple(p.split(":", 1)) for p in args.pairs or ()]
+    outcomes = args.outcomes or [c for c in meta.num_cols if c != args.group]
+    missing = [c for c in [*outcomes, *(v for pr in pairs for v in pr)] if c not in meta.all_cols]
+    if missing or any(len(pr) != 2 for pr in pairs): ap.error(f"데이터에 없는 변수 또는 잘못된 쌍: {', '.join(map(str, missing)) or args.pairs}")
+    if args.group in outcomes: ap.error(f"집단 변수는 결과변수로 분석할 수 없습니다: {args.group}")
+    non_numeric = [c for c in [*outcomes, *(v for pr in pairs for v in pr)] if c not in meta.num_cols]
+    if non_numeric: ap.error(f"연속형이 아닌 결과변수: {', '.join(map(str, non_numeric))}")
+
+    try:
+        res = batch.run(df, args.method, outcomes, args.group, pairs, args.correction, args.alpha)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr); return 1
+    table = res.display()
+    print(table.to_string(index=False)); print()
+    for msg in res.assumptions(): print(msg)
+    print(res.interpretation())
+    if args.csv: res.table.to_csv(args.csv, index=False, encoding="utf-8-sig")
+    if args.docx:
+        with open(args.docx, "wb") as f:
+            f.write(report_bytes(f"{res.label} (Batch)", table, res.interpretation(), GUIDE, assump="\n".join(res.assumptions())))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
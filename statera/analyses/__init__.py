@@ -0,0 +1,94 @@
+"""분석 기법별 순수 계산 함수 (Streamlit 호출 없음).
+
+각 기법은 데이터 원천(Source)과 위젯에서 고른 변수·옵션을 받아 results.AnalysisResult를 반환하므로
+작업 실행기(statera.jobs)의 스레드에서 실행할 수 있습니다. 사용자에게 보여줄 입력 오류는 AnalysisError로,
+안내 메시지는 결과의 notices로 전달합니다. 단계마다 jobs.progress()를 호출하여 진행률을 기록하고
+취소 요청을 확인합니다.
+
+기법마다 별도 모듈에 두고 해당 기법을 처음 실행할 때 불러오므로(scipy, matplotlib/seaborn 등), 이 패키지를
+가져오는 것만으로는 무거운 의존성이 로드되지 않습니다. prewarm()은 첫 화면을 보낸 뒤 백그라운드 스레드에서
+모든 기법 모듈을 미리 불러와 첫 분석의 지연을 없앱니다 (STATERA_PREWARM=0이면 생략).
+"""
+import importlib
+import io
+import os
+import threading
+from dataclasses import dataclass
+
+from statera import profiler
+
+PREWARM = os.environ.get("STATERA_PREWARM", "1") != "0"
+
+
+class AnalysisError(ValueError):
+    """분석을 진행할 수 없는 입력 (화면에 오류로 표시)."""
+
+
+@dataclass(frozen=True)
+class Source:
+    """분석 데이터 원천. 일반·대용량 모드는 load_cols(캐시된 프레임 또는 memory-map 스냅샷 열)를,
+    스트리밍 모드는 CSV 원본 바이트(upload)를 사용합니다."""
+    data_key: str
+    load_cols: object = None
+    upload: bytes = None
+
+    @property
+    def streamed(self):
+        return self.upload is not None
+
+    def stream(self):
+        # 작업마다 독립된 읽기 위치를 갖는 파일 객체 (바이트는 복사하지 않음)
+        return io.BytesIO(self.upload)
+
+
+# 기법 이름 → (모듈, 함수)
+ANALYSES = {
+    "기술통계": ("descriptive", "descriptive"), "빈도분석": ("frequencies", "frequencies"),
+    "카이제곱 검정": ("chi_square", "chi_square"), "단일표본 T-검정": ("ttest", "ttest_one"),
+    "독립표본 T-검정": ("ttest", "ttest_ind"), "대응표본 T-검정": ("ttest", "ttest_paired"),
+    "분산분석(ANOVA)": ("anova", "anova"), "상관분석": ("correlation_matrix", "correlation_matrix"),
+    "신뢰도 분석": ("reliability_analysis", "reliability_analysis"), "회귀분석": ("regression_analysis", "regression_analysis"),
+}
+BATCH = ("batch_analysis", "batch_analysis")
+# 미리 불러오기 순서: 업로드 직후 필요한 모듈, 가벼운 기법, 무거운 기법, 리포트 순
+_WARM = ("statera.ingest", "statera.results", *(f"{__name__}.{m}" for m in dict.fromkeys(m for m, _ in (*ANALYSES.values(), BATCH))),
+         "statera.report")
+_warm_thread = None
+_warm_lock = threading.Lock()
+
+
+def load(method, batched=False):
+    """기법의 계산 함수를 반환합니다. 모듈은 처음 요청될 때 불러옵니다."""
+    module, name = BATCH if batched else ANALYSES[method]
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
+
+
+def run(method, src, params, batched=False):
+    """기법 이름과 위젯 값으로 분석을 실행합니다. batched이면 일괄 분석을 실행합니다."""
+    profiler.mark("import")   # 기법 모듈을 처음 불러오는 시간은 계산 시간과 따로 기록합니다.
+    fn = load(method, batched)
+    profiler.mark("compute")
+    return fn(src, method, **params) if batched else fn(src, **params)
+
+
+def compute(key, method, src, params, batched=False):
+    """작업 실행기용: 분석을 실행하고 결과를 결과 저장소에 기록합니다."""
+    from statera import jobs, results
+    res = run(method, src, params, batched)
+    jobs.checkpoint()   # 데이터를 놓아준 세션의 취소된 작업은 결과를 남기지 않습니다.
+    return results.put(key, res)
+
+
+def _warm():
+    for name in _WARM:
+        try: importlib.import_module(name)
+        except Exception: pass   # 실패한 모듈은 실제 분석에서 다시 불러오며 오류를 표시합니다.
+
+
+def prewarm():
+    """모든 기법 모듈을 데몬 스레드에서 미리 불러옵니다 (프로세스당 1회)."""
+    global _warm_thread
+    with _warm_lock:
+        if not PREWARM or _warm_thread is not None: return
+        _warm_thread = threading.Thread(target=_warm, name="statera-prewarm", daemon=True)
+        _warm_thread.start()
@@ -0,0 +1,8 @@
+"""기법 모듈이 함께 쓰는 결과 표시 도우미."""
+
+
+def format_p(p): return "<.001" if p < .001 else f"{p:.3f}"
+
+
+def passed(msg): return f'<div class="assumption-pass">{msg}</div>'
+def failed(msg): return f'<div class="assumption-fail">{msg}</div>'
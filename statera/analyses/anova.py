@@ -0,0 +1,79 @@
+"""일원 분산분석: 분산분석표, 가정 검정, Welch ANOVA, 사후검정(Tukey HSD / Games-Howell)."""
+import numpy as np
+import pandas as pd
+
+from statera import groupstats, jobs, normality, results
+from statera.analyses import AnalysisError
+from statera.analyses._common import failed, format_p, passed
+
+
+def anova(src, g, y):
+    jobs.progress(0.1, "집단 통계량 계산")
+    df = src.load_cols([g, y])
+    # [Expert Patch] NIST 고정밀 centering은 커널 내부 임시 배열에서 수행하며 df에 보조 열을 만들지 않음
+    gs = groupstats.group_stats(df[g], df[y])
+    if gs.k < 2: raise AnalysisError("집단 변수는 2개 이상의 범주를 가져야 합니다.")
+    fit = groupstats.oneway_anova(gs)
+
+    jobs.progress(0.3, "가정 검정", stage="assumptions")
+    nt = normality.check(gs.residuals()); sp = nt.p
+
+    if sp > 0.05:
+        assump = [passed(f'✅ 잔차 정규성 충족: {nt.test} p={sp:.3f}')]
+    else:
+        assump = [failed(f'⚠️ 잔차 정규성 위배: p={format_p(sp)}. (NIST 등 인공 데이터가 아니라면 Kruskal-Wallis 권장)')]
+
+    _, lp = groupstats.levene(gs)
+    if lp > 0.05:
+        assump.append(passed(f'✅ 등분산성 충족: Levene p={lp:.3f}'))
+    else:
+        assump.append(failed(f'⚠️ 등분산성 위배: p={lp:.3f}. (대안으로 Welch ANOVA 사용 권장)'))
+
+    jobs.progress(0.5, "분산분석표", stage="compute")
+    res = fit.table(f'C({g})')
+    p_val = res.iloc[0, 3] # p값 추출
+
+    final_df = res.reset_index()
+    # [Standardization] 컬럼명 한글 병기
+    final_df = final_df.rename(columns={
+        'index': 'Source (변동원)',
+        'sum_sq': 'Sum of Squares (제곱합)',
+        'df': 'df (자유도)',
+        'mean_sq': 'Mean Square (평균제곱)',
+        'F': 'F Statistic (F값)',
+        'PR(>F)': 'Significance (유의확률)'
+    })
+
+    final_df['Source (변동원)'] = final_df['Source (변동원)'].replace({
+        f'C({g})': f'{g} (집단 간)',
+        'Residual': 'Residual (잔차)'
+    })
+
+    final_df = final_df[['Source (변동원)', 'Sum of Squares (제곱합)', 'df (자유도)', 'Mean Square (평균제곱)', 'F Statistic (F값)', 'Significance (유의확률)']]
+    final_df = final_df.round(3)
+    final_df = final_df.fillna("")
+
+    r2 = fit.r2
+    rmse = fit.root_mse
+    anova_model_info = f"- **설명력 (R²):** {r2:.3f} (전체 변동의 {r2*100:.1f}% 설명)\n- **잔차 표준편차 (Root MSE):** {rmse:.3f}"
+    if lp <= 0.05:
+        w_f, w_df1, w_df2, w_p = groupstats.welch_anova(gs)
+        anova_model_info += f"\n- **Welch ANOVA (이분산 보정):** F({w_df1:.0f}, {w_df2:.2f})={w_f:.3f}, p={format_p(w_p)}"
+
+    fit_tables, notices = [], []
+    if p_val < 0.05:
+        jobs.progress(0.6, "사후검정")
+        ph_name = "Tukey HSD" if lp > 0.05 else "Games-Howell"
+        ph = groupstats.tukey_hsd(gs, fit) if lp > 0.05 else groupstats.games_howell(gs)
+        ph_df = pd.DataFrame({
+            "Group 1 (집단1)": ph["group1"], "Group 2 (집단2)": ph["group2"],
+            "Mean Diff (평균차)": ph["meandiff"].round(3), "SE (표준오차)": ph["se"].round(3),
+            "q (스튜던트화 범위)": ph["q"].round(3), "p-adj (수정 유의확률)": ph["p-adj"].apply(format_p),
+            "95% CI Lower": ph["lower"].round(3), "95% CI Upper": ph["upper"].round(3),
+            "Sig (유의)": np.where(ph["reject"], "*", ""),
+        })
+        fit_tables.append((f"Post-hoc: {ph_name}", ph_df))
+        notices.append(f"💡 사후검정({ph_name}) 결과가 하단에 출력됩니다.")
+
+    return results.AnalysisResult("분산분석(ANOVA)", final_df, p_val, f"📌 집단 간 차이 유의성 p={format_p(p_val)}", tuple(assump),
+                                  fit_tables=tuple(fit_tables), anova_model_info=anova_model_info, notices=tuple(notices))
@@ -0,0 +1,17 @@
+"""일괄 분석: 여러 결과변수에 같은 기법을 적용하고 다중비교 보정 (statera.batch)."""
+from statera import batch, jobs, results
+from statera.analyses import AnalysisError
+from statera.analyses._common import failed, passed
+
+
+def batch_analysis(src, method, batch_key, group, outcomes, pre, post, correction):
+    if len(pre) != len(post): raise AnalysisError("사전 변수와 사후 변수의 개수가 같아야 합니다.")
+    pairs = list(zip(pre, post))
+    jobs.progress(0.1, "데이터 읽기")
+    cols = [group] * (group is not None) + list(outcomes) + [v for pr in pairs for v in pr]
+    try:
+        bres = batch.run(src.load_cols(list(dict.fromkeys(cols))), batch_key, outcomes, group, pairs, correction)
+    except ValueError as e:
+        raise AnalysisError(str(e)) from e
+    assump = [(passed if ok else failed)(f"{'✅' if ok else '⚠️'} {msg}") for ok, msg in bres.notes]
+    return results.AnalysisResult(f"{method} (Batch)", bres.display(), interp=bres.interpretation(), assump_report=tuple(assump))
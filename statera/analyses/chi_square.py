@@ -0,0 +1,29 @@
+"""카이제곱 검정: 교차표, 기대빈도 가정, Fisher 정확 / Monte-Carlo 검정."""
+import pandas as pd
+from scipy import stats
+
+from statera import contingency, jobs, results
+from statera.analyses._common import failed, format_p, passed
+
+
+def chi_square(src, r, c, mc_iter, mc_seed):
+    jobs.progress(0.1, "교차표 계산")
+    df = src.load_cols([r, c])
+    ct = contingency.crosstab(df[r], df[c], data_key=src.data_key); chi2, p, dof, exp = stats.chi2_contingency(ct)
+    under_5_pct = (exp < 5).sum() / exp.size * 100
+    tests = [("Pearson Chi-Square (카이제곱)", f"{chi2:.3f}", str(dof), format_p(p), "asymptotic")]
+    if under_5_pct <= 20:
+        assump = [passed(f'✅ 기대빈도 가정 충족: 기대빈도 5 미만 셀이 {under_5_pct:.1f}%(20% 이하)입니다.')]
+    else:
+        jobs.progress(0.3, "Fisher 정확 검정")
+        # [Expert Patch] 기대빈도 가정 위배 시 Fisher 정확 검정(2×2) 또는 Monte-Carlo Fisher-Freeman-Halton 검정(r×c)을 실제로 수행
+        fr = contingency.fisher(ct, iterations=mc_iter, seed=mc_seed); p = fr.p
+        fr_method = "exact" if fr.method == "exact" else f"Monte-Carlo ({fr.iterations:,} tables, seed={fr.seed}, SE={fr.se:.4f})"
+        tests.append(("Fisher's Exact (Fisher 정확 검정)", "" if fr.odds_ratio is None else f"OR={fr.odds_ratio:.3f}", "", format_p(fr.p), fr_method))
+        assump = [failed(f'⚠️ 기대빈도 가정 위배: 20% 초과. (Fisher의 정확 검정(Fisher\'s Exact Test) 결과 p={format_p(fr.p)}로 판정했습니다)')]
+    fit_tables = [("Test Results (검정 결과)", pd.DataFrame(tests, columns=["Test (검정)", "Statistic (통계량)", "df (자유도)", "p (유의확률)", "Method (계산 방법)"]))]
+
+    # 카이제곱은 결과표 자체가 교차표(Cross-tab)이므로 컬럼명 변경이 애매함. 요약정보 제공.
+    final_df = ct.astype(str) + " (" + (ct/ct.sum()*100).round(1).astype(str) + "%)"
+    interp = f"📌 {r}와 {c} 간 연관성 유의확률{' (Fisher 정확 검정)' if under_5_pct > 20 else ''}: p={format_p(p)}"
+    return results.AnalysisResult("카이제곱 검정", final_df, p, interp, tuple(assump), fit_tables=tuple(fit_tables))
@@ -0,0 +1,34 @@
+"""상관분석: 쌍별 상관·유의확률·사례 수 행렬과 산점도 / 히트맵."""
+import numpy as np
+import pandas as pd
+
+from statera import correlation, jobs, plots, results, streaming
+from statera.analyses._common import format_p, passed
+
+
+def correlation_matrix(src, sel_vs, corr_method):
+    jobs.progress(0.1, "상관행렬 계산")
+    if src.streamed:
+        # 상관계수는 전체 데이터로 계산하고, 산점도는 균등 표본으로만 그립니다.
+        cres, df = streaming.corr(src.stream(), sel_vs)
+    else:
+        df = src.load_cols(sel_vs); cres = correlation.corr(df[sel_vs], corr_method.lower())
+    final_df = cres.r.round(3)
+    p_mat = cres.p
+    fit_tables = [("p-values (유의확률)", p_mat.map(lambda v: "" if pd.isna(v) else format_p(v)).rename_axis("Variable (변수명)").reset_index())]
+    if np.unique(cres.n.to_numpy()).size > 1:
+        fit_tables.append(("Pairwise N (쌍별 사례수)", cres.n.astype(int).rename_axis("Variable (변수명)").reset_index()))
+    n_sig, n_pairs = cres.n_pairs_significant()
+    p_val = p_mat.iloc[0, 1] if len(sel_vs) == 2 else None
+
+    jobs.progress(0.6, "그림 생성", stage="plot")
+    if len(sel_vs) == 2:
+        plot_img = plots.regplot(df, sel_vs[0], sel_vs[1])
+        assump = [passed('✅ 시각적 검토 준비 완료: 하단에 생성된 <b>산점도(Scatter Plot)와 회귀선</b>을 통해 두 변수가 직선 형태의 패턴을 보이는지 시각적으로 판단하십시오.')]
+    else:
+        plot_img = plots.heatmap(final_df)
+        assump = [passed('ℹ️ 다변량 분석 안내: 전체적인 패턴 파악을 위해 히트맵을 제공합니다. 정밀한 선형성 검토가 필요한 경우, 변수를 2개씩 선택하여 산점도를 확인하십시오.')]
+
+    interp = (f"변수 간 {'순위(Spearman)' if corr_method == 'Spearman' else '선형적'} 상관계수 행렬입니다. 0.7 이상이면 강한 상관관계입니다. "
+              f"전체 {n_pairs}쌍 중 {n_sig}쌍이 유의합니다(p<.05).")
+    return results.AnalysisResult("상관분석", final_df, p_val, interp, tuple(assump), plot_img, tuple(fit_tables))
@@ -0,0 +1,43 @@
+"""기술통계: 기술통계량, 정규성(왜도·첨도) 판정, 히스토그램."""
+from statera import jobs, plots, results, streaming
+from statera.analyses._common import failed, passed
+
+
+def descriptive(src, v):
+    jobs.progress(0.1, "데이터 읽기")
+    if src.streamed:
+        summary = streaming.describe(src.stream(), v)
+        desc, autocorr_val, v_data = summary.table, summary.autocorr, summary.sample
+        skew, kurt, v_mean, v_sd = summary.skew, summary.kurt, summary.mean, summary.std
+    else:
+        df = src.load_cols([v])
+        # 기본 기술통계량 계산
+        desc = df[[v]].describe().T.reset_index()
+        # [NIST 검증용] 자기상관계수 (Autocorrelation Lag 1)
+        autocorr_val = df[v].autocorr(lag=1)
+        skew, kurt, v_mean, v_sd = df[v].skew(), df[v].kurt(), df[v].mean(), df[v].std()
+        v_data = df[v].dropna()
+
+    # [Standardization] 컬럼명 한글 병기
+    final_df = desc.rename(columns={
+        'index': 'Variable (변수명)',
+        'count': 'N (사례수)',
+        'mean': 'Mean (평균)',
+        'std': 'SD (표준편차)',
+        'min': 'Min (최소)',
+        '25%': 'Q1 (25%)',
+        '50%': 'Median (중앙값)',
+        '75%': 'Q3 (75%)',
+        'max': 'Max (최대)'
+    }).round(4)
+
+    # 옵션 A: 결과표에는 넣지 않고, 별도 메트릭으로 하단 표시
+    extra_metric = {"label": "Autocorrelation Lag 1 (자기상관계수)", "value": f"{autocorr_val:.3f}"}
+
+    if abs(skew) < 3 and abs(kurt) < 10:
+        assump = [passed(f'✅ 정규성 가정 충족: 왜도({skew:.2f})와 첨도({kurt:.2f})가 기준 이내입니다.')]
+    else:
+        assump = [failed('⚠️ 정규성 가정 위배: 왜도/첨도 기준 초과. (데이터 변환 또는 비모수적 기술통계 고려 권장)')]
+    jobs.progress(0.7, "그림 생성", stage="plot")
+    return results.AnalysisResult("기술통계", final_df, interp=f"📌 {v}의 평균은 {v_mean:.2f}(SD={v_sd:.2f})입니다.",
+                                  assump_report=tuple(assump), plot_img=plots.histogram(v_data), extra_metric=extra_metric)
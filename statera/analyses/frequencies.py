@@ -0,0 +1,11 @@
+"""빈도분석: 범주형 변수들의 빈도표 (scipy를 사용하지 않습니다)."""
+from statera import frequency, jobs, results, streaming
+from statera.analyses._common import passed
+
+
+def frequencies(src, vs):
+    jobs.progress(0.1, "빈도 계산")
+    if src.streamed: final_df = streaming.frequencies(src.stream(), vs)
+    else: final_df = frequency.frequencies(src.load_cols(vs), vs, data_key=src.data_key)
+    return results.AnalysisResult("빈도분석", final_df.fillna(""), interp="대상자의 일반적 분포를 확인하십시오.", assump_report=(
+        passed('✅ 가정 검정 해당 없음: 빈도분석은 비모수적 방법으로 별도의 가정이 필요하지 않습니다.'),))
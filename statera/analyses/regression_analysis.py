@@ -0,0 +1,127 @@
+"""회귀분석: 선형(OLS, 스트리밍 Gram 지원)과 로지스틱(Newton-Raphson) 회귀."""
+import numpy as np
+import pandas as pd
+
+from statera import jobs, logistic, regression, results, streaming
+from statera.analyses import AnalysisError
+from statera.analyses._common import failed, format_p, passed
+
+
+def linear_regression(src, xs, y):
+    jobs.progress(0.1, "모형 적합")
+    try:
+        if src.streamed: model = regression.fit(streaming.regression_gram(src.stream(), y, xs), xs)
+        else: model = regression.ols(src.load_cols(list(xs) + [y]), y, xs)
+    except ValueError as e:
+        raise AnalysisError(str(e)) from e
+    p_val = model.f_pvalue
+    jobs.progress(0.6, "가정 검정", stage="assumptions")
+    vres = model.vif; max_vif = vres.max
+    if vres.singular:
+        assump = [failed(f'⚠️ 완전 공선성 의심: 예측변수 상관행렬 조건수 {vres.condition:.2e}, 최대 VIF {max_vif:.2f} (중복되거나 선형결합인 변수 제거 필요)')]
+    elif max_vif < 10:
+        assump = [passed(f'✅ 다중공선성 없음: 최대 VIF {max_vif:.2f} (기준 10 미만)')]
+    else:
+        assump = [failed(f'⚠️ 다중공선성 경고: 최대 VIF {max_vif:.2f} (변수 제거 또는 차원 축소 고려 권장)')]
+    dw = model.durbin_watson
+    if 1.5 < dw < 2.5:
+        assump.append(passed(f'✅ 잔차 독립성 충족: Durbin-Watson {dw:.2f} (2에 근접)'))
+    else:
+        assump.append(failed(f'⚠️ 잔차 독립성 주의: Durbin-Watson {dw:.2f} (시계열 분석 등 고려 필요)'))
+
+    jobs.progress(0.8, "결과표 작성", stage="compute")
+    # [Standardization] 회귀분석용 ANOVA 테이블 (영문+한글 병기)
+    anova_data = {
+        "Source (변동원)": ["Regression (회귀)", "Residual (잔차)", "Total (합계)"],
+        "df (자유도)": [model.df_model, model.df_resid, model.df_model + model.df_resid],
+        "Sum of Squares (제곱합)": [model.ess, model.ssr, model.ess + model.ssr],
+        "Mean Square (평균제곱)": [model.mse_model, model.mse_resid, ""],
+        "F Statistic (F값)": [model.fvalue, "", ""],
+        "Significance (유의확률)": [format_p(model.f_pvalue), "", ""]
+    }
+    reg_anova_df = pd.DataFrame(anova_data)
+
+    # [Standardization] 회귀계수 결과 테이블 (컬럼명 영문+한글)
+    final_df = pd.DataFrame({
+        "Variable (변수명)": ["const"] + list(xs),
+        "Coef (비표준화 계수)": model.params,
+        "SE (표준오차)": model.bse,
+        "t (t값)": model.tvalues,
+        "p (유의확률)": model.pvalues
+    }).round(3)
+    final_df = final_df.reset_index(drop=True)
+    final_df['p (유의확률)'] = final_df['p (유의확률)'].apply(lambda x: "<.001" if x < 0.001 else f"{x:.3f}")
+
+    sig_vars = []
+    for var in xs:
+        if var in model.pvalues and model.pvalues[var] < 0.05:
+            coef = model.params[var]
+            effect = "정(+)의 영향" if coef > 0 else "부(-)의 영향"
+            sig_vars.append(f"<b>{var}</b>({effect})")
+
+    var_msg = ("또한, " + ", ".join(sig_vars) + "을 미치는 것으로 나타났습니다.") if sig_vars else "유의한 독립변수는 발견되지 않았습니다."
+
+    r2 = model.rsquared
+    adj_r2 = model.rsquared_adj
+    sig_text = "유의합니다" if p_val < 0.05 else "유의하지 않습니다"
+
+    interp = (
+        f"📌 모델의 설명력(R²)은 {r2:.3f}, 수정된 설명력(Adj R²)은 {adj_r2:.3f}입니다. "
+        f"통계적으로 이 모형은 {sig_text}(p={format_p(p_val)}). {var_msg}"
+    )
+    return results.AnalysisResult("회귀분석", final_df, p_val, interp, tuple(assump), reg_anova_df=reg_anova_df)
+
+
+def logistic_regression(src, xs, y):
+    jobs.progress(0.1, "데이터 읽기")
+    df = src.load_cols(list(xs) + [y])
+    if not pd.to_numeric(df[y], errors="coerce").dropna().isin([0, 1]).all():
+        raise AnalysisError("종속변수는 0과 1로 코딩되어야 합니다.")
+    jobs.progress(0.2, "Newton-Raphson 추정")
+    try: model = logistic.fit(df, y, xs, data_key=src.data_key)
+    except ValueError as e: raise AnalysisError(str(e)) from e
+    p_val = model.llr_pvalue
+    if model.converged:
+        assump = [passed(f'✅ 최대우도 추정 수렴: Newton-Raphson {len(model.iterations)}회 반복')]
+    else:
+        assump = [failed(f'⚠️ 최대우도 추정 미수렴: {len(model.iterations)}회 반복 후 중단. (완전 분리 여부 확인 또는 변수 제거 권장)')]
+    start_msg = f"캐시된 모형({', '.join(model.warm_start)})에서 warm start" if model.warm_start else "절편 모형에서 시작"
+    anova_model_info = (f"- **추정 방법:** Newton-Raphson (IRLS), {len(model.iterations)}회 반복, {'수렴' if model.converged else '미수렴'}"
+                        f"\n- **시작값:** {'캐시된 결과 재사용' if model.cached else start_msg}"
+                        f"\n- **추정 시간:** {model.seconds * 1000:.1f} ms"
+                        f"\n- **Pseudo R² (McFadden):** {model.prsquared:.3f}")
+    fit_tables = [(f"Model Fitting: Newton-Raphson ({'converged' if model.converged else 'not converged'}, {len(model.iterations)} iterations)", model.trace())]
+
+    params = model.params
+    conf = model.conf_int()
+    conf.columns = ['Lower CI', 'Upper CI']
+
+    # [Standardization] 로지스틱 결과표 컬럼명
+    final_df = pd.DataFrame({
+        "Coef (비표준화 계수)": params,
+        "SE (표준오차)": model.bse,
+        "OR (오즈비)": np.exp(params),
+        "95% CI Lower": np.exp(conf['Lower CI']),
+        "95% CI Upper": np.exp(conf['Upper CI']),
+        "p (유의확률)": model.pvalues
+    }).round(3)
+    final_df = final_df.reset_index().rename(columns={'index': 'Variable (변수명)'})
+    final_df['p (유의확률)'] = final_df['p (유의확률)'].apply(lambda x: "<.001" if x < 0.001 else f"{x:.3f}")
+
+    sig_vars = []
+    for var in xs:
+        if var in model.pvalues and model.pvalues[var] < 0.05:
+            or_val = np.exp(model.params[var])
+            effect = "증가" if or_val > 1 else "감소"
+            sig_vars.append(f"<b>{var}</b>(OR={or_val:.2f}, 확률 {effect})")
+
+    var_msg = ("또한, " + ", ".join(sig_vars) + " 시키는 경향이 유의했습니다.") if sig_vars else "유의한 독립변수는 발견되지 않았습니다."
+    interp = f"📌 로지스틱 모형은 유의합니다(p={format_p(p_val)}). {var_msg}"
+    return results.AnalysisResult("회귀분석", final_df, p_val, interp, tuple(assump), fit_tables=tuple(fit_tables),
+                                  anova_model_info=anova_model_info)
+
+
+def regression_analysis(src, rtype, xs, y):
+    if "선형" in rtype: return linear_regression(src, xs, y)
+    if src.streamed: raise AnalysisError("스트리밍 모드에서는 선형 회귀분석만 지원합니다.")
+    return logistic_regression(src, xs, y)
@@ -0,0 +1,41 @@
+"""신뢰도 분석: Cronbach α, 신뢰구간, 문항-총점 통계."""
+import pandas as pd
+
+from statera import jobs, reliability, results, streaming
+from statera.analyses import AnalysisError
+from statera.analyses._common import failed, passed
+
+
+def reliability_analysis(src, sel_items):
+    jobs.progress(0.1, "문항 공분산 계산")
+    try:
+        if src.streamed:
+            cov, n_items = streaming.item_covariance(src.stream(), sel_items)
+            rel = reliability.from_covariance(cov.values, sel_items, n_items)
+        else:
+            rel = reliability.analyze(src.load_cols(sel_items), sel_items)
+    except ValueError as e:
+        raise AnalysisError(str(e)) from e
+    alpha = rel.alpha
+
+    if alpha >= 0.7:
+        assump = [passed(f'✅ 신뢰도 양호: Cronbach Alpha {alpha:.3f} (기준 0.7 이상)')]
+    else:
+        assump = [failed(f'⚠️ 신뢰도 낮음: Cronbach Alpha {alpha:.3f} (기준 0.7 미만). 문항 제거 또는 수정 필요.')]
+
+    # [Standardization] 컬럼명 한글 병기
+    measures = [("Cronbach α", f"{alpha:.3f}"), ("Standardized α (표준화 α)", f"{rel.std_alpha:.3f}"),
+                ("95% CI (Feldt)", f"[{rel.feldt_ci[0]:.3f}, {rel.feldt_ci[1]:.3f}]")]
+    if rel.boot_ci: measures.append((f"95% CI (Bootstrap, B={rel.boot_iterations:,})", f"[{rel.boot_ci[0]:.3f}, {rel.boot_ci[1]:.3f}]"))
+    measures += [("Items (문항 수)", str(rel.k)), ("N (사례수)", str(rel.n))]
+    final_df = pd.DataFrame(measures, columns=["Measure (측정지표)", "Value (수치)"])
+    fit_tables = [("Item-Total Statistics (문항-총점 통계)", pd.DataFrame({
+        "Item (문항)": rel.items["item"],
+        "Corrected Item-Total r (수정된 문항-총점 상관)": rel.items["item_total_r"].round(3),
+        "α if Item Deleted (문항 제거 시 α)": rel.items["alpha_if_deleted"].round(3),
+    }).fillna(""))]
+    interp = f"📌 신뢰도 계수는 {alpha:.3f}로 확인되었습니다."
+    best = rel.items["alpha_if_deleted"].idxmax() if rel.k > 2 else None
+    if best is not None and rel.items["alpha_if_deleted"][best] > alpha:
+        interp += f" 문항 {rel.items['item'][best]}을(를) 제거하면 α가 {rel.items['alpha_if_deleted'][best]:.3f}로 높아집니다."
+    return results.AnalysisResult("신뢰도 분석", final_df, interp=interp, assump_report=tuple(assump), fit_tables=tuple(fit_tables))
@@ -0,0 +1,87 @@
+"""T-검정: 단일표본, 독립표본(Levene 결과에 따라 Welch 자동 적용), 대응표본."""
+import pandas as pd
+from scipy import stats
+
+from statera import groupstats, jobs, normality, plots, results
+from statera.analyses import AnalysisError
+from statera.analyses._common import failed, format_p, passed
+
+
+def ttest_one(src, y, ref_v):
+    jobs.progress(0.1, "정규성 검정", stage="assumptions")
+    df = src.load_cols([y])
+    data = df[y].dropna(); nt = normality.check(data); sp = nt.p
+    if sp > 0.05:
+        assump = [passed(f'✅ 정규성 가정 충족: {nt.test} 검정(p={sp:.3f} > .05) 결과 정규분포를 따릅니다.')]
+    else:
+        assump = [failed(f'⚠️ 정규성 가정 위배: p={sp:.3f} < .05. (대안으로 비모수 검정인 Wilcoxon Signed-Rank Test 사용 권장)')]
+    jobs.progress(0.6, "t-검정", stage="compute")
+    stat, p = stats.ttest_1samp(data, ref_v)
+
+    # [Standardization] 컬럼명 한글 병기
+    final_df = pd.DataFrame({
+        "Method (분석방법)": ["단일표본 T-검정"],
+        "t Statistic (t값)": [stat],
+        "df (자유도)": [len(data)-1],
+        "p-value (유의확률)": [format_p(p)]
+    })
+    interp = f"📌 평균과 기준값 간의 차이는 {'유의합니다' if p < 0.05 else '유의하지 않습니다'}."
+    return results.AnalysisResult("단일표본 T-검정", final_df, p, interp, tuple(assump))
+
+
+def ttest_ind(src, g, y):
+    jobs.progress(0.1, "집단 통계량 계산")
+    df = src.load_cols([g, y])
+    gs = groupstats.group_stats(df[g], df[y])
+    if gs.k != 2: raise AnalysisError("집단 변수는 정확히 2개의 범주를 가져야 합니다.")
+    gps = gs.labels
+
+    jobs.progress(0.3, "가정 검정", stage="assumptions")
+    sp1, sp2 = (r.p for r in normality.check_groups(gs.codes, gs.y))
+    if sp1 > 0.05 and sp2 > 0.05:
+        assump = [passed('✅ 정규성 가정 충족: 두 집단 모두 정규분포를 따릅니다.')]
+    else:
+        assump = [failed('⚠️ 정규성 가정 위배: 한 집단 이상이 정규성을 만족하지 않습니다. (대안으로 Mann-Whitney U Test 사용 권장)')]
+
+    _, lp = groupstats.levene(gs)
+    if lp > 0.05:
+        assump.append(passed(f'✅ 등분산성 가정 충족: Levene 검정(p={lp:.3f} > .05) 결과 분산이 동일합니다.'))
+        stat, p = groupstats.ttest_ind(gs, equal_var=True)
+    else:
+        assump.append(failed(f'⚠️ 등분산성 가정 위배: p={lp:.3f} < .05. (자동으로 Welch\'s T-test를 적용하여 분석을 수행했습니다)'))
+        stat, p = groupstats.ttest_ind(gs, equal_var=False)
+
+    # [Standardization] 컬럼명 한글 병기
+    final_df = pd.DataFrame({
+        "Group (집단)": [gps[0], gps[1]],
+        "N (사례수)": [gs.n[0], gs.n[1]],
+        "Mean (평균)": [gs.mean[0], gs.mean[1]],
+        "SD (표준편차)": [gs.sd[0], gs.sd[1]]
+    })
+    jobs.progress(0.7, "그림 생성", stage="plot")
+    interp = f"📌 두 집단 간 {y}의 평균 차이는 t={stat:.3f}, p={format_p(p)}로 통계적으로 {'유의합니다' if p < 0.05 else '유의하지 않습니다'}."
+    return results.AnalysisResult("독립표본 T-검정", final_df, p, interp, tuple(assump), plots.boxplot(df, g, y))
+
+
+def ttest_paired(src, y1, y2):
+    jobs.progress(0.1, "정규성 검정", stage="assumptions")
+    # 두 변수가 모두 관측된 쌍만 사용합니다 (결측 위치가 다르면 쌍이 어긋나지 않도록).
+    df = src.load_cols([y1, y2])[list(dict.fromkeys([y1, y2]))].dropna()
+    diff = df[y2] - df[y1]; nt = normality.check(diff); sp = nt.p
+    if sp > 0.05:
+        assump = [passed(f'✅ 차이의 정규성 충족: {nt.test} 검정(p={sp:.3f} > .05)을 만족합니다.')]
+    else:
+        assump = [failed(f'⚠️ 차이의 정규성 위배: p={sp:.3f} < .05. (대안으로 비모수 검정인 Wilcoxon Signed-Rank Test 사용 권장)')]
+
+    jobs.progress(0.6, "t-검정", stage="compute")
+    stat, p = stats.ttest_rel(df[y1], df[y2])
+
+    # [Standardization] 컬럼명 한글 병기
+    final_df = pd.DataFrame({
+        "Variable (변수)": [y1, y2],
+        "Mean (평균)": [df[y1].mean(), df[y2].mean()],
+        "t Statistic (t값)": [f"{stat:.3f}", ""],
+        "p-value (유의확률)": [format_p(p), ""]
+    })
+    interp = f"📌 사전 대비 사후의 수치 변화는 {'유의합니다' if p < 0.05 else '유의하지 않습니다'}."
+    return results.AnalysisResult("대응표본 T-검정", final_df, p, interp, tuple(assump))
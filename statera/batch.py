@@ -0,0 +1,253 @@
+"""여러 결과변수(outcome)를 한 번에 분석하는 일괄(batch) 분석 엔진.
+
+기술통계, 독립표본/대응표본 T-검정, 분산분석을 결과변수 50~200개에 같은 방식으로 적용하고 다중비교 보정을
+거친 하나의 결과표를 만듭니다. 결과변수들을 N×p 행렬 Y로 한 번에 읽고, 집단 코드(factorize 1회) 순으로 행을
+한 번 정렬한 뒤 np.add.reduceat으로 모든 (집단, 열) 칸의 n·합·편차제곱합을 동시에 계산합니다
+(groupstats와 같은 첫 관측값 centering + 보정된 2-pass). 결측은 열마다 따로 제외하므로 각 결과변수의
+결과는 단일 분석(groupstats)과 같습니다. Levene(Brown-Forsythe)의 집단 중앙값은 groupby 한 번으로,
+F·t·Welch 통계량과 p값은 열 벡터 연산으로 구합니다. 정규성 검정만 열마다 normality.check를 호출합니다.
+
+다중비교 보정(adjust): Holm(기본), Bonferroni, Benjamini-Hochberg(FDR), 보정 안 함.
+Streamlit과 무관한 순수 계산 계층이므로 `python -m statera`(statera/__main__.py)에서도 그대로 사용합니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from statera import normality
+from statera.catalog import BATCH_METHODS as METHODS, CORRECTIONS
+
+ALPHA = 0.05
+P_COL, ADJ_COL, SIG_COL = "p (유의확률)", "p-adj (수정 유의확률)", "Sig (유의)"
+P_COLS = (P_COL, ADJ_COL, "Normality p (정규성)", "Levene p (등분산)", "Welch p")
+
+
+def adjust(p, method="holm"):
+    """다중비교 보정 p값 (statsmodels multipletests와 같은 값). 결측 p값은 보정 대상 수에서 제외합니다."""
+    if method not in CORRECTIONS: raise ValueError(f"지원하지 않는 보정 방법: {method}")
+    p = np.asarray(p, dtype=float); out = np.full(p.shape, np.nan)
+    ok = ~np.isnan(p); q = p[ok]; m = len(q)
+    if method == "none" or not m: out[ok] = q; return out
+    if method == "bonferroni": out[ok] = np.minimum(q * m, 1); return out
+    order = np.argsort(q, kind="stable"); qs = q[order]
+    if method == "holm": adj = np.maximum.accumulate((m - np.arange(m)) * qs)
+    else: adj = np.minimum.accumulate((qs * m / np.arange(1, m + 1))[::-1])[::-1]
+    res = np.empty(m); res[order] = np.minimum(adj, 1); out[ok] = res
+    return out
+
+
+def _format_p(p): return "" if pd.isna(p) else "<.001" if p < .001 else f"{p:.3f}"
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    method: str              # METHODS의 키
+    table: pd.DataFrame      # 결과변수별 한 행 (수치 그대로)
+    correction: str = "none"
+    notes: tuple = ()        # (충족 여부, 가정 검정 메시지) 목록
+    alpha: float = ALPHA
+
+    @property
+    def label(self):
+        return METHODS[self.method]
+
+    @property
+    def significant(self):
+        """보정 후 유의한 결과변수 이름 목록."""
+        if ADJ_COL not in self.table: return []
+        names = self.table.iloc[:, 0].astype(str)
+        if "Post (사후)" in self.table: names = names + "→" + self.table["Post (사후)"].astype(str)
+        return list(names[self.table[ADJ_COL] < self.alpha])
+
+    def display(self):
+        """대시보드·리포트용 표: 수치는 반올림하고 p값은 <.001 형식으로 표시합니다."""
+        out = self.table.copy()
+        for col in out.columns:
+            if col in P_COLS: out[col] = out[col].map(_format_p)
+            elif pd.api.types.is_float_dtype(out[col]): out[col] = out[col].round(3)
+        if ADJ_COL in self.table: out[SIG_COL] = np.where(self.table[ADJ_COL] < self.alpha, "*", "")
+        return out.fillna("")
+
+    def assumptions(self):
+        """가정 검정 요약 메시지 목록 (충족 ✅ / 위배 ⚠️)."""
+        return [f"{'✅' if ok else '⚠️'} {msg}" for ok, msg in self.notes]
+
+    def interpretation(self):
+        if ADJ_COL not in self.table:
+            return f"📌 {len(self.table)}개 변수의 기술통계를 한 표로 요약했습니다."
+        sig = self.significant; shown = ", ".join(sig[:10]) + (f" 외 {len(sig) - 10}개" if len(sig) > 10 else "")
+        return (f"📌 {len(self.table)}개 결과변수 중 {len(sig)}개가 {CORRECTIONS[self.correction]} 보정 후 유의합니다"
+                f"(p-adj<{self.alpha:g}){': ' + shown if sig else ''}.")
+
+
+def _matrix(df, cols):
+    return df[list(cols)].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+
+
+def _group_codes(groups):
+    codes, labels = pd.factorize(pd.Series(groups).reset_index(drop=True), sort=False)
+    return codes, np.asarray(labels)
+
+
+def _group_moments(codes, k, Y):
+    """(집단, 열)별 n, 평균, 편차제곱합 (k×p). 결측 칸은 열마다 제외합니다. codes는 0..k-1을 모두 포함해야 합니다."""
+    p = Y.shape[1]; M = ~np.isnan(Y)
+    # 열마다 첫 관측값만큼 이동 (groupstats와 같은 NIST 방식 centering)
+    center = np.where(M.any(axis=0), Y[M.argmax(axis=0), np.arange(p)], 0.0)
+    # 행을 집단 순으로 한 번 정렬하면 모든 합계가 연속 구간의 add.reduceat 한 번이 됩니다.
+    order = np.argsort(codes, kind="stable"); c = codes[order]; M = M[order]
+    Y0 = np.where(M, Y[order] - center, 0.0)
+    starts = np.r_[0, np.flatnonzero(np.diff(c)) + 1]
+    bc = lambda w: np.add.reduceat(w, starts, axis=0)
+    n = bc(M.astype(float))
+    with np.errstate(all="ignore"):
+        mean = bc(Y0) / n
+        d = np.where(M, Y0 - mean[c], 0.0); resid = bc(d)
+        mean += resid / n; ss = bc(d * d) - resid ** 2 / n
+    return n, mean, ss, center
+
+
+def _oneway(n, mean, ss):
+    """열별 일원분산분석 (관측이 있는 집단만 사용). (F, df1, df2, p, R²) 반환."""
+    live = n > 0; N = n.sum(axis=0); kk = live.sum(axis=0)
+    with np.errstate(all="ignore"):
+        grand = np.where(live, n * mean, 0).sum(axis=0) / N
+        ssb = np.where(live, n * (mean - grand) ** 2, 0).sum(axis=0); ssw = np.where(live, ss, 0).sum(axis=0)
+        dfb, dfw = kk - 1.0, N - kk
+        F = (ssb / dfb) / (ssw / dfw)
+        return F, dfb, dfw, stats.f.sf(F, dfb, dfw), ssb / (ssb + ssw)
+
+
+def _levene(codes, k, Y):
+    # Brown-Forsythe: 집단 중앙값으로부터의 절대편차에 대한 일원분산분석 (groupstats.levene과 동일)
+    med = pd.DataFrame(Y).groupby(codes).median().reindex(range(k)).to_numpy()
+    zn, zmean, zss, _ = _group_moments(codes, k, np.abs(Y - med[codes]))
+    return _oneway(zn, zmean, zss)[3]
+
+
+def _welch(n, mean, ss):
+    with np.errstate(all="ignore"):
+        var = ss / (n - 1); w = np.where(n > 1, n / var, 0); k = (n > 1).sum(axis=0)
+        mw = (w * np.where(n > 1, mean, 0)).sum(axis=0) / w.sum(axis=0)
+        a = (w * np.where(n > 1, mean - mw, 0) ** 2).sum(axis=0) / (k - 1)
+        lam = np.where(n > 1, (1 - w / w.sum(axis=0)) ** 2 / (n - 1), 0).sum(axis=0)
+        F = a / (1 + 2 * (k - 2) / (k * k - 1) * lam); df2 = (k * k - 1) / (3 * lam)
+        return F, stats.f.sf(F, k - 1, df2)
+
+
+def _note(n_bad, total, what, unit, remedy):
+    if not n_bad: return True, f"{what} 충족: {total}{unit} 모두 기준을 만족합니다."
+    return False, f"{what} 위배 {n_bad}/{total}{unit} ({remedy})"
+
+
+def _prepare(df, group, outcomes):
+    # 집단 변수가 결측인 행은 모든 결과변수에서 제외합니다.
+    codes, labels = _group_codes(df[group]); keep = codes >= 0
+    if not keep.any(): raise ValueError("집단 변수가 관측된 사례가 없습니다.")
+    return codes[keep], labels, _matrix(df, outcomes)[keep]
+
+
+def describe(df, outcomes):
+    """여러 연속형 변수의 기술통계 (describe, 왜도, 첨도, 1차 자기상관)를 열 단위로 한 번에 계산합니다."""
+    data = df[list(outcomes)].apply(pd.to_numeric, errors="coerce")
+    desc = data.describe().T
+    table = pd.DataFrame({
+        "Variable (변수명)": list(outcomes), "N (사례수)": desc["count"].to_numpy(dtype=int),
+        "Mean (평균)": desc["mean"].to_numpy(), "SD (표준편차)": desc["std"].to_numpy(),
+        "Min (최소)": desc["min"].to_numpy(), "Q1 (25%)": desc["25%"].to_numpy(), "Median (중앙값)": desc["50%"].to_numpy(),
+        "Q3 (75%)": desc["75%"].to_numpy(), "Max (최대)": desc["max"].to_numpy(),
+        "Skewness (왜도)": data.skew().to_numpy(), "Kurtosis (첨도)": data.kurt().to_numpy(),
+        "Autocorr Lag 1 (자기상관)": data.corrwith(data.shift(1)).to_numpy(),
+    })
+    bad = table["Variable (변수명)"][~((table["Skewness (왜도)"].abs() < 3) & (table["Kurtosis (첨도)"].abs() < 10))].tolist()
+    notes = (_note(len(bad), len(table), "정규성(왜도<3, 첨도<10)", "개 변수", ", ".join(map(str, bad[:10]))),)
+    return BatchResult("describe", table, notes=notes)
+
+
+def ttest_ind(df, group, outcomes, correction="holm", alpha=ALPHA):
+    """두 집단 간 여러 결과변수의 독립표본 t-검정. 결과변수마다 Levene p > alpha이면 Student, 아니면 Welch."""
+    codes, labels, Y = _prepare(df, group, outcomes)
+    if len(labels) != 2: raise ValueError("집단 변수는 정확히 2개의 범주를 가져야 합니다.")
+    n, mean, ss, center = _group_moments(codes, 2, Y)
+    lp = _levene(codes, 2, Y)
+    with np.errstate(all="ignore"):
+        var = ss / (n - 1); dfp = n[0] + n[1] - 2
+        se_p = np.sqrt((ss[0] + ss[1]) / dfp * (1 / n[0] + 1 / n[1]))
+        a, b = var[0] / n[0], var[1] / n[1]; se_w = np.sqrt(a + b)
+        dfw = (a + b) ** 2 / (a * a / (n[0] - 1) + b * b / (n[1] - 1))
+    welch = ~(lp > alpha)
+    se, dof = np.where(welch, se_w, se_p), np.where(welch, dfw, dfp)
+    with np.errstate(all="ignore"): t = (mean[0] - mean[1]) / se
+    p = 2 * stats.t.sf(np.abs(t), dof)
+    norm_p = np.full(Y.shape[1], np.nan)
+    for j in range(Y.shape[1]):
+        m = ~np.isnan(Y[:, j])
+        if m.any(): norm_p[j] = min(r.p for r in normality.check_groups(codes[m], Y[m, j]) if r is not None)
+    g1, g2 = labels
+    table = pd.DataFrame({
+        "Outcome (결과변수)": list(outcomes),
+        f"N [{g1}]": n[0].astype(int), f"Mean [{g1}]": mean[0] + center, f"SD [{g1}]": np.sqrt(var[0]),
+        f"N [{g2}]": n[1].astype(int), f"Mean [{g2}]": mean[1] + center, f"SD [{g2}]": np.sqrt(var[1]),
+        "Normality p (정규성)": norm_p, "Levene p (등분산)": lp,
+        "Test (검정)": np.where(welch, "Welch", "Student"), "t (t값)": t, "df (자유도)": dof,
+        P_COL: p, ADJ_COL: adjust(p, correction),
+    })
+    nw, nn = int(welch.sum()), int((norm_p <= alpha).sum())
+    notes = (_note(nn, len(table), "정규성", "개 결과변수", "해당 변수는 Mann-Whitney U Test 고려"),
+             _note(nw, len(table), "등분산성", "개 결과변수", "해당 변수는 Welch's T-test 자동 적용"))
+    return BatchResult("ttest_ind", table, correction, notes, alpha)
+
+
+def ttest_rel(df, pairs, correction="holm", alpha=ALPHA):
+    """(사전, 사후) 변수 쌍들의 대응표본 t-검정. 쌍마다 두 변수가 모두 관측된 행을 사용합니다."""
+    pairs = [tuple(pr) for pr in pairs]
+    D = _matrix(df, [a for a, _ in pairs]) - _matrix(df, [b for _, b in pairs])
+    n = (~np.isnan(D)).sum(axis=0).astype(float)
+    with np.errstate(all="ignore"):
+        md = np.nanmean(D, axis=0) if len(D) else np.full(len(pairs), np.nan)
+        sd = np.sqrt(np.nansum((D - md) ** 2, axis=0) / (n - 1))
+        t = md / (sd / np.sqrt(n))
+    p = 2 * stats.t.sf(np.abs(t), n - 1)
+    norm_p = np.array([normality.check(D[:, j]).p for j in range(D.shape[1])])
+    table = pd.DataFrame({
+        "Pre (사전)": [a for a, _ in pairs], "Post (사후)": [b for _, b in pairs], "N (사례수)": n.astype(int),
+        "Mean Diff (사전-사후)": md, "SD Diff (차이 표준편차)": sd, "Normality p (정규성)": norm_p,
+        "t (t값)": t, "df (자유도)": n - 1, P_COL: p, ADJ_COL: adjust(p, correction),
+    })
+    nn = int((norm_p <= alpha).sum())
+    notes = (_note(nn, len(table), "차이의 정규성", "쌍", "해당 쌍은 Wilcoxon Signed-Rank Test 고려"),)
+    return BatchResult("ttest_rel", table, correction, notes, alpha)
+
+
+def anova(df, group, outcomes, correction="holm", alpha=ALPHA):
+    """집단 변수 하나에 대한 여러 결과변수의 일원분산분석 (F, R², Levene, Welch ANOVA, 잔차 정규성)."""
+    codes, labels, Y = _prepare(df, group, outcomes)
+    if len(labels) < 2: raise ValueError("집단 변수는 2개 이상의 범주를 가져야 합니다.")
+    k = len(labels); n, mean, ss, center = _group_moments(codes, k, Y)
+    F, dfb, dfw, p, r2 = _oneway(n, mean, ss)
+    lp = _levene(codes, k, Y); wf, wp = _welch(n, mean, ss)
+    resid = Y - center - mean[codes[:, None], np.arange(Y.shape[1])]
+    norm_p = np.array([normality.check(resid[:, j]).p for j in range(resid.shape[1])])
+    table = pd.DataFrame({
+        "Outcome (결과변수)": list(outcomes), "N (사례수)": n.sum(axis=0).astype(int), "k (집단 수)": (n > 0).sum(axis=0),
+        "F (F값)": F, "df1 (자유도)": dfb, "df2 (자유도)": dfw, "R²": r2,
+        "Normality p (정규성)": norm_p, "Levene p (등분산)": lp, "Welch F": wf, "Welch p": wp,
+        P_COL: p, ADJ_COL: adjust(p, correction),
+    })
+    nl, nn = int((~(lp > alpha)).sum()), int((norm_p <= alpha).sum())
+    notes = (_note(nn, len(table), "잔차 정규성", "개 결과변수", "해당 변수는 Kruskal-Wallis 고려"),
+             _note(nl, len(table), "등분산성", "개 결과변수", "해당 변수는 Welch F/p 열 참고"))
+    return BatchResult("anova", table, correction, notes, alpha)
+
+
+def run(df, method, outcomes=(), group=None, pairs=(), correction="holm", alpha=ALPHA):
+    """METHODS 키로 일괄 분석을 실행합니다 (대시보드와 `python -m statera`의 공통 진입점)."""
+    if method == "describe": return describe(df, outcomes)
+    if method == "ttest_rel": return ttest_rel(df, pairs, correction, alpha)
+    if method in ("ttest_ind", "anova"):
+        if group is None: raise ValueError("집단 변수가 필요합니다.")
+        if group in outcomes: raise ValueError(f"집단 변수({group})는 결과변수로 분석할 수 없습니다.")
+        return (ttest_ind if method == "ttest_ind" else anova)(df, group, outcomes, correction, alpha)
+    raise ValueError(f"지원하지 않는 일괄 분석: {method}")
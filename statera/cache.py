@@ -0,0 +1,117 @@
+"""세션 간 공유되는 메모리 제한 캐시.
+
+업로드 데이터에서 파생된 항목을 담는 캐시는 data_key(key, value)로 항목의 데이터 키를 알려 줍니다.
+세션은 hold()로 보고 있는 데이터를 등록하고, 파일을 해제하거나 다른 파일을 올리거나 세션이 종료되어
+그 데이터를 보는 세션이 하나도 남지 않으면 purge()로 그 데이터의 항목을 모든 캐시에서 즉시 지웁니다.
+"""
+import threading
+import weakref
+from collections import OrderedDict
+
+SESSION_KEY = "_statera_data_hold"
+_BY_DATA = weakref.WeakSet()   # data_key를 지정한 캐시 인스턴스
+_HOLDERS = {}                  # 데이터 키 -> 그 데이터를 보고 있는 세션 수
+_HOLD_LOCK = threading.Lock()
+
+
+class LRUCache:
+    """항목별 크기(bytes)를 합산해 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거하는 LRU 캐시.
+
+    Streamlit 서버는 모든 세션이 같은 프로세스를 공유하므로 모듈 전역 인스턴스로 사용하며,
+    동시 접근을 위해 내부 잠금을 사용합니다.
+    """
+
+    def __init__(self, max_bytes, sizeof=None, data_key=None):
+        self.max_bytes = int(max_bytes)
+        self._sizeof = sizeof or (lambda value: 0)
+        self._data_key = data_key
+        if data_key is not None: _BY_DATA.add(self)
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items: return default
+            self._items.move_to_end(key)
+            return self._items[key][0]
+
+    def put(self, key, value):
+        size = int(self._sizeof(value))
+        with self._lock:
+            if key in self._items:
+                self.nbytes -= self._items.pop(key)[1]
+            # 단일 항목이 상한을 넘으면 캐시하지 않고 호출자에게만 돌려줍니다.
+            if size > self.max_bytes: return value
+            while self._items and self.nbytes + size > self.max_bytes:
+                _, (_, old_size) = self._items.popitem(last=False)
+                self.nbytes -= old_size
+            self._items[key] = (value, size)
+            self.nbytes += size
+        return value
+
+    def keys(self):
+        """현재 키 목록의 스냅샷 (오래된 순)."""
+        with self._lock:
+            return list(self._items)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._items: return default
+            value, size = self._items.pop(key)
+            self.nbytes -= size
+            return value
+
+    def discard(self, match):
+        """match(key, value)가 참인 항목을 모두 제거하고 제거한 개수를 반환합니다."""
+        with self._lock:
+            keys = [k for k, (v, _) in self._items.items() if match(k, v)]
+            for k in keys: self.nbytes -= self._items.pop(k)[1]
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear(); self.nbytes = 0
+
+
+def purge(data_key):
+    """data_key 데이터에서 파생된 항목을 등록된 모든 캐시에서 제거합니다."""
+    for cache in list(_BY_DATA):
+        cache.discard(lambda k, v, cache=cache: cache._data_key(k, v) == data_key)
+
+
+class _Hold:
+    """한 세션이 보고 있는 데이터. 해제되거나 세션 상태와 함께 소멸하면 보유 세션 수를 줄입니다."""
+
+    def __init__(self, data_key):
+        self.data_key = data_key
+        with _HOLD_LOCK: _HOLDERS[data_key] = _HOLDERS.get(data_key, 0) + 1
+        self.close = weakref.finalize(self, _unhold, data_key)
+
+
+def _unhold(data_key):
+    with _HOLD_LOCK:
+        left = _HOLDERS.pop(data_key, 1) - 1
+        if left: _HOLDERS[data_key] = left; return
+    purge(data_key)
+
+
+def hold(session_state, data_key):
+    """세션이 data_key 데이터를 보고 있음을 기록합니다. 이전에 보던 다른 데이터는 놓아줍니다."""
+    held = session_state.get(SESSION_KEY)
+    if held is not None and held.data_key == data_key: return
+    release(session_state)
+    session_state[SESSION_KEY] = _Hold(data_key)
+
+
+def release(session_state):
+    """세션이 보던 데이터를 놓아줍니다. 그 데이터를 보는 세션이 더 없으면 파생 캐시 항목을 모두 지웁니다."""
+    held = session_state.pop(SESSION_KEY, None)
+    if held is not None: held.close()
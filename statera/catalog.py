@@ -0,0 +1,16 @@
+"""화면에 노출되는 분석 기법 목록과 기본 옵션값.
+
+첫 화면과 변수 선택 화면은 이 상수만으로 그릴 수 있도록, 이 모듈은 numpy·pandas·scipy 등 무거운 패키지를
+불러오지 않습니다. 계산 모듈(batch, contingency, streaming)은 같은 값을 여기서 가져와 다시 내보냅니다.
+"""
+
+# 일괄 분석(statera.batch)이 지원하는 기법: 내부 키 → 화면 이름
+BATCH_METHODS = {"describe": "기술통계", "ttest_ind": "독립표본 T-검정", "ttest_rel": "대응표본 T-검정", "anova": "분산분석(ANOVA)"}
+CORRECTIONS = {"holm": "Holm", "bonferroni": "Bonferroni", "fdr_bh": "Benjamini-Hochberg (FDR)", "none": "보정 안 함"}
+
+# 스트리밍 모드(statera.streaming)가 지원하는 기법
+STREAM_METHODS = ("기술통계", "빈도분석", "상관분석", "신뢰도 분석", "회귀분석")
+
+# Fisher-Freeman-Halton Monte-Carlo 검정(statera.contingency) 기본값
+MC_ITERATIONS = 10_000
+MC_SEED = 2024
@@ -0,0 +1,119 @@
+"""교차표와 분할표 검정 엔진 (카이제곱 검정, Fisher 정확 검정).
+
+교차표는 두 변수의 정수 코드(frequency.factorize, 업로드별 캐시)로 np.bincount 한 번에 만듭니다.
+기대빈도 가정이 위배되면 다음 검정을 사용합니다.
+- 2×2: scipy.stats.fisher_exact (정확 검정)
+- r×c: Fisher-Freeman-Halton 검정의 Monte-Carlo p값. 주변합이 고정된 무작위 교차표를 셀마다의 순차적
+  초기하 추출(Patefield 방식)로 배치 단위(BATCH개) 벡터 생성하고, 표 확률이 관측표 이하인 비율로
+  p = (1 + #극단) / (1 + 반복 수)를 계산합니다 (R fisher.test(simulate.p.value=TRUE)와 같은 방식).
+  배치는 SeedSequence로 독립 시드를 받아 작업 내부용 스레드 풀(jobs.parallel_map)에서 실행되므로 결과는
+  시드와 반복 수에만 의존하고 작업자 수와는 무관합니다. 처음에는 프로세스 풀을 썼으나, 작업마다 풀을 만들면
+  동시 실행 상한을 넘어 코어를 과점하고 Streamlit 서버에서 자식 프로세스가 페이지 스크립트를 다시 실행하므로
+  서버 전체 작업 예산을 나눠 쓰는 스레드로 바꾸었습니다 (statera.jobs).
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import special, stats
+
+from statera import frequency, jobs
+from statera.catalog import MC_ITERATIONS, MC_SEED
+
+BATCH = 2_000
+MC_WORKERS = int(os.environ.get("STATERA_MC_THREADS", str(jobs.INNER_WORKERS)))
+
+
+def _label_order(cats):
+    values = np.asarray(cats, dtype=object)
+    try: return np.argsort(np.asarray(cats), kind="stable")
+    except TypeError: pass
+    # 서로 비교할 수 없는 라벨(예: 1과 "1")은 pandas처럼 숫자 등 문자열이 아닌 라벨을 먼저, 문자열을 나중에 둡니다.
+    for key in (lambda i: (isinstance(values[i], str), values[i]), lambda i: (isinstance(values[i], str), type(values[i]).__name__, str(values[i]))):
+        try: return np.array(sorted(range(len(values)), key=key), dtype=np.int64)
+        except TypeError: continue
+
+
+def _display_labels(cats):
+    # 문자열로 같아 보이는 라벨(1과 "1") 중 문자열 라벨은 repr로 구분해 표시합니다.
+    text = pd.Series([str(v) for v in cats])
+    if not text.duplicated().any(): return cats
+    clash = set(text[text.duplicated(keep=False)])
+    return pd.Index([repr(v) if isinstance(v, str) and v in clash else v for v in cats], dtype=object)
+
+
+def _sorted_codes(s, data_key):
+    codes, cats = frequency.factorize(s, data_key)
+    order = _label_order(cats)
+    remap = np.empty(len(cats), dtype=np.int64); remap[order] = np.arange(len(cats))
+    return np.where(codes >= 0, remap[np.maximum(codes, 0)], -1), _display_labels(cats[order])
+
+
+def crosstab(rows, cols, data_key=None):
+    """pd.crosstab(rows, cols)와 같은 빈도 교차표 (결측 행 제외, 라벨 정렬)."""
+    rc, rcats = _sorted_codes(rows, data_key); cc, ccats = _sorted_codes(cols, data_key)
+    keep = (rc >= 0) & (cc >= 0); kc = len(ccats)
+    counts = np.bincount(rc[keep] * kc + cc[keep], minlength=len(rcats) * kc).reshape(len(rcats), kc)
+    # 관측되지 않은 범주(다른 변수가 결측인 행에만 나타난 범주)는 pd.crosstab처럼 제외합니다.
+    r_live, c_live = counts.sum(axis=1) > 0, counts.sum(axis=0) > 0
+    return pd.DataFrame(counts[np.ix_(r_live, c_live)],
+                        index=pd.Index(rcats[r_live], name=rows.name), columns=pd.Index(ccats[c_live], name=cols.name))
+
+
+@dataclass(frozen=True)
+class FisherResult:
+    p: float
+    method: str            # "exact" 또는 "monte-carlo"
+    iterations: int = 0
+    seed: int = None
+    odds_ratio: float = None
+
+    @property
+    def se(self):
+        """Monte-Carlo p값의 표준오차."""
+        return float(np.sqrt(self.p * (1 - self.p) / self.iterations)) if self.iterations else 0.0
+
+
+def _log_prob_kernel(tables):
+    # 주변합이 같은 표 사이에서 표 확률의 비교에 필요한 부분: -Σ log(x_ij!)
+    return -special.gammaln(tables + 1.0).sum(axis=(-2, -1))
+
+
+def random_tables(row_sums, col_sums, size, rng):
+    """주변합이 고정된 무작위 교차표 size개 (순차적 초기하 추출, shape=(size, r, c))."""
+    r, c = len(row_sums), len(col_sums)
+    out = np.zeros((size, r, c), dtype=np.int64)
+    cols_left = np.tile(np.asarray(col_sums, dtype=np.int64), (size, 1))
+    for i in range(r - 1):
+        need = np.full(size, row_sums[i], dtype=np.int64)
+        rest = cols_left.sum(axis=1)
+        for j in range(c - 1):
+            rest = rest - cols_left[:, j]
+            x = rng.hypergeometric(cols_left[:, j], rest, need) if need.any() else np.zeros(size, dtype=np.int64)
+            out[:, i, j] = x; need -= x; cols_left[:, j] -= x
+        out[:, i, c - 1] = need; cols_left[:, c - 1] -= need
+    out[:, r - 1, :] = cols_left
+    return out
+
+
+def _mc_batch(args):
+    row_sums, col_sums, size, seed, threshold = args
+    tables = random_tables(row_sums, col_sums, size, np.random.default_rng(seed))
+    return int((_log_prob_kernel(tables) <= threshold).sum())
+
+
+def fisher(table, iterations=MC_ITERATIONS, seed=MC_SEED, workers=MC_WORKERS):
+    """Fisher 정확 검정 (2×2) 또는 Fisher-Freeman-Halton Monte-Carlo 검정 (r×c)."""
+    t = np.asarray(table, dtype=np.int64)
+    if t.shape == (2, 2):
+        odds, p = stats.fisher_exact(t)
+        return FisherResult(float(p), "exact", odds_ratio=float(odds))
+    row_sums, col_sums = t.sum(axis=1), t.sum(axis=0)
+    # 부동소수 비교 오차를 허용하는 상대 허용치 (R과 동일: 1 + 1e-7)
+    obs = _log_prob_kernel(t); threshold = obs + 1e-7 * max(abs(obs), 1.0)
+    sizes = [BATCH] * (iterations // BATCH) + ([iterations % BATCH] if iterations % BATCH else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    batches = [(row_sums, col_sums, n, s, threshold) for n, s in zip(sizes, seeds)]
+    hits = sum(jobs.parallel_map(_mc_batch, batches, workers))
+    return FisherResult((1 + hits) / (1 + iterations), "monte-carlo", iterations, seed)
@@ -0,0 +1,113 @@
+"""상관분석 엔진: 쌍별 결측 제외(pairwise complete) Pearson/Spearman 상관, 사례 수, 유의확률.
+
+각 변수를 전체 평균·표준편차로 표준화한 뒤(상관계수는 변수별 선형변환에 불변) 결측을 0으로 채운 값 Z와
+관측 마스크 M의 행렬곱으로 모든 쌍의 합계를 한 번에 구합니다.
+- 결측이 없으면 r = Z'Z / N 한 번의 행렬곱 (표준편차는 자유도 N 기준)
+- 결측이 있으면 n = M'M, 쌍별 합 Z'M, 제곱합 (Z²)'M, 교차합 Z'Z로 쌍마다 다른 관측 집합의 상관을 계산
+변수가 TILE개를 넘으면 상관행렬을 TILE×TILE 블록으로 나누어 병렬로 계산합니다 (jobs.parallel_map).
+
+Spearman은 열별 평균 순위(동점 평균)를 한 번에 계산한 뒤 같은 Pearson 경로를 사용합니다. 결측이 없으면
+pandas와 같고, 결측이 있으면 각 변수의 관측값 안에서 매긴 순위를 사용합니다.
+유의확률은 모든 쌍에 대해 t = r·√((n-2)/(1-r²)), 자유도 n-2로 한 번에 계산합니다.
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from statera import jobs
+
+TILE = int(os.environ.get("STATERA_CORR_TILE", "128"))
+WORKERS = int(os.environ.get("STATERA_CORR_THREADS", str(jobs.INNER_WORKERS)))
+METHODS = ("pearson", "spearman")
+
+
+@dataclass(frozen=True)
+class CorrResult:
+    r: pd.DataFrame
+    n: pd.DataFrame
+    method: str = "pearson"
+
+    @property
+    def p(self):
+        return pd.DataFrame(pvalues(self.r.to_numpy(), self.n.to_numpy()), index=self.r.index, columns=self.r.columns)
+
+    def n_pairs_significant(self, alpha=0.05):
+        """유의한 변수 쌍 수와 전체 쌍 수 (대각 제외)."""
+        iu = np.triu_indices(len(self.r), 1); p = self.p.to_numpy()[iu]
+        return int((p < alpha).sum()), len(p)
+
+
+def pvalues(r, n):
+    """상관계수 행렬과 쌍별 사례 수에서 양측 유의확률 행렬을 계산합니다."""
+    df = n - 2
+    with np.errstate(all="ignore"):
+        t = r * np.sqrt(df / np.maximum(1 - r * r, 0))
+        p = 2 * stats.t.sf(np.abs(t), df)
+    p = np.where(np.abs(r) >= 1, 0.0, p); p[df < 1] = np.nan; p[np.isnan(r)] = np.nan
+    np.fill_diagonal(p, np.nan)
+    return p
+
+
+def _standardize(X):
+    M = ~np.isnan(X)
+    with np.errstate(all="ignore"):
+        mean = np.nanmean(X, axis=0); sd = np.nanstd(X, axis=0)
+    live = sd > 0; sd = np.where(live, sd, 1.0)
+    return np.where(M, (X - np.nan_to_num(mean)) / sd, 0.0), M.astype(float), live
+
+
+def _tile(Za, Ma, Zb, Mb):
+    n = Ma.T @ Mb
+    sa, sb = Za.T @ Mb, Ma.T @ Zb
+    with np.errstate(all="ignore"):
+        cov = Za.T @ Zb - sa * sb / n
+        va = (Za * Za).T @ Mb - sa * sa / n; vb = Ma.T @ (Zb * Zb) - sb * sb / n
+        r = cov / np.sqrt(va * vb)
+    r[n < 2] = np.nan
+    return r, n
+
+
+def _pearson(X):
+    p = X.shape[1]; Z, M, live = _standardize(X); complete = M.all()
+    r, n = np.empty((p, p)), np.empty((p, p))
+    blocks = [(a, b) for a in range(0, p, TILE) for b in range(a, p, TILE)]
+
+    def work(ab):
+        a, b = ab; sa, sb = slice(a, a + TILE), slice(b, b + TILE)
+        if complete:
+            N = len(X); rab = Z[:, sa].T @ Z[:, sb] / max(N, 1)
+            nab = np.full(rab.shape, float(N))
+            if N < 2: rab[:] = np.nan
+            return ab, rab, nab
+        return (ab, *_tile(Z[:, sa], M[:, sa], Z[:, sb], M[:, sb]))
+
+    for (a, b), rab, nab in jobs.parallel_map(work, blocks, WORKERS):
+        r[a:a + TILE, b:b + TILE] = rab; n[a:a + TILE, b:b + TILE] = nab
+        r[b:b + TILE, a:a + TILE] = rab.T; n[b:b + TILE, a:a + TILE] = nab.T
+    r[~live, :] = np.nan; r[:, ~live] = np.nan  # 상수 열
+    diag = np.diag_indices(p)
+    r[diag] = np.where(np.isnan(r[diag]) | (np.diag(n) < 2), np.nan, 1.0)
+    return np.clip(r, -1, 1), n
+
+
+def rank_columns(X):
+    """열별 평균 순위 (결측은 결측으로 유지)."""
+    return stats.rankdata(X, axis=0, nan_policy="omit")
+
+
+def corr(df, method="pearson"):
+    """df.corr(method)와 같은 상관행렬과 쌍별 사례 수를 계산합니다."""
+    if method not in METHODS: raise ValueError(f"지원하지 않는 상관계수: {method}")
+    cols = list(df.columns)
+    X = df.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    if method == "spearman": X = rank_columns(X)
+    r, n = _pearson(X)
+    return CorrResult(pd.DataFrame(r, index=cols, columns=cols), pd.DataFrame(n, index=cols, columns=cols), method)
+
+
+def from_moments(r, n, columns, method="pearson"):
+    """이미 계산된 상관행렬과 쌍별 사례 수(예: 스트리밍 누적기)로 CorrResult를 만듭니다."""
+    return CorrResult(pd.DataFrame(r, index=columns, columns=columns), pd.DataFrame(n, index=columns, columns=columns), method)
@@ -0,0 +1,64 @@
+"""빈도분석 엔진.
+
+선택한 열을 한 번씩 정수 코드(pd.factorize, 결측은 -1)로 변환하고 np.bincount로 범주별 빈도를 셉니다.
+(열별 코드, 범주 목록)은 (데이터 해시, 열 이름) 기준으로 세션 간 공유 LRU 캐시에 저장되므로 같은 업로드를
+다시 분석할 때는 문자열 해시 스캔(factorize)을 건너뜁니다. 결과는 모든 열의 범주 수만큼 미리 할당한
+배열로 한 번에 만드는 long 형식 표이며, 결측 행과 유효 비율을 포함합니다.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from statera.cache import LRUCache
+
+CODES_CACHE_BYTES = int(float(os.environ.get("STATERA_FREQ_CACHE_MB", "64")) * 2**20)
+_CODES = LRUCache(CODES_CACHE_BYTES, sizeof=lambda item: item[0].nbytes + item[1].memory_usage(deep=True),
+                  data_key=lambda k, v: k[0])
+MISSING_LABEL = "Missing (결측)"
+COLUMNS = ("Variable (변수명)", "Category (범주)", "Frequency (빈도)", "Percent (비율)", "Valid Percent (유효 비율)")
+
+
+def factorize(s, data_key=None):
+    """열의 (정수 코드, 범주 Index). 코드는 범주 수에 맞는 가장 작은 정수형이며 결측은 -1입니다."""
+    key = (data_key, s.name)
+    if data_key is not None:
+        cached = _CODES.get(key)
+        if cached is not None: return cached
+    codes, cats = pd.factorize(s, sort=False, use_na_sentinel=True)
+    codes = codes.astype(np.min_scalar_type(-max(len(cats), 1)), copy=False)
+    return _CODES.put(key, (codes, cats)) if data_key is not None else (codes, cats)
+
+
+def count(s, data_key=None):
+    """(범주, 빈도, 결측 수). 범주는 빈도 내림차순이며 동률은 처음 등장한 순서입니다 (value_counts와 동일)."""
+    codes, cats = factorize(s, data_key)
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=len(cats))
+    order = np.argsort(-counts, kind="stable")
+    return cats[order], counts[order], int(len(codes) - valid.sum())
+
+
+def table(items):
+    """[(변수명, 범주, 빈도 배열, 결측 수), ...]로 long 형식 빈도표를 만듭니다."""
+    sizes = [len(counts) + (missing > 0) for _, _, counts, missing in items]
+    total = sum(sizes)
+    var = np.empty(total, dtype=object); cat = np.empty(total, dtype=object)
+    freq = np.empty(total, dtype=np.int64); pct = np.empty(total); valid_pct = np.full(total, np.nan)
+    pos = 0
+    for (name, cats, counts, missing), size in zip(items, sizes):
+        k = len(counts); n_valid = counts.sum(); n_all = n_valid + missing
+        sl = slice(pos, pos + size)
+        var[sl] = name; cat[pos:pos + k] = np.asarray(cats, dtype=object)
+        freq[pos:pos + k] = counts
+        if missing: cat[pos + k] = MISSING_LABEL; freq[pos + k] = missing
+        with np.errstate(all="ignore"):
+            pct[sl] = freq[sl] / n_all * 100
+            valid_pct[pos:pos + k] = counts / n_valid * 100
+        pos += size
+    return pd.DataFrame(dict(zip(COLUMNS, (var, cat, freq, pct.round(1), valid_pct.round(1)))))
+
+
+def frequencies(df, columns, data_key=None):
+    """df의 여러 열에 대한 빈도표 (결측 행, 전체 비율, 유효 비율 포함)."""
+    return table([(c, *count(df[c], data_key)) for c in columns])
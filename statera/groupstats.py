@@ -0,0 +1,254 @@
+"""집단 비교(독립표본 T-검정, 분산분석)를 위한 집단별 충분통계량 엔진.
+
+집단 변수를 한 번만 정수 코드로 변환(factorize)하고 np.bincount로 집단별 n, 합, 편차제곱합을
+구합니다. 중앙값은 (코드, 값) 정렬 한 번으로 얻습니다. F 분산분석표, R², Root MSE,
+Levene(Brown-Forsythe), Welch 통계량과 t-검정은 모두 이 결과에서 계산되므로 집단 수 k와 무관하게
+데이터를 O(N)번만 훑으며, 더미 코딩된 OLS 설계행렬을 만들지 않습니다. 사후검정(Tukey HSD, Games-Howell)도
+같은 집단 평균·사례 수·MSE로 k(k-1)/2 쌍을 한 번에 비교합니다.
+
+수치 안정성: 검정 변수는 커널 내부의 임시 배열로 복사한 뒤 첫 관측값만큼 이동(NIST 방식 centering)하고,
+집단 평균과 편차제곱합은 보정된 2-pass 알고리즘으로 계산합니다. 사용자 DataFrame은 복사하거나 변경하지
+않습니다.
+"""
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import interpolate, special, stats
+
+
+@dataclass(frozen=True)
+class GroupStats:
+    labels: np.ndarray   # 집단 라벨 (데이터 등장 순서, df[g].unique()와 동일)
+    codes: np.ndarray    # 행별 집단 코드
+    y: np.ndarray        # 결측 제외 후 center만큼 이동한 검정 변수 값 (임시 배열)
+    center: float        # 이동량 (첫 관측값)
+    n: np.ndarray
+    cmean: np.ndarray    # 이동된 척도의 집단 평균
+    ss: np.ndarray       # 집단 내 편차제곱합
+    cmedian: np.ndarray  # 이동된 척도의 집단 중앙값
+    order: np.ndarray    # (코드, 값) 기준 정렬 인덱스
+
+    @property
+    def k(self):
+        return len(self.labels)
+
+    @property
+    def N(self):
+        return int(self.n.sum())
+
+    @property
+    def mean(self):
+        return self.cmean + self.center
+
+    @property
+    def median(self):
+        return self.cmedian + self.center
+
+    @property
+    def var(self):
+        with np.errstate(all="ignore"):
+            return self.ss / (self.n - 1)
+
+    @property
+    def sd(self):
+        return np.sqrt(self.var)
+
+    def residuals(self):
+        return self.y - self.cmean[self.codes]
+
+    def split(self):
+        """집단별 값 배열 목록 (원래 척도, 라벨 순서, 각 배열은 정렬됨)."""
+        return np.split(self.y[self.order] + self.center, np.cumsum(self.n)[:-1])
+
+
+def group_stats(groups, values):
+    """집단 변수와 검정 변수에서 둘 다 관측된 행만 사용하여 집단별 충분통계량을 계산합니다."""
+    g = pd.Series(groups).reset_index(drop=True)
+    y = pd.to_numeric(pd.Series(values).reset_index(drop=True), errors="coerce").to_numpy(dtype=float)
+    keep = g.notna().to_numpy() & ~np.isnan(y)
+    codes, labels = pd.factorize(g[keep], sort=False)
+    # 불리언 인덱싱은 항상 새 배열을 만들므로 이후의 제자리(in-place) 연산은 원본 열에 영향을 주지 않습니다.
+    y = y[keep]; k = len(labels)
+    center = float(y[0]) if y.size else 0.0
+    y -= center
+    n = np.bincount(codes, minlength=k)
+    mean = np.bincount(codes, y, minlength=k) / n
+    # 보정된 2-pass: 1차 평균의 반올림 오차를 잔차 합으로 보정하고 편차제곱합에서도 제거합니다.
+    d = y - mean[codes]
+    resid_sum = np.bincount(codes, d, minlength=k)
+    mean += resid_sum / n
+    ss = np.bincount(codes, d * d, minlength=k) - resid_sum ** 2 / n
+    order = np.lexsort((y, codes)); ys = y[order]
+    start = np.r_[0, np.cumsum(n)[:-1]]
+    median = (ys[start + (n - 1) // 2] + ys[start + n // 2]) / 2
+    return GroupStats(np.asarray(labels), codes, y, center, n, mean, ss, median, order)
+
+
+@dataclass(frozen=True)
+class OnewayResult:
+    ss_between: float
+    ss_within: float
+    df_between: float
+    df_within: float
+    F: float
+    p: float
+
+    @property
+    def ms_between(self):
+        return self.ss_between / self.df_between
+
+    @property
+    def ms_within(self):
+        return self.ss_within / self.df_within
+
+    @property
+    def r2(self):
+        return self.ss_between / (self.ss_between + self.ss_within)
+
+    @property
+    def root_mse(self):
+        return np.sqrt(self.ms_within)
+
+    def table(self, source):
+        """statsmodels anova_lm(typ=2)과 같은 형태의 분산분석표."""
+        return pd.DataFrame({
+            "sum_sq": [self.ss_between, self.ss_within],
+            "df": [self.df_between, self.df_within],
+            "F": [self.F, np.nan],
+            "PR(>F)": [self.p, np.nan],
+            "mean_sq": [self.ms_between, self.ms_within],
+        }, index=[source, "Residual"])
+
+
+def _oneway(n, mean, ss):
+    N, k = n.sum(), len(n)
+    grand = (n * mean).sum() / N
+    ssb = (n * (mean - grand) ** 2).sum()
+    dfb, dfw = float(k - 1), float(N - k)
+    with np.errstate(all="ignore"):
+        F = (ssb / dfb) / (ss.sum() / dfw)
+    return OnewayResult(ssb, ss.sum(), dfb, dfw, F, stats.f.sf(F, dfb, dfw))
+
+
+def oneway_anova(gs):
+    return _oneway(gs.n, gs.cmean, gs.ss)
+
+
+def levene(gs, center="median"):
+    """scipy.stats.levene과 같은 등분산 검정 (기본 center='median', 즉 Brown-Forsythe)."""
+    c = gs.cmedian if center == "median" else gs.cmean
+    z = np.abs(gs.y - c[gs.codes])
+    zmean = np.bincount(gs.codes, z, minlength=gs.k) / gs.n
+    dz = z - zmean[gs.codes]
+    res = _oneway(gs.n, zmean, np.bincount(gs.codes, dz * dz, minlength=gs.k))
+    return res.F, res.p
+
+
+def welch_anova(gs):
+    """Welch의 이분산 일원분산분석. (F, df1, df2, p) 반환."""
+    k = gs.k; w = gs.n / gs.var
+    mw = (w * gs.cmean).sum() / w.sum()
+    a = (w * (gs.cmean - mw) ** 2).sum() / (k - 1)
+    lam = ((1 - w / w.sum()) ** 2 / (gs.n - 1)).sum()
+    b = 1 + 2 * (k - 2) / (k * k - 1) * lam
+    F = a / b; df2 = (k * k - 1) / (3 * lam)
+    return F, float(k - 1), df2, stats.f.sf(F, k - 1, df2)
+
+
+def ttest_ind(gs, equal_var=True):
+    """첫 두 집단의 독립표본 t-검정 (scipy.stats.ttest_ind와 동일). (t, p) 반환."""
+    n1, n2 = gs.n[:2]; m1, m2 = gs.cmean[:2]; v1, v2 = gs.var[:2]
+    if equal_var:
+        df = n1 + n2 - 2
+        se = np.sqrt((gs.ss[0] + gs.ss[1]) / df * (1 / n1 + 1 / n2))
+    else:
+        a, b = v1 / n1, v2 / n2; se = np.sqrt(a + b)
+        df = (a + b) ** 2 / (a * a / (n1 - 1) + b * b / (n2 - 1))
+    t = (m1 - m2) / se
+    return t, 2 * stats.t.sf(abs(t), df)
+
+
+_Z_NODES, _Z_WEIGHTS = np.polynomial.legendre.leggauss(128)
+_T_NODES, _T_WEIGHTS = np.polynomial.legendre.leggauss(256)
+_W_MAX = 20.0
+
+
+def _range_cdf(w, k):
+    # 표준정규 k개의 범위(range)가 w 미만일 확률: k ∫ φ(z) [Φ(z) - Φ(z - w)]^(k-1) dz
+    z = 8.5 * _Z_NODES; wz = 8.5 * _Z_WEIGHTS * np.exp(-z * z / 2) / np.sqrt(2 * np.pi)
+    inner = np.clip(special.ndtr(z) - special.ndtr(z - np.asarray(w, dtype=float)[..., None]), 0, 1)
+    return k * np.sum(wz * inner ** (k - 1), axis=-1)
+
+
+@functools.lru_cache(maxsize=64)
+def _range_spline(k):
+    w = np.linspace(0, _W_MAX, 4097)
+    return interpolate.CubicSpline(w, _range_cdf(w, k))
+
+
+def studentized_range_sf(q, k, df):
+    """스튜던트화 범위 분포의 생존함수. scipy.stats.studentized_range.sf와 같은 값(오차 ~1e-10)을 벡터로 계산합니다.
+
+    scipy는 원소마다 2중 적분을 수치적으로 풀어 비교 쌍이 수백 개이면 수 초~수 분이 걸립니다. 여기서는
+    집단 수 k별 범위 분포 CDF를 스플라인으로 한 번 만들고, s = √(χ²_df/df)에 대한 바깥 적분을
+    log s 위의 고정 Gauss-Legendre 절점으로 모든 (q, df) 쌍에 대해 한 번에 계산합니다.
+    """
+    q, df = np.broadcast_arrays(np.asarray(q, dtype=float), np.asarray(df, dtype=float))
+    spline = _range_spline(k); cdf = lambda w: np.where(w >= _W_MAX, 1.0, spline(np.minimum(w, _W_MAX)))
+    out = np.empty(q.shape); inf = ~(df < 1e7)
+    out[inf] = 1 - cdf(q[inf])
+    if (~inf).any():
+        v = df[~inf][:, None]; h = v / 2
+        mu = 0.5 * (special.digamma(h) - np.log(h)); sd = 0.5 * np.sqrt(special.polygamma(1, h))
+        lo, hi = mu - 40 * sd, mu + 8 * sd   # log s는 왼쪽 꼬리가 깁니다
+        t = (lo + hi) / 2 + (hi - lo) / 2 * _T_NODES; wt = (hi - lo) / 2 * _T_WEIGHTS
+        dens = np.exp(np.log(2) + h * np.log(h) - special.gammaln(h) + v * t - h * np.exp(2 * t))
+        out[~inf] = 1 - np.sum(wt * dens * cdf(q[~inf][:, None] * np.exp(t)), axis=-1)
+    return np.clip(out, 0, 1)
+
+
+def studentized_range_isf(p, k, df, iters=60):
+    """studentized_range_sf(q, k, df) = p인 q (벡터 이분법)."""
+    df = np.atleast_1d(np.asarray(df, dtype=float)); lo, hi = np.zeros(df.shape), np.full(df.shape, 1e3)
+    for _ in range(iters):
+        mid = (lo + hi) / 2; above = studentized_range_sf(mid, k, df) > p
+        lo = np.where(above, mid, lo); hi = np.where(above, hi, mid)
+    return (lo + hi) / 2
+
+
+def _pairs(gs):
+    # statsmodels pairwise_tukeyhsd와 같은 순서: 정렬된 라벨 기준 (i < j), 차이는 j - i
+    try: order = np.argsort(gs.labels, kind="stable")
+    except TypeError: order = np.arange(gs.k)
+    i, j = np.triu_indices(gs.k, 1)
+    return order[i], order[j]
+
+
+def _posthoc(gs, a, b, se, df, alpha):
+    k = gs.k; diff = gs.cmean[b] - gs.cmean[a]
+    q = np.abs(diff) / se
+    p = studentized_range_sf(q, k, df)
+    # 임계값은 자유도별로 한 번만 계산합니다 (Tukey는 공통 자유도 1개).
+    uniq, inv = np.unique(df, return_inverse=True)
+    crit = studentized_range_isf(alpha, k, uniq)[inv] * se
+    return pd.DataFrame({
+        "group1": gs.labels[a], "group2": gs.labels[b], "meandiff": diff, "se": se, "q": q,
+        "p-adj": p, "lower": diff - crit, "upper": diff + crit, "reject": p < alpha,
+    })
+
+
+def tukey_hsd(gs, fit=None, alpha=0.05):
+    """Tukey-Kramer HSD. 적합된 분산분석(fit)의 MSE와 집단 평균·사례 수를 재사용하여 모든 쌍을 한 번에 비교합니다."""
+    fit = fit or oneway_anova(gs); a, b = _pairs(gs)
+    se = np.sqrt(fit.ms_within / 2 * (1 / gs.n[a] + 1 / gs.n[b]))
+    return _posthoc(gs, a, b, se, np.full(len(a), fit.df_within), alpha)
+
+
+def games_howell(gs, alpha=0.05):
+    """Games-Howell 사후검정 (등분산 가정 위배 시). 쌍별 Welch 자유도를 사용합니다."""
+    a, b = _pairs(gs); va, vb = gs.var[a] / gs.n[a], gs.var[b] / gs.n[b]
+    se = np.sqrt((va + vb) / 2)
+    df = (va + vb) ** 2 / (va ** 2 / (gs.n[a] - 1) + vb ** 2 / (gs.n[b] - 1))
+    return _posthoc(gs, a, b, se, df, alpha)
@@ -0,0 +1,102 @@
+"""업로드 파일 수집(ingestion) 계층.
+
+업로드된 원본 바이트의 해시를 키로 파싱 결과와 변수 메타데이터를 캐시하여,
+Streamlit 재실행(rerun)마다 XLSX/CSV를 다시 파싱하지 않도록 합니다.
+"""
+import hashlib
+import io
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from statera import profiler
+from statera.cache import LRUCache
+
+# 파싱된 데이터프레임 캐시 상한 (기본 1GB, 환경변수로 조정)
+CACHE_MAX_BYTES = int(float(os.environ.get("STATERA_CACHE_MB", "1024")) * 2**20)
+
+
+@dataclass(frozen=True)
+class ColumnMeta:
+    """분석 변수 선택에 필요한 열 단위 요약 정보."""
+    n_rows: int
+    all_cols: tuple
+    num_cols: tuple
+    cat_cols: tuple
+    cardinality: dict
+    missing: dict
+    nbytes: int
+
+
+@dataclass(frozen=True)
+class Dataset:
+    key: str
+    name: str
+    frame: pd.DataFrame
+    meta: ColumnMeta
+
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def frame_nbytes(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def parse_bytes(name, data):
+    buf = io.BytesIO(data)
+    return pd.read_excel(buf) if name.endswith('xlsx') else pd.read_csv(buf)
+
+
+def describe_columns(df):
+    num_cols = tuple(df.select_dtypes(include=[np.number]).columns)
+    return ColumnMeta(
+        n_rows=len(df),
+        all_cols=tuple(df.columns),
+        num_cols=num_cols,
+        cat_cols=tuple(c for c in df.columns if c not in num_cols),
+        cardinality=df.nunique(dropna=True).to_dict(),
+        missing=df.isna().sum().to_dict(),
+        nbytes=frame_nbytes(df),
+    )
+
+
+_DATASETS = LRUCache(CACHE_MAX_BYTES, sizeof=lambda ds: ds.meta.nbytes, data_key=lambda k, v: k)
+# Streamlit file_id -> 내용 해시 (재실행마다 수백 MB를 다시 해싱하지 않기 위함)
+_HASHES = LRUCache(4096, sizeof=lambda _: 1, data_key=lambda k, v: v)
+
+
+def dataset_key(name, data):
+    return f"{content_hash(data)}:{os.path.splitext(name)[1].lower()}"
+
+
+def load_bytes(name, data):
+    """원본 바이트를 파싱하여 Dataset으로 반환합니다. 동일 내용은 캐시에서 재사용합니다."""
+    return _load(dataset_key(name, data), name, lambda: data)
+
+
+def upload_key(up_file):
+    """UploadedFile의 캐시 키. 같은 file_id에 대해서는 해시를 다시 계산하지 않습니다."""
+    file_id = getattr(up_file, "file_id", None)
+    key = _HASHES.get(file_id) if file_id else None
+    if key is None:
+        key = dataset_key(up_file.name, up_file.getvalue())
+        if file_id: _HASHES.put(file_id, key)
+    return key
+
+
+def load_upload(up_file):
+    """st.file_uploader가 반환한 UploadedFile을 캐시된 Dataset으로 변환합니다."""
+    return _load(upload_key(up_file), up_file.name, up_file.getvalue)
+
+
+def _load(key, name, read):
+    cached = _DATASETS.get(key)
+    if cached is not None: return cached
+    data = read()
+    with profiler.stage("parse", format=os.path.splitext(name)[1].lower(), bytes=len(data)):
+        df = parse_bytes(name, data); meta = describe_columns(df)
+    return _DATASETS.put(key, Dataset(key=key, name=name, frame=df, meta=meta))
@@ -0,0 +1,159 @@
+"""분석 작업 실행기: 서버 전체 동시 실행 상한, 대기열, 진행률, 취소.
+
+분석은 Streamlit 스크립트 스레드가 아닌 프로세스 공용 스레드 풀(MAX_JOBS개, 환경변수 STATERA_MAX_JOBS)에서
+실행되며, 상한을 넘는 작업은 제출 순서대로 대기합니다. 세션의 화면은 작업이 도는 동안에도 응답하고,
+진행률과 취소 버튼만 주기적으로 갱신됩니다.
+
+작업 안의 병렬 구간(상관행렬 블록, 부트스트랩 배치, Monte-Carlo 배치)은 parallel_map()으로 작업 내부용 공용
+스레드 풀에 제출하며, 작업 하나가 동시에 쓰는 스레드는 INNER_WORKERS개(기본: 코어 수 // MAX_JOBS)로
+제한합니다. 따라서 동시 실행 작업이 상한까지 차도 계산 스레드 수의 합은 코어 수를 넘지 않습니다.
+
+두 풀 모두 프로세스가 아닌 스레드를 씁니다. 분석 커널(BLAS 행렬곱, scipy 특수함수, numpy 난수 추출)은 계산
+중 GIL을 해제하므로 스레드로도 병렬 실행되고, 작업은 업로드 캐시의 DataFrame이나 대용량 모드의 memory-map
+Arrow 열을 복사·pickle 없이 그대로 참조합니다. 또한 다중 스레드인 서버 프로세스를 fork하지 않습니다.
+
+취소는 협조적입니다. 작업 함수와 엔진의 반복 구간(청크 읽기, Newton 반복, Monte-Carlo·부트스트랩 배치)에서
+checkpoint()/progress()를 호출하면 취소 요청 시 Cancelled 예외로 중단됩니다. 작업 밖에서 호출하면 아무 일도
+하지 않습니다.
+"""
+import contextvars
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from statera import profiler
+
+CPUS = os.cpu_count() or 2
+MAX_JOBS = int(os.environ.get("STATERA_MAX_JOBS", str(max(1, CPUS // 2))))
+INNER_WORKERS = int(os.environ.get("STATERA_INNER_WORKERS", str(max(1, CPUS // MAX_JOBS))))  # 작업당 병렬 작업자 수
+INLINE_WAIT = float(os.environ.get("STATERA_INLINE_WAIT", "1.0"))  # 짧은 작업은 제출한 실행 안에서 기다려 바로 표시 (초)
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+_POOL = ThreadPoolExecutor(MAX_JOBS, thread_name_prefix="statera-job")
+_INNER = ThreadPoolExecutor(MAX_JOBS * INNER_WORKERS, thread_name_prefix="statera-inner")
+_CURRENT = contextvars.ContextVar("statera_job", default=None)
+_IDS = itertools.count(1)
+_QUEUE = []            # 대기 중인 작업 (제출 순서)
+_LOCK = threading.Lock()
+
+
+class Cancelled(Exception):
+    """사용자가 작업을 취소했습니다."""
+
+
+class Job:
+    def __init__(self, label, fn, args, kwargs):
+        self.id, self.label = next(_IDS), label
+        self.status, self.progress, self.message = QUEUED, 0.0, "대기 중"
+        self.result = self.error = self.profile = None   # profile: statera.profiler.Profile (단계별 시간·메모리)
+        self.submitted = time.perf_counter(); self.started = self.finished = None
+        self._cancel = threading.Event()
+        self._future = None
+        self._call = (fn, args, kwargs)
+
+    @property
+    def done(self):
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def elapsed(self):
+        if self.started is None: return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def position(self):
+        """대기열에서의 순번 (1부터, 실행 중이거나 끝났으면 0)."""
+        with _LOCK:
+            return _QUEUE.index(self) + 1 if self in _QUEUE else 0
+
+    def wait(self, timeout=None):
+        """작업이 끝나거나 timeout초가 지날 때까지 기다리고 완료 여부를 반환합니다."""
+        wait([self._future], timeout)
+        return self.done
+
+    def cancel(self):
+        self._cancel.set()
+        # 아직 시작하지 않은 작업은 대기열에서 바로 제거합니다.
+        if self._future is not None and self._future.cancel(): self._finish(CANCELLED, "취소됨")
+
+    def _finish(self, status, message):
+        with _LOCK:
+            if self in _QUEUE: _QUEUE.remove(self)
+        self.status, self.message, self.finished = status, message, time.perf_counter()
+
+    def _run(self):
+        with _LOCK: _QUEUE.remove(self)
+        self.status, self.message, self.started = RUNNING, "실행 중", time.perf_counter()
+        token = _CURRENT.set(self)
+        try:
+            if self.cancelled: raise Cancelled
+            fn, args, kwargs = self._call
+            with profiler.profile(self.label, job=self.id, queued_seconds=round(self.started - self.submitted, 4)) as self.profile:
+                self.result = fn(*args, **kwargs)
+            self.progress = 1.0
+            self._finish(DONE, "완료")
+        except Cancelled:
+            self._finish(CANCELLED, "취소됨")
+        except Exception as e:   # 작업 스레드의 예외는 화면에서 표시하도록 보관합니다.
+            self.error = e; self._finish(FAILED, str(e))
+        finally:
+            _CURRENT.reset(token); self._call = None
+
+
+def submit(label, fn, *args, **kwargs):
+    """fn(*args, **kwargs)을 작업 풀에 제출하고 Job을 반환합니다."""
+    job = Job(label, fn, args, kwargs)
+    with _LOCK: _QUEUE.append(job)
+    job._future = _POOL.submit(job._run)
+    return job
+
+
+def queued():
+    """서버 전체의 대기 작업 수."""
+    with _LOCK: return len(_QUEUE)
+
+
+def checkpoint():
+    """현재 작업에 취소 요청이 있으면 Cancelled를 발생시킵니다."""
+    job = _CURRENT.get()
+    if job is not None and job.cancelled: raise Cancelled
+
+
+def checked(iterable):
+    """각 항목을 넘겨주기 전에 취소 여부를 확인하며 iterable을 순회합니다 (청크·배치 반복용)."""
+    for item in iterable:
+        checkpoint(); yield item
+
+
+def progress(fraction, message=None, stage=None):
+    """현재 작업의 진행률(0~1)과 단계 메시지를 기록하고 취소 여부를 확인합니다.
+    stage를 주면 계측 단계(statera.profiler)도 그 이름으로 바꿉니다."""
+    if stage: profiler.mark(stage)
+    job = _CURRENT.get()
+    if job is None: return
+    job.progress = min(max(float(fraction), job.progress), 1.0)
+    if message: job.message = message
+    checkpoint()
+
+
+def parallel_map(fn, items, workers=None):
+    """items를 작업 내부용 공용 스레드 풀에서 fn으로 처리한 결과 목록 (입력 순서).
+    한 번에 workers개(기본 INNER_WORKERS)까지만 제출하며, 결과를 받을 때마다 취소 여부를 확인합니다."""
+    items, limit = list(items), workers or INNER_WORKERS
+    if limit <= 1 or len(items) <= 1: return [fn(item) for item in checked(items)]
+    pending, out = deque(), []
+    try:
+        for item in items:
+            if len(pending) >= limit: out.append(pending.popleft().result()); checkpoint()
+            pending.append(_INNER.submit(fn, item))
+        while pending: out.append(pending.popleft().result()); checkpoint()
+    finally:
+        for f in pending: f.cancel()
+    return out
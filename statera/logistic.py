@@ -0,0 +1,153 @@
+"""캐시와 warm start를 사용하는 로지스틱 회귀 추정 서비스.
+
+Newton-Raphson(= IRLS)으로 최대우도 추정을 수행하며 반복마다 로그우도, 계수 변화량, 소요 시간을
+기록합니다. 적합 결과는 (데이터 해시, 종속변수, 독립변수) 기준으로 세션 간 공유 LRU 캐시에 저장되고,
+같은 데이터·종속변수로 독립변수를 추가하거나 뺀 모형은 공유 변수가 가장 많은 캐시 모형의 계수에서
+시작합니다(새 변수는 0). 캐시 모형이 없으면 절편만 있는 모형의 해(log(p̄/(1-p̄)))에서 시작합니다.
+"""
+import dataclasses
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import linalg, special, stats
+
+from statera import jobs
+from statera.cache import LRUCache
+
+MAX_ITER = 35
+TOL = 1e-8
+FIT_CACHE_ENTRIES = int(os.environ.get("STATERA_LOGIT_CACHE", "256"))
+_FITS = LRUCache(FIT_CACHE_ENTRIES, sizeof=lambda _: 1, data_key=lambda k, v: k[0])
+
+
+@dataclass(frozen=True)
+class Iteration:
+    iteration: int
+    loglike: float
+    step: float      # 계수 변화량의 최대 절댓값
+    seconds: float
+
+
+@dataclass(frozen=True)
+class LogitResult:
+    """statsmodels LogitResults와 같은 이름의 요약 통계량과 추정 과정 기록."""
+    nobs: int
+    params: pd.Series
+    bse: pd.Series
+    llf: float
+    llnull: float
+    converged: bool
+    iterations: tuple
+    warm_start: tuple = None   # 시작값으로 사용한 캐시 모형의 독립변수 (없으면 None)
+    cached: bool = False       # 캐시된 결과를 그대로 반환했는지 여부
+
+    @property
+    def df_model(self):
+        return float(len(self.params) - 1)
+
+    @property
+    def pvalues(self):
+        return pd.Series(2 * stats.norm.sf(np.abs(self.params / self.bse)), index=self.params.index)
+
+    @property
+    def llr(self):
+        return 2 * (self.llf - self.llnull)
+
+    @property
+    def llr_pvalue(self):
+        return stats.chi2.sf(self.llr, self.df_model)
+
+    @property
+    def prsquared(self):
+        return 1 - self.llf / self.llnull
+
+    @property
+    def seconds(self):
+        return sum(it.seconds for it in self.iterations)
+
+    def conf_int(self, alpha=0.05):
+        q = stats.norm.ppf(1 - alpha / 2)
+        return pd.DataFrame({0: self.params - q * self.bse, 1: self.params + q * self.bse})
+
+    def trace(self):
+        """반복별 추정 기록 표 (대시보드·리포트용)."""
+        return pd.DataFrame({
+            "Iteration (반복)": [it.iteration for it in self.iterations],
+            "Log-Likelihood (로그우도)": [round(it.loglike, 4) for it in self.iterations],
+            "Max |Δβ| (계수 변화)": [f"{it.step:.2e}" for it in self.iterations],
+            "Time ms (소요시간)": [round(it.seconds * 1000, 2) for it in self.iterations],
+        })
+
+
+def _loglike(X, y, beta):
+    eta = X @ beta
+    return float(np.sum(y * eta - np.logaddexp(0, eta)))
+
+
+def newton(X, y, start, max_iter=MAX_ITER, tol=TOL):
+    """Newton-Raphson 최대우도 추정. (계수, 공분산 행렬, 로그우도, 수렴 여부, 반복 기록) 반환."""
+    beta = np.asarray(start, dtype=float).copy(); ll = _loglike(X, y, beta)
+    history, converged, cov = [], False, None
+    for it in jobs.checked(range(1, max_iter + 1)):
+        t0 = time.perf_counter()
+        mu = special.expit(X @ beta); w = mu * (1 - mu)
+        H = (X * w[:, None]).T @ X; grad = X.T @ (y - mu)
+        try:
+            cho = linalg.cho_factor(H, lower=True); step = linalg.cho_solve(cho, grad)
+        except linalg.LinAlgError:
+            step = linalg.lstsq(H, grad)[0]
+        # 로그우도가 감소하면 보폭을 절반씩 줄입니다 (완전 분리에 가까운 자료에서의 발산 방지).
+        new_ll = _loglike(X, y, beta + step); halvings = 0
+        while new_ll < ll and halvings < 20:
+            step /= 2; new_ll = _loglike(X, y, beta + step); halvings += 1
+        beta += step; ll = new_ll
+        change = float(np.max(np.abs(step)))
+        history.append(Iteration(it, ll, change, time.perf_counter() - t0))
+        if change < tol: converged = True; break
+    mu = special.expit(X @ beta); w = mu * (1 - mu)
+    H = (X * w[:, None]).T @ X
+    try: cov = linalg.inv(H)
+    except linalg.LinAlgError: cov = linalg.pinvh(H)
+    return beta, cov, ll, converged, tuple(history)
+
+
+def _warm_start(data_key, y, xs):
+    """공유 독립변수가 가장 많고(동률이면 불필요한 변수가 적은) 캐시 모형을 찾습니다."""
+    best, best_score = None, (0, 0)
+    for key in _FITS.keys():
+        if key[:2] != (data_key, y): continue
+        shared = len(set(key[2]) & set(xs))
+        score = (shared, -len(set(key[2]) - set(xs)))
+        if shared and score > best_score:
+            fit = _FITS.get(key)
+            if fit is not None and fit.converged: best, best_score = fit, score
+    return best
+
+
+def fit(df, y, xs, data_key=None):
+    """결측 행을 목록별로 제외한 y ~ const + xs 로지스틱 회귀. data_key가 있으면 캐시와 warm start를 사용합니다."""
+    xs = list(xs); cols = xs + [y]
+    key = (data_key, y, tuple(xs))
+    if data_key is not None:
+        cached = _FITS.get(key)
+        if cached is not None: return dataclasses.replace(cached, cached=True)
+    data = df[cols].apply(pd.to_numeric, errors="coerce").dropna()
+    yv = data[y].to_numpy(dtype=float)
+    if not np.isin(yv, (0.0, 1.0)).all(): raise ValueError("종속변수는 0과 1로 코딩되어야 합니다.")
+    if len(yv) < len(xs) + 2: raise ValueError(f"결측 없는 사례가 {len(yv)}개로, 예측변수 {len(xs)}개의 회귀분석에는 {len(xs) + 2}개 이상이 필요합니다.")
+    if yv.min() == yv.max(): raise ValueError("종속변수에 0과 1이 모두 있어야 합니다.")
+    X = np.column_stack([np.ones(len(data)), data[xs].to_numpy(dtype=float)])
+    ybar = yv.mean(); names = ["const"] + xs
+    llnull = float(len(yv) * (special.xlogy(ybar, ybar) + special.xlogy(1 - ybar, 1 - ybar)))
+    start = pd.Series(0.0, index=names); start["const"] = special.logit(np.clip(ybar, 1e-10, 1 - 1e-10))
+    warm = _warm_start(data_key, y, xs) if data_key is not None else None
+    if warm is not None:
+        shared = warm.params.index.intersection(names); start[shared] = warm.params[shared]
+    beta, cov, llf, converged, history = newton(X, yv, start.to_numpy())
+    result = LogitResult(len(yv), pd.Series(beta, index=names), pd.Series(np.sqrt(np.diag(cov)), index=names),
+                         llf, llnull, converged, history,
+                         tuple(c for c in warm.params.index if c != "const") if warm is not None else None)
+    return _FITS.put(key, result) if data_key is not None else result
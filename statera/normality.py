@@ -0,0 +1,130 @@
+"""표본 크기에 따라 검정을 선택하는 정규성 가정 검정 엔진.
+
+Shapiro-Wilk는 N > 5000에서 p값이 부정확하고(SciPy 경고) 대표본에서는 느립니다.
+사례 수가 SHAPIRO_MAX_N 이하이면 Shapiro-Wilk를, 초과하면 LARGE_TEST(기본 D'Agostino K²)를 사용합니다.
+- dagostino / jarque_bera: 집단별 2~4차 중심적률을 np.bincount로 한 번에 계산 (정렬 없음)
+- anderson: (집단, 값) 정렬 한 번으로 모든 집단의 Anderson-Darling A²와 근사 p값 계산
+SUBSAMPLE > 0이면 대표본에서도 시드 고정 무작위 표본(SUBSAMPLE개)에 Shapiro-Wilk를 적용합니다.
+
+새 검정은 register(name, label, func)로 추가합니다. func(codes, y, n)은 집단별 (통계량, p값) 배열을 반환합니다.
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import special, stats
+
+SHAPIRO_MAX_N = int(os.environ.get("STATERA_SHAPIRO_MAX_N", "5000"))
+LARGE_TEST = os.environ.get("STATERA_NORMALITY_TEST", "dagostino")
+SUBSAMPLE = int(os.environ.get("STATERA_NORMALITY_SUBSAMPLE", "0"))
+SEED = 0
+
+
+@dataclass(frozen=True)
+class NormalityResult:
+    test: str          # 메시지에 표시할 검정 이름
+    statistic: float
+    p: float
+    n: int             # 검정에 사용한 사례 수 (표본 추출 시 표본 크기)
+
+
+def _moments(codes, y, n):
+    k = len(n)
+    with np.errstate(all="ignore"):
+        mean = np.bincount(codes, y, minlength=k) / n
+        d = y - mean[codes]; d2 = d * d
+        m2 = np.bincount(codes, d2, minlength=k) / n
+        m3 = np.bincount(codes, d2 * d, minlength=k) / n
+        m4 = np.bincount(codes, d2 * d2, minlength=k) / n
+        return m3 / m2 ** 1.5, m4 / m2 ** 2
+
+
+def _dagostino(codes, y, n):
+    # scipy.stats.normaltest(skewtest + kurtosistest)의 벡터화
+    skew, kurt = _moments(codes, y, n)
+    with np.errstate(all="ignore"):
+        n = n.astype(float)
+        t = skew * np.sqrt((n + 1) * (n + 3) / (6 * (n - 2)))
+        beta2 = 3 * (n * n + 27 * n - 70) * (n + 1) * (n + 3) / ((n - 2) * (n + 5) * (n + 7) * (n + 9))
+        w2 = -1 + np.sqrt(2 * (beta2 - 1)); delta = 1 / np.sqrt(0.5 * np.log(w2)); alpha = np.sqrt(2 / (w2 - 1))
+        t = np.where(t == 0, 1, t)
+        zs = delta * np.log(t / alpha + np.sqrt((t / alpha) ** 2 + 1))
+        e = 3 * (n - 1) / (n + 1); var = 24 * n * (n - 2) * (n - 3) / ((n + 1) ** 2 * (n + 3) * (n + 5))
+        x = (kurt - e) / np.sqrt(var)
+        sb1 = 6 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9)) * np.sqrt(6 * (n + 3) * (n + 5) / (n * (n - 2) * (n - 3)))
+        a = 6 + 8 / sb1 * (2 / sb1 + np.sqrt(1 + 4 / sb1 ** 2))
+        denom = 1 + x * np.sqrt(2 / (a - 4))
+        term2 = np.sign(denom) * np.where(denom == 0, np.nan, ((1 - 2 / a) / np.abs(denom)) ** (1 / 3))
+        zk = (1 - 2 / (9 * a) - term2) / np.sqrt(2 / (9 * a))
+        k2 = zs * zs + zk * zk
+    return k2, stats.chi2.sf(k2, 2)
+
+
+def _jarque_bera(codes, y, n):
+    skew, kurt = _moments(codes, y, n)
+    jb = n / 6 * (skew ** 2 + (kurt - 3) ** 2 / 4)
+    return jb, stats.chi2.sf(jb, 2)
+
+
+def _anderson(codes, y, n):
+    # 평균·표준편차를 추정한 정규성 A² (scipy.stats.anderson과 동일)와 D'Agostino-Stephens(1986) p값 근사
+    k = len(n); order = np.lexsort((y, codes)); c = codes[order]; ys = y[order]
+    with np.errstate(all="ignore"):
+        mean = np.bincount(c, ys, minlength=k) / n
+        sd = np.sqrt(np.bincount(c, (ys - mean[c]) ** 2, minlength=k) / (n - 1))
+        z = (ys - mean[c]) / sd[c]
+        start = np.r_[0, np.cumsum(n)[:-1]]; i = np.arange(len(ys)) - start[c]
+        mirror = start[c] + n[c] - 1 - i
+        terms = (2 * i + 1) * (special.log_ndtr(z) + special.log_ndtr(-z[mirror]))
+        a2 = -n - np.bincount(c, terms, minlength=k) / n
+        a = a2 * (1 + 0.75 / n + 2.25 / n ** 2)
+        p = np.select([a >= 0.6, a >= 0.34, a >= 0.2],
+                      [np.exp(1.2937 - 5.709 * a + 0.0186 * a * a), np.exp(0.9177 - 4.279 * a - 1.38 * a * a),
+                       1 - np.exp(-8.318 + 42.796 * a - 59.938 * a * a)],
+                      1 - np.exp(-13.436 + 101.14 * a - 223.73 * a * a))
+    return a2, np.clip(p, 0, 1)
+
+
+TESTS = {
+    "dagostino": ("D'Agostino K²", _dagostino),
+    "jarque_bera": ("Jarque-Bera", _jarque_bera),
+    "anderson": ("Anderson-Darling", _anderson),
+}
+
+
+def register(name, label, func):
+    """대표본용 정규성 검정을 등록합니다. LARGE_TEST 또는 check(..., method=name)로 선택합니다."""
+    TESTS[name] = (label, func)
+
+
+def _shapiro(x):
+    if len(x) < 3: return NormalityResult("Shapiro-Wilk", np.nan, np.nan, len(x))
+    w, p = stats.shapiro(x)
+    return NormalityResult("Shapiro-Wilk", float(w), float(p), len(x))
+
+
+def check_groups(codes, y, method=None, subsample=None, seed=SEED):
+    """집단 코드(0..k-1)별 정규성 검정 결과 목록. 대표본 집단은 한 번의 벡터화 계산으로 처리합니다."""
+    codes = np.asarray(codes, dtype=np.int64); y = np.asarray(y, dtype=float)
+    method = method or LARGE_TEST; subsample = SUBSAMPLE if subsample is None else subsample
+    n = np.bincount(codes); results = [None] * len(n)
+    large = n > SHAPIRO_MAX_N
+    if (~large).any() or subsample:
+        order = np.argsort(codes, kind="stable"); parts = np.split(y[order], np.cumsum(n)[:-1])
+        rng = np.random.default_rng(seed)
+        for j in np.flatnonzero(~large | bool(subsample)):
+            x = parts[j]
+            if large[j]: x = rng.choice(x, size=min(subsample, len(x)), replace=False)
+            results[j] = _shapiro(x)
+    if large.any() and not subsample:
+        label, func = TESTS[method]; stat, p = func(codes, y, n)
+        for j in np.flatnonzero(large):
+            results[j] = NormalityResult(label, float(stat[j]), float(p[j]), int(n[j]))
+    return results
+
+
+def check(values, method=None, subsample=None, seed=SEED):
+    """결측을 제외한 한 변수(또는 잔차)의 정규성 검정."""
+    y = np.asarray(values, dtype=float); y = y[~np.isnan(y)]
+    if not y.size: return NormalityResult("Shapiro-Wilk", np.nan, np.nan, 0)
+    return check_groups(np.zeros(len(y), dtype=np.int64), y, method, subsample, seed)[0]
@@ -0,0 +1,160 @@
+"""분석 결과 시각화 계층.
+
+pyplot 전역 상태 대신 matplotlib 객체지향 Figure API를 사용하므로 동시 세션에서도 안전합니다.
+대시보드에는 화면 해상도의 미리보기(PNG)만 렌더링하고, 300dpi PNG·SVG는 리포트/다운로드에서
+요청될 때만 렌더링합니다. 렌더링 결과는 (그림 종류, 변수, 데이터 해시, 형식, 해상도)로 캐시됩니다.
+
+사례 수가 LARGE_N을 넘으면 대용량 그리기 방식으로 전환합니다. 통계량(히스토그램, 밀도, 회귀선, 상자)은
+항상 전체 데이터로 계산하고, 점 표본은 화면 표시용으로만 집단별 층화 추출합니다.
+- 히스토그램: scipy KDE 대신 선형 binning + FFT 합성곱 커널 밀도
+- 산점도/회귀선: 육각 binning(hexbin) 밀도 + 해석적 OLS 회귀선과 평균 반응 95% 신뢰대 (부트스트랩 없음)
+- 상자그림: 전체 데이터의 상자 + 집단별 층화 표본 점
+"""
+import hashlib
+import io
+import os
+
+import matplotlib
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.figure import Figure
+from scipy import stats
+
+from statera import profiler
+from statera.cache import LRUCache
+
+matplotlib.rcParams['font.family'] = 'sans-serif'
+matplotlib.rcParams['axes.unicode_minus'] = False
+sns.set_theme(style="whitegrid")
+
+PREVIEW_DPI = int(os.environ.get("STATERA_PREVIEW_DPI", "110"))
+EXPORT_DPI = 300
+LARGE_N = int(os.environ.get("STATERA_LARGE_N", "20000"))
+DISPLAY_POINTS = 3000
+PLOT_CACHE_BYTES = int(float(os.environ.get("STATERA_PLOT_CACHE_MB", "256")) * 2**20)
+_RENDERS = LRUCache(PLOT_CACHE_BYTES, sizeof=len)
+
+
+def data_key(data):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(getattr(data, "columns", getattr(data, "name", None))).encode())
+    h.update(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+class Plot:
+    """그리기 함수와 캐시 키를 묶은 지연 렌더링 그림."""
+
+    def __init__(self, kind, columns, data, draw, figsize):
+        self.key = (kind, tuple(columns), data_key(data))
+        self._draw, self._figsize = draw, figsize
+        # 그리기 함수가 참조하는 데이터 크기 (결과 저장소의 메모리 상한 계산용)
+        self.nbytes = int(np.sum(data.memory_usage(index=True, deep=True)))
+
+    def render(self, fmt="png", dpi=PREVIEW_DPI):
+        cache_key = (*self.key, fmt, dpi)
+        cached = _RENDERS.get(cache_key)
+        if cached is not None: return cached
+        with profiler.stage("plot", kind=self.key[0], fmt=fmt, dpi=dpi):
+            fig = Figure(figsize=self._figsize); self._draw(fig.add_subplot())
+            buf = io.BytesIO(); fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches='tight')
+        return _RENDERS.put(cache_key, buf.getvalue())
+
+    def preview(self):
+        """대시보드용 화면 해상도 PNG."""
+        return self.render()
+
+    def export(self, fmt="png"):
+        """리포트용 인쇄 해상도 PNG(기본) 또는 벡터 형식(svg/pdf)."""
+        return self.render(fmt, EXPORT_DPI)
+
+
+def binned_kde(x, gridsize=512, cut=3):
+    """Scott 대역폭 가우시안 KDE를 선형 binning과 FFT 합성곱으로 O(N + G log G)에 계산합니다."""
+    n = x.size; bw = x.std(ddof=1) * n ** (-1 / 5)
+    if not np.isfinite(bw) or bw <= 0: return None, None
+    lo, hi = x.min() - cut * bw, x.max() + cut * bw
+    grid = np.linspace(lo, hi, gridsize); delta = grid[1] - grid[0]
+    pos = (x - lo) / delta; idx = np.clip(np.floor(pos).astype(np.int64), 0, gridsize - 2); w = pos - idx
+    counts = np.bincount(idx, 1 - w, minlength=gridsize) + np.bincount(idx + 1, w, minlength=gridsize)
+    half = min(gridsize - 1, int(np.ceil(4 * bw / delta)))
+    kern = np.exp(-0.5 * (np.arange(-half, half + 1) * delta / bw) ** 2) / (bw * np.sqrt(2 * np.pi))
+    nfft = 1 << int(np.ceil(np.log2(gridsize + 2 * half + 1)))
+    dens = np.fft.irfft(np.fft.rfft(counts, nfft) * np.fft.rfft(kern, nfft), nfft)[half:half + gridsize]
+    return grid, np.clip(dens, 0, None) / n
+
+
+def ols_band(x, y, grid, level=0.95):
+    """단순회귀 적합값과 평균 반응의 해석적 신뢰구간 (sns.regplot의 부트스트랩 대체)."""
+    n = x.size; xm, ym = x.mean(), y.mean()
+    sxx = ((x - xm) ** 2).sum(); b1 = ((x - xm) * (y - ym)).sum() / sxx; b0 = ym - b1 * xm
+    s = np.sqrt(((y - b0 - b1 * x) ** 2).sum() / (n - 2))
+    fit = b0 + b1 * grid
+    half = stats.t.ppf((1 + level) / 2, n - 2) * s * np.sqrt(1 / n + (grid - xm) ** 2 / sxx)
+    return fit, fit - half, fit + half
+
+
+def stratified_sample(df, by, n, seed=0):
+    """집단(by)별 비율을 유지하되 작은 집단도 최소 1행을 남기는 표시용 층화 표본."""
+    if len(df) <= n: return df
+    codes, _ = pd.factorize(df[by], use_na_sentinel=False)
+    sizes = np.bincount(codes)
+    quota = np.maximum(1, np.round(sizes * n / len(df))).astype(np.int64)
+    order = np.lexsort((np.random.default_rng(seed).random(len(df)), codes))
+    starts = np.r_[0, np.cumsum(sizes)[:-1]]
+    rank = np.empty(len(df), dtype=np.int64); rank[order] = np.arange(len(df)) - starts[codes[order]]
+    return df[rank < quota[codes]]
+
+
+def _large_hist(ax, x):
+    ax.set_xlabel(x.name); x = x.to_numpy(dtype=float)
+    edges = np.histogram_bin_edges(x, bins="auto")
+    if len(edges) > 201: edges = np.histogram_bin_edges(x, bins=200)
+    ax.hist(x, bins=edges, color="#0d9488", alpha=.75); ax.set_ylabel("Count")
+    grid, dens = binned_kde(x)
+    if grid is not None: ax.plot(grid, dens * x.size * (edges[1] - edges[0]), color="#0d9488")
+
+
+def _large_reg(ax, data, x, y):
+    data = data.dropna(); xv, yv = data[x].to_numpy(dtype=float), data[y].to_numpy(dtype=float)
+    hb = ax.hexbin(xv, yv, gridsize=60, mincnt=1, cmap="Blues", bins="log")
+    ax.figure.colorbar(hb, ax=ax, label="N (log)")
+    grid = np.linspace(xv.min(), xv.max(), 200)
+    fit, lower, upper = ols_band(xv, yv, grid)
+    ax.plot(grid, fit, color="red"); ax.fill_between(grid, lower, upper, color="red", alpha=.15)
+    ax.set_xlabel(x); ax.set_ylabel(y)
+
+
+def _large_box(ax, data, g, y):
+    order = pd.unique(data[g].dropna())
+    order = sorted(order) if pd.api.types.is_numeric_dtype(data[g]) else list(order)
+    sns.boxplot(x=g, y=y, data=data, order=order, showfliers=False, ax=ax)
+    shown = stratified_sample(data.dropna(), g, DISPLAY_POINTS)
+    sns.stripplot(x=g, y=y, data=shown, order=order, size=2, alpha=.3, color="#334155", ax=ax)
+
+
+def histogram(x):
+    if len(x) > LARGE_N: return Plot("hist-large", [x.name], x, lambda ax: _large_hist(ax, x), (6, 3))
+    return Plot("hist", [x.name], x, lambda ax: sns.histplot(x, kde=True, color="#0d9488", ax=ax), (6, 3))
+
+
+def boxplot(df, g, y):
+    data = df[[g, y]]
+    if len(data) > LARGE_N: return Plot("box-large", [g, y], data, lambda ax: _large_box(ax, data, g, y), (5, 4))
+    return Plot("box", [g, y], data, lambda ax: sns.boxplot(x=g, y=y, data=data, ax=ax), (5, 4))
+
+
+def regplot(df, x, y):
+    data = df[[x, y]]
+    if len(data) > LARGE_N: return Plot("reg-large", [x, y], data, lambda ax: _large_reg(ax, data, x, y), (6, 5))
+    return Plot("reg", [x, y], data, lambda ax: sns.regplot(x=data[x], y=data[y], line_kws={"color": "red"}, ax=ax), (6, 5))
+
+
+HEATMAP_ANNOT_MAX = 20
+
+
+def heatmap(corr):
+    # 변수가 많으면(예: 300문항) 셀 숫자 표기를 생략합니다. 셀마다 텍스트 객체를 그리는 비용이 p²에 비례합니다.
+    annot = len(corr.columns) <= HEATMAP_ANNOT_MAX
+    return Plot("heatmap", list(corr.columns), corr, lambda ax: sns.heatmap(corr, annot=annot, cmap="coolwarm", ax=ax), (7, 5))
@@ -0,0 +1,133 @@
+"""단계별 실행 시간·최대 메모리 계측 (parse, compute, assumptions, plot, report).
+
+분석 작업 하나가 Profile 하나로 기록됩니다 (statera.jobs가 작업마다 profile()을 엽니다). 작업 안에서 mark()나
+jobs.progress(..., stage=)로 단계 이름을 바꾸면 직전 단계가 닫히고, stage()는 블록 하나를 한 단계로 잽니다.
+작업 밖에서 실행된 stage()(업로드 파싱, 그림 렌더링, 리포트 생성)는 그 단계만 담은 Profile로 기록됩니다.
+
+끝난 Profile은 최근 기록(디버그 패널용)에 남고 'statera.perf' 로거에 JSON 한 줄로 출력됩니다.
+STATERA_PERF_LOG에 파일 경로를 지정하면 그 파일에 JSON Lines로 기록합니다.
+
+최대 메모리는 STATERA_TRACE_MEMORY=1일 때만 tracemalloc으로 잽니다 (모든 할당을 추적하는 비용이 들기 때문).
+tracemalloc의 최대값은 프로세스 전체 기준이므로 여러 작업이 동시에 실행되면 근사치입니다.
+"""
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import time
+import tracemalloc
+from collections import deque
+
+TRACE_MEMORY = os.environ.get("STATERA_TRACE_MEMORY", "0") == "1"
+PERF_LOG = os.environ.get("STATERA_PERF_LOG", "")
+RECENT_MAX = 200
+
+logger = logging.getLogger("statera.perf")
+_RECENT = deque(maxlen=RECENT_MAX)
+_CURRENT = contextvars.ContextVar("statera_profile", default=None)
+
+if PERF_LOG:
+    _handler = logging.FileHandler(PERF_LOG, encoding="utf-8"); _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler); logger.setLevel(logging.INFO)
+if TRACE_MEMORY and not tracemalloc.is_tracing(): tracemalloc.start()
+
+
+def _memory_base():
+    if not tracemalloc.is_tracing(): return None
+    tracemalloc.reset_peak(); return tracemalloc.get_traced_memory()[0]
+
+
+def _peak_since(base):
+    if base is None or not tracemalloc.is_tracing(): return None
+    return max(0, tracemalloc.get_traced_memory()[1] - base)
+
+
+class Profile:
+    """한 작업(또는 단독 단계)의 단계별 (이름, 초, 최대 메모리 바이트) 기록."""
+
+    def __init__(self, label, **meta):
+        self.label, self.meta = label, meta
+        self.stages = []
+        self.started = time.time(); self.seconds = self.error = None
+        self._t0 = time.perf_counter(); self._open = None   # (단계, 시작 시각, 시작 메모리)
+
+    @property
+    def current(self):
+        return self._open[0] if self._open else None
+
+    def mark(self, name):
+        """열린 단계를 닫고 name 단계를 시작합니다 (None이면 닫기만, 같은 단계면 그대로 유지)."""
+        if name is not None and name == self.current: return
+        now = time.perf_counter()
+        if self._open is not None:
+            stage, start, base = self._open
+            self.stages.append((stage, now - start, _peak_since(base)))
+        self._open = (name, now, _memory_base()) if name else None
+
+    def close(self):
+        self.mark(None); self.seconds = time.perf_counter() - self._t0
+
+    def to_dict(self):
+        return {"label": self.label, "started": round(self.started, 3), "seconds": self.seconds, "error": self.error,
+                "meta": self.meta, "stages": [{"stage": s, "seconds": t, "peak_bytes": m} for s, t, m in self.stages]}
+
+    def rows(self):
+        """디버그 패널용 단계 표 (같은 이름의 단계는 합산)."""
+        total = {}
+        for s, t, m in self.stages:
+            prev = total.get(s, (0.0, None))
+            total[s] = (prev[0] + t, m if prev[1] is None else max(prev[1], m or 0))
+        return [{"Record (기록)": self.label, "Stage (단계)": s, "Time ms (시간)": round(t * 1000, 2),
+                 "Peak MB (최대 메모리)": None if m is None else round(m / 2**20, 2)} for s, (t, m) in total.items()]
+
+
+def record(prof):
+    entry = prof.to_dict()
+    _RECENT.append(entry)
+    if logger.isEnabledFor(logging.INFO): logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+
+
+@contextlib.contextmanager
+def profile(label, **meta):
+    """블록을 하나의 Profile로 계측하고, 끝나면 최근 기록과 로그에 남깁니다."""
+    prof = Profile(label, **meta); token = _CURRENT.set(prof)
+    try:
+        yield prof
+    except BaseException as e:
+        prof.error = type(e).__name__; raise
+    finally:
+        _CURRENT.reset(token); prof.close(); record(prof)
+
+
+def current():
+    return _CURRENT.get()
+
+
+def mark(name):
+    """현재 Profile의 단계를 name으로 바꿉니다. Profile 밖에서는 아무 일도 하지 않습니다."""
+    prof = _CURRENT.get()
+    if prof is not None: prof.mark(name)
+
+
+@contextlib.contextmanager
+def stage(name, **meta):
+    """블록을 name 단계로 계측합니다. Profile 밖이면 이 단계만 담은 Profile(meta 포함)로 기록합니다."""
+    prof = _CURRENT.get()
+    if prof is None:
+        with profile(name, **meta) as prof:
+            prof.mark(name); yield
+        return
+    prev = prof.current; prof.mark(name)
+    try: yield
+    finally: prof.mark(prev)
+
+
+def recent():
+    """최근 기록 (오래된 것부터, dict 목록)."""
+    return list(_RECENT)
+
+
+def export_jsonl():
+    """최근 기록을 JSON Lines 바이트로 반환합니다."""
+    return "".join(json.dumps(e, ensure_ascii=False, default=str) + "\n" for e in recent()).encode()
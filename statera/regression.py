@@ -0,0 +1,168 @@
+"""충분통계량(Gram 행렬) 기반 선형 회귀분석 엔진.
+
+sm.OLS처럼 N×p 설계행렬과 잔차 벡터를 만들지 않고, 데이터를 청크 단위로 훑으며
+streaming.RegressionGram에 [X, y]의 평균·공적률 행렬(Chan 병합, 중심화)과 인접 행 차분의 Gram 행렬을
+누적합니다. 계수/SE/t/p, 회귀 ANOVA 표, R²/수정 R², VIF, Durbin-Watson은 모두 이 p×p 행렬에서
+계산되므로 메모리는 행 수와 무관하게 O(p²)이며, CSV에서 직접 스트리밍할 수도 있습니다.
+
+VIF는 예측변수 상관행렬 R의 역행렬 대각원소와 같습니다(VIF_j = [R⁻¹]_jj = 1 / (1 - R²_j)).
+예측변수마다 보조 OLS를 적합하는 statsmodels variance_inflation_factor(p번의 N행 회귀) 대신,
+중심화된 Gram 행렬을 한 번 만들고 p×p 상관행렬을 Cholesky 분해하여 모든 VIF를 한 번에 구합니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import linalg, stats
+
+from statera.streaming import CHUNK_ROWS, RegressionGram
+
+# 상관행렬 조건수가 이 값을 넘으면 Cholesky 역행렬 대신 변수별 최소제곱으로 R²_j를 구합니다.
+COND_LIMIT = 1e10
+# 1 - R²_j가 이 값 이하이면 완전 공선성으로 보고 VIF를 inf로 둡니다.
+SINGULAR_TOL = 1e-12
+
+
+@dataclass(frozen=True)
+class VIFResult:
+    vif: pd.Series       # 예측변수별 VIF (상수 열은 NaN, 완전 공선성은 inf)
+    condition: float     # 예측변수 상관행렬의 조건수
+    singular: bool       # 조건수 상한 초과로 대체 경로를 사용했는지 여부
+
+    @property
+    def max(self):
+        v = self.vif.dropna()
+        return float(v.max()) if len(v) else 1.0
+
+
+def centered_gram(X):
+    """열 평균으로 중심화한 Gram 행렬 Xc'Xc."""
+    X = np.asarray(X, dtype=float); Xc = X - X.mean(axis=0)
+    return Xc.T @ Xc
+
+
+def _r2_lstsq(R):
+    # 변수 j의 R²_j = r_j' R_{-j}⁺ r_j (나머지 변수 상관행렬의 최소제곱 해). p×p 크기에서만 동작합니다.
+    p = len(R); r2 = np.empty(p)
+    for j in range(p):
+        rest = np.arange(p) != j
+        if not rest.any(): r2[j] = 0.0; continue
+        beta = linalg.lstsq(R[np.ix_(rest, rest)], R[rest, j], cond=None)[0]
+        r2[j] = R[j, rest] @ beta
+    return r2
+
+
+def vif_from_gram(S, names):
+    """중심화된 Gram(또는 공분산) 행렬에서 모든 VIF를 계산합니다."""
+    S = np.asarray(S, dtype=float); d = np.sqrt(np.diag(S))
+    live = d > 0; out = np.full(len(d), np.nan)
+    if live.any():
+        R = S[np.ix_(live, live)] / np.outer(d[live], d[live])
+        eig = linalg.eigvalsh(R)
+        cond = float(eig[-1] / eig[0]) if eig[0] > 0 else np.inf
+        singular = not cond < COND_LIMIT
+        if not singular:
+            # R = LL' → diag(R⁻¹) = L⁻¹ 각 열의 제곱합
+            Linv = linalg.solve_triangular(linalg.cholesky(R, lower=True), np.eye(len(R)), lower=True)
+            out[live] = (Linv ** 2).sum(axis=0)
+        else:
+            tol = 1 - _r2_lstsq(R)
+            with np.errstate(divide="ignore"):
+                out[live] = np.where(tol > SINGULAR_TOL, 1 / np.maximum(tol, SINGULAR_TOL), np.inf)
+    else:
+        cond, singular = np.nan, False
+    return VIFResult(pd.Series(out, index=list(names)), cond, singular)
+
+
+def vif(X):
+    """상수항을 제외한 예측변수 DataFrame의 VIF (statsmodels variance_inflation_factor와 동일한 값).
+
+    결측이 있는 행은 목록별로 제외합니다.
+    """
+    X = pd.DataFrame(X).dropna()
+    return vif_from_gram(centered_gram(X.to_numpy(dtype=float)), X.columns)
+
+
+@dataclass(frozen=True)
+class OLSResult:
+    """statsmodels RegressionResults와 같은 이름의 요약 통계량."""
+    nobs: int
+    params: pd.Series
+    bse: pd.Series
+    df_model: float
+    df_resid: float
+    ess: float
+    ssr: float
+    durbin_watson: float
+    vif: VIFResult
+
+    @property
+    def tvalues(self):
+        return self.params / self.bse
+
+    @property
+    def pvalues(self):
+        return pd.Series(2 * stats.t.sf(np.abs(self.tvalues), self.df_resid), index=self.params.index)
+
+    @property
+    def mse_model(self):
+        return self.ess / self.df_model
+
+    @property
+    def mse_resid(self):
+        return self.ssr / self.df_resid
+
+    @property
+    def fvalue(self):
+        return self.mse_model / self.mse_resid
+
+    @property
+    def f_pvalue(self):
+        return stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    @property
+    def rsquared(self):
+        return self.ess / (self.ess + self.ssr)
+
+    @property
+    def rsquared_adj(self):
+        return 1 - (1 - self.rsquared) * (self.nobs - 1) / self.df_resid
+
+
+def gram_from_frame(df, y, xs, chunk_rows=CHUNK_ROWS):
+    """메모리의 DataFrame을 청크 단위로 RegressionGram에 누적합니다 (청크당 임시 배열만 생성)."""
+    cols = list(xs) + [y]; acc = RegressionGram(len(xs))
+    for start in range(0, len(df), chunk_rows):
+        part = df.iloc[start:start + chunk_rows]
+        acc.update(np.column_stack([pd.to_numeric(part[c], errors="coerce").to_numpy(dtype=float) for c in cols]))
+    return acc
+
+
+def fit(gram, xs):
+    """RegressionGram에서 상수항 포함 OLS 결과를 계산합니다."""
+    xs = list(xs); p = len(xs); n = gram.n
+    if n < p + 2: raise ValueError(f"결측 없는 사례가 {n}개로, 예측변수 {p}개의 회귀분석에는 {p + 2}개 이상이 필요합니다.")
+    C, mean = gram.moments.C, gram.moments.mean
+    Cxx, cxy, cyy = C[:p, :p], C[:p, p], C[p, p]
+    vres = vif_from_gram(Cxx, xs)
+    if vres.singular or np.isnan(vres.condition):
+        # 완전 공선성: statsmodels와 같이 유사역행렬(최소 노름) 해를 사용합니다.
+        inv = linalg.pinvh(Cxx); rank = np.linalg.matrix_rank(Cxx, hermitian=True)
+    else:
+        inv = linalg.cho_solve(linalg.cho_factor(Cxx, lower=True), np.eye(p)); rank = p
+    beta = inv @ cxy
+    ssr = max(float(cyy - beta @ cxy), 0.0); ess = float(cyy) - ssr
+    df_model, df_resid = float(rank), float(n - rank - 1)
+    s2 = ssr / df_resid if df_resid > 0 else np.nan
+    xm = mean[:p]; const = mean[p] - xm @ beta
+    se = np.sqrt(s2 * np.r_[1 / n + xm @ inv @ xm, np.diag(inv)])
+    w = np.r_[-beta, 1.0]
+    dw = float(w @ gram.lag @ w / ssr) if ssr > 0 else np.nan
+    index = ["const"] + xs
+    return OLSResult(n, pd.Series(np.r_[const, beta], index=index), pd.Series(se, index=index),
+                     df_model, df_resid, ess, ssr, dw, vres)
+
+
+def ols(df, y, xs, chunk_rows=CHUNK_ROWS):
+    """DataFrame의 y ~ const + xs 선형 회귀 (결측 행은 목록별 제외)."""
+    return fit(gram_from_frame(df, y, xs, chunk_rows), xs)
@@ -0,0 +1,104 @@
+"""문항 공분산 행렬 기반 신뢰도 분석 엔진.
+
+공분산 행렬 S(k×k) 하나에서 모든 지표를 O(k²)에 계산하며 문항을 빼고 다시 적합하지 않습니다.
+총점 분산 T = 1'S1, 문항 i의 행 합 s_i = Σ_j S_ij일 때
+- α = k/(k-1) · (1 - tr S / T), 표준화 α = k·r̄ / (1 + (k-1)·r̄) (r̄: 문항 간 평균 상관)
+- 수정된 문항-총점 상관 = (s_i - S_ii) / √(S_ii · (T - 2s_i + S_ii))
+- 문항 제거 시 α = (k-1)/(k-2) · (1 - (tr S - S_ii) / (T - 2s_i + S_ii))
+
+신뢰구간은 두 가지를 제공합니다.
+- Feldt(1965) F 분포 구간: 공분산 행렬과 n만으로 계산 (스트리밍 모드 포함)
+- 부트스트랩 백분위 구간: 재표본을 다항분포 가중치 행렬 W(B×n)로 표현하면 모든 재표본의 문항 분산 합과
+  총점 분산이 W @ [X, X², t, t²] 행렬곱 한 번으로 계산됩니다. 배치마다 SeedSequence 시드를 받아
+  병렬로 실행하므로(jobs.parallel_map) 결과는 시드와 반복 수에만 의존합니다.
+  W의 크기는 배치당 MAX_WEIGHT_CELLS 셀로 제한하며, 사례 수가 BOOT_MAX_N을 넘으면 부트스트랩을 생략합니다
+  (그 규모에서는 Feldt 구간과 사실상 같습니다).
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from statera import jobs
+
+BOOTSTRAP = 2_000
+SEED = 2024
+BATCH = 500
+MAX_WEIGHT_CELLS = 5_000_000
+BOOT_MAX_N = 20_000
+WORKERS = int(os.environ.get("STATERA_BOOT_THREADS", str(jobs.INNER_WORKERS)))
+
+
+@dataclass(frozen=True)
+class ReliabilityResult:
+    k: int
+    n: int
+    alpha: float
+    std_alpha: float
+    items: pd.DataFrame          # 문항별 수정된 문항-총점 상관, 문항 제거 시 α
+    feldt_ci: tuple
+    boot_ci: tuple = None        # 부트스트랩 백분위 구간 (원자료가 있을 때)
+    boot_iterations: int = 0
+
+
+def _alpha(k, trace, total):
+    with np.errstate(all="ignore"):
+        return k / (k - 1) * (1 - trace / total)
+
+
+def feldt_ci(alpha, n, k, level=0.95):
+    g = (1 - level) / 2; d1, d2 = n - 1, (n - 1) * (k - 1)
+    return float(1 - (1 - alpha) * stats.f.ppf(1 - g, d1, d2)), float(1 - (1 - alpha) * stats.f.ppf(g, d1, d2))
+
+
+def _check(k, n):
+    if k < 2: raise ValueError("신뢰도 분석에는 2개 이상의 문항이 필요합니다.")
+    if n < 2: raise ValueError(f"결측 없는 사례가 {int(n)}개로, 신뢰도 분석에는 2개 이상이 필요합니다.")
+
+
+def from_covariance(S, items, n, level=0.95):
+    """문항 공분산 행렬(ddof=1)과 사례 수에서 신뢰도 지표를 계산합니다."""
+    S = np.asarray(S, dtype=float); k = len(S); _check(k, n)
+    d = np.diag(S); T = S.sum(); s = S.sum(axis=1); tr = d.sum()
+    alpha = _alpha(k, tr, T)
+    with np.errstate(all="ignore"):
+        R = S / np.sqrt(np.outer(d, d)); rbar = (R.sum() - k) / (k * (k - 1))
+        std_alpha = k * rbar / (1 + (k - 1) * rbar)
+        rest_var = T - 2 * s + d
+        item_total = (s - d) / np.sqrt(d * rest_var)
+        if_deleted = _alpha(k - 1, tr - d, rest_var) if k > 2 else np.full(k, np.nan)
+    table = pd.DataFrame({"item": list(items), "item_total_r": item_total, "alpha_if_deleted": if_deleted})
+    return ReliabilityResult(k, int(n), float(alpha), float(std_alpha), table, feldt_ci(alpha, n, k, level))
+
+
+def _boot_batch(args):
+    # 중심화한 원자료의 모멘트 열 [X, X², t, t²]에 다항분포 가중치를 곱해 재표본별 분산을 구합니다.
+    Z, size, seed = args
+    n = len(Z); k = (Z.shape[1] - 2) // 2
+    W = np.random.default_rng(seed).multinomial(n, np.full(n, 1 / n), size=size).astype(float)
+    m = W @ Z / n
+    var_items = (m[:, k:2 * k] - m[:, :k] ** 2).sum(axis=1); var_total = m[:, -1] - m[:, -2] ** 2
+    return _alpha(k, var_items, var_total)   # ddof 보정(n/(n-1))은 분자·분모에서 상쇄됩니다
+
+
+def bootstrap_alpha(X, iterations=BOOTSTRAP, seed=SEED, workers=WORKERS):
+    """결측 없는 문항 점수 행렬 X(n×k)의 부트스트랩 α 분포."""
+    X = np.asarray(X, dtype=float); X = X - X.mean(axis=0); t = X.sum(axis=1)
+    Z = np.column_stack([X, X * X, t, t * t])
+    batch = max(1, min(BATCH, MAX_WEIGHT_CELLS // len(X)))
+    sizes = [batch] * (iterations // batch) + ([iterations % batch] if iterations % batch else [])
+    batches = [(Z, size, s) for size, s in zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes)))]
+    return np.concatenate(jobs.parallel_map(_boot_batch, batches, workers))
+
+
+def analyze(df, items, iterations=BOOTSTRAP, seed=SEED, level=0.95):
+    """결측 행을 목록별로 제외한 문항 점수의 신뢰도 분석 (Feldt 및 부트스트랩 신뢰구간 포함)."""
+    X = df[list(items)].dropna().to_numpy(dtype=float)
+    _check(X.shape[1], len(X))
+    res = from_covariance(np.cov(X, rowvar=False, ddof=1), items, len(X), level)
+    if not iterations or not 3 <= len(X) <= BOOT_MAX_N: return res
+    boot = bootstrap_alpha(X, iterations, seed)
+    g = (1 - level) / 2; lo, hi = np.nanquantile(boot, [g, 1 - g])
+    return ReliabilityResult(res.k, res.n, res.alpha, res.std_alpha, res.items, res.feldt_ci, (float(lo), float(hi)), iterations)
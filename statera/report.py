@@ -0,0 +1,121 @@
+"""Word(DOCX) 리포트 생성 계층.
+
+스타일이 적용된 템플릿을 프로세스당 한 번만 만들고, 리포트는 사용자가 다운로드를 요청할 때만
+생성합니다. 생성된 바이트는 (분석 기법, 결과 해시) 기준으로 캐시되어 같은 결과를 다시 내려받을 때
+재생성하지 않습니다.
+"""
+import functools
+import hashlib
+import io
+import os
+import re
+from xml.sax.saxutils import escape
+
+import pandas as pd
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Inches
+
+from statera import profiler
+from statera.cache import LRUCache
+
+REPORT_CACHE_BYTES = int(float(os.environ.get("STATERA_REPORT_CACHE_MB", "128")) * 2**20)
+_REPORTS = LRUCache(REPORT_CACHE_BYTES, sizeof=len)
+
+
+@functools.lru_cache(maxsize=1)
+def _template_bytes():
+    doc = Document(); doc.styles['Normal'].font.name = 'Malgun Gothic'
+    doc.styles['Normal']._element.rPr.rFonts.set(qn('w:eastAsia'), 'Malgun Gothic')
+    bio = io.BytesIO(); doc.save(bio); return bio.getvalue()
+
+
+def _plot_bytes(plot_b):
+    # statera.plots.Plot은 리포트를 만들 때에만 인쇄 해상도로 렌더링합니다.
+    if plot_b is None: return None
+    if hasattr(plot_b, "export"): return plot_b.export()
+    return plot_b.getvalue() if hasattr(plot_b, "getvalue") else bytes(plot_b)
+
+
+_RUN_SPLIT = re.compile(r'(\t|\r\n|\n|\r)')
+_XML_INVALID = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _run_xml(text):
+    # cell.text 설정과 같은 규칙: 탭은 <w:tab/>, 줄바꿈은 <w:br/>, 나머지는 공백 보존 <w:t>
+    parts = []
+    for piece in _RUN_SPLIT.split(_XML_INVALID.sub('', text)):
+        if piece == '\t': parts.append('<w:tab/>')
+        elif piece in ('\n', '\r', '\r\n'): parts.append('<w:br/>')
+        elif piece: parts.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return f'<w:p><w:r>{"".join(parts)}</w:r></w:p>'
+
+
+def add_bulk_table(doc, r_df, style='Table Grid'):
+    """결과표를 행/열 수에 비례하는 1-pass로 기록합니다.
+
+    t.cell(i, j)는 호출마다 표 XML 전체를 탐색하므로 셀 수가 많을수록 급격히 느려집니다.
+    여기서는 python-docx가 만든 첫 행의 셀 속성(tcPr)을 원형으로 삼아 모든 행의 XML 문자열을 만들고
+    한 번에 파싱하여 표에 붙입니다.
+    """
+    t = doc.add_table(1, r_df.shape[1]); t.style = style
+    proto = t.rows[0]._tr
+    tc_pr = [tc.tcPr.xml if tc.tcPr is not None else '' for tc in proto.tc_lst]
+    rows = [list(map(str, r_df.columns))] + [[str(v) for v in row] for row in r_df.to_numpy(dtype=object)]
+    body = ''.join('<w:tr>' + ''.join(f'<w:tc>{pr}{_run_xml(text)}</w:tc>' for pr, text in zip(tc_pr, row)) + '</w:tr>'
+                   for row in rows)
+    tbl = t._tbl; tbl.remove(proto)
+    for tr in list(parse_xml(f'<w:tbl {nsdecls("w")}>{body}</w:tbl>')): tbl.append(tr)
+    return t
+
+
+def create_pro_report(m_name, r_df, interpretation, guide, plot_b=None, assump="", extra_tables=()):
+    doc = Document(io.BytesIO(_template_bytes()))
+    doc.add_heading(f'STATERA Report: {m_name}', 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    if assump:
+        doc.add_heading('1. Assumption Checks', level=1)
+        clean_assump = assump.replace('<div class="assumption-pass">', '').replace('<div class="assumption-fail">', '').replace('</div>', '')
+        doc.add_paragraph(clean_assump).italic = True
+    doc.add_heading('2. Statistical Results', level=1)
+    add_bulk_table(doc, r_df)
+    # 보조 결과표 (예: 로지스틱 회귀의 반복별 추정 기록): (제목, DataFrame) 목록
+    for title, table in extra_tables:
+        doc.add_heading(title, level=2); add_bulk_table(doc, table)
+    plot = _plot_bytes(plot_b)
+    if plot: doc.add_heading('3. Visualization', level=1); doc.add_picture(io.BytesIO(plot), width=Inches(4.5))
+    doc.add_heading('4. AI Interpretation', level=1); doc.add_paragraph(interpretation)
+    doc.add_heading('5. Thesis Writing Guide', level=1); doc.add_paragraph(guide)
+    bio = io.BytesIO(); doc.save(bio); bio.seek(0); return bio
+
+
+def result_key(m_name, r_df, interpretation, guide, plot_b=None, assump="", extra_tables=()):
+    """리포트 내용을 결정하는 모든 입력의 해시 (분석 기법, 결과표, 해석, 가정 검정, 보조 결과표, 그림)."""
+    h = hashlib.blake2b(digest_size=16)
+    for title, table in [(None, r_df), *extra_tables]:
+        for part in (title, *map(str, table.columns)):
+            h.update(str(part).encode()); h.update(b"\0")
+        h.update(pd.util.hash_pandas_object(table.astype(str), index=False).values.tobytes())
+    for part in (m_name, interpretation, guide, assump):
+        h.update(str(part).encode()); h.update(b"\0")
+    if hasattr(plot_b, "key"): h.update(repr(plot_b.key).encode())
+    elif plot_b is not None: h.update(_plot_bytes(plot_b))
+    return m_name, h.hexdigest()
+
+
+def report_bytes(m_name, r_df, interpretation, guide, plot_b=None, assump="", extra_tables=()):
+    """캐시된 리포트 바이트를 반환하고, 없으면 생성하여 캐시합니다."""
+    key = result_key(m_name, r_df, interpretation, guide, plot_b, assump, extra_tables)
+    cached = _REPORTS.get(key)
+    if cached is not None: return cached
+    with profiler.stage("report", method=m_name, rows=len(r_df)):
+        data = create_pro_report(m_name, r_df, interpretation, guide, plot_b, assump, extra_tables).getvalue()
+    return _REPORTS.put(key, data)
+
+
+def deferred_report(m_name, r_df, interpretation, guide, plot_b=None, assump="", extra_tables=()):
+    """st.download_button(data=...)에 넘길 지연 생성 함수. 클릭 시점에만 리포트를 만듭니다."""
+    plot = plot_b if hasattr(plot_b, "export") else _plot_bytes(plot_b)
+    extra_tables = tuple(extra_tables)
+    return lambda: report_bytes(m_name, r_df, interpretation, guide, plot, assump, extra_tables)
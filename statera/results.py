@@ -0,0 +1,65 @@
+"""분석 결과 저장소.
+
+Streamlit은 위젯을 조작할 때마다 스크립트 전체를 다시 실행하므로, 실행 버튼을 누른 재실행에서만 존재하던
+결과는 패널을 펼치기만 해도 사라지거나 다시 계산해야 했습니다. 여기서는 결과 묶음(결과표, p값, 해석,
+가정 검정 메시지, 그림, 보조 결과표 등)을 (데이터 해시, 처리 모드, 분석 기법, 변수, 옵션) 키로 세션 간 공유
+LRU 캐시에 보관합니다. 같은 파일을 보는 다른 세션이나 이전 분석으로 되돌아간 경우에도 재계산 없이 즉시
+표시됩니다. 항목 크기는 표의 메모리 사용량과 그림이 참조하는 데이터 크기로 어림합니다.
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from statera.cache import LRUCache
+
+RESULT_CACHE_BYTES = int(float(os.environ.get("STATERA_RESULT_CACHE_MB", "256")) * 2**20)
+
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    method: str
+    final_df: pd.DataFrame
+    p_val: float = None
+    interp: str = ""
+    assump_report: tuple = ()
+    plot_img: object = None          # statera.plots.Plot (지연 렌더링)
+    fit_tables: tuple = ()           # (제목, DataFrame) 목록
+    anova_model_info: str = None
+    reg_anova_df: pd.DataFrame = None
+    extra_metric: dict = None
+    notices: tuple = ()              # 안내 메시지 (예: 사후검정 출력 안내)
+
+
+def _frame_bytes(df):
+    return 0 if df is None else int(df.memory_usage(index=True, deep=True).sum())
+
+
+def nbytes(res):
+    """결과 묶음의 대략적인 메모리 크기."""
+    size = _frame_bytes(res.final_df) + _frame_bytes(res.reg_anova_df) + sum(_frame_bytes(t) for _, t in res.fit_tables)
+    size += sum(len(s) for s in (res.interp, res.anova_model_info or "", *res.assump_report))
+    return size + getattr(res.plot_img, "nbytes", 0)
+
+
+_RESULTS = LRUCache(RESULT_CACHE_BYTES, sizeof=nbytes, data_key=lambda k, v: k[0])
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)): return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.generic): return value.item()
+    return value
+
+
+def key(data_key, mode, method, params):
+    """결과 저장소 키: (데이터 해시, 처리 모드, 분석 기법, 변수·옵션 값)."""
+    return data_key, mode, method, _freeze(params)
+
+
+def get(k):
+    return _RESULTS.get(k)
+
+
+def put(k, result):
+    return _RESULTS.put(k, result)
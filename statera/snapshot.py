@@ -0,0 +1,73 @@
+"""세션 단위 열 지향(Arrow/Feather) 디스크 스냅샷.
+
+대용량 모드에서는 업로드 파일을 한 번만 파싱해 세션 전용 임시 디렉터리에 비압축 Feather(Arrow IPC)
+파일로 기록하고, 이후 분석에서는 필요한 열만 memory-map으로 읽어 들입니다.
+임시 디렉터리는 파일 해제, 다른 파일 업로드, 세션 종료(객체 소멸) 시 즉시 삭제됩니다.
+첫 화면에서도 불러오는 모듈이므로 pyarrow와 pandas(ingest)는 대용량 모드를 실제로 사용할 때 불러옵니다.
+"""
+import importlib
+import importlib.util
+import os
+import tempfile
+
+from statera import profiler
+
+# pyarrow가 없으면 대용량 모드를 비활성화합니다.
+AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+SESSION_KEY = "_statera_snapshot"
+
+
+class SessionSnapshot:
+    """한 세션이 보유한 단일 데이터셋의 Feather 스냅샷."""
+
+    def __init__(self, key, name, frame):
+        from statera import ingest
+        self.key, self.name = key, name
+        self.meta = ingest.describe_columns(frame)
+        # Feather 열 이름은 문자열이어야 하므로 위치 기반 이름을 씁니다 (1과 "1" 같은 열이 겹치지 않도록).
+        self._columns = {c: f"c{i}" for i, c in enumerate(frame.columns)}
+        self._dir = tempfile.TemporaryDirectory(prefix="statera-")
+        self.path = os.path.join(self._dir.name, "data.arrow")
+        try:
+            # memory-map 재로딩이 복사 없이 이루어지도록 압축하지 않습니다.
+            _feather().write_feather(frame.rename(columns=self._columns), self.path, compression="uncompressed")
+        except Exception:
+            self.close(); raise
+
+    def read(self, columns):
+        """요청한 열만 memory-map으로 읽어 DataFrame으로 반환합니다."""
+        names = list(dict.fromkeys(columns))
+        fields = [self._columns[c] for c in names]
+        # read_table은 파일의 열 순서로 반환하므로 요청한 순서로 다시 고른 뒤 이름을 붙입니다.
+        table = _feather().read_table(self.path, columns=fields, memory_map=True).select(fields)
+        df = table.to_pandas(split_blocks=True)
+        df.columns = names
+        return df
+
+    def close(self):
+        self._dir.cleanup()
+
+
+def _feather():
+    return importlib.import_module("pyarrow.feather")
+
+
+def for_session(session_state, up_file):
+    """세션에 현재 업로드 파일의 스냅샷을 만들거나(최초 1회) 기존 스냅샷을 반환합니다."""
+    from statera import ingest
+    key = ingest.upload_key(up_file)
+    snap = session_state.get(SESSION_KEY)
+    if snap is not None and snap.key == key: return snap
+    release(session_state)
+    # 전체 프레임은 스냅샷 기록에만 사용하고 공유 캐시에 남기지 않습니다.
+    with profiler.stage("parse", mode="snapshot", bytes=up_file.size):
+        frame = ingest.parse_bytes(up_file.name, up_file.getvalue())
+        snap = SessionSnapshot(key, up_file.name, frame)
+    session_state[SESSION_KEY] = snap
+    return snap
+
+
+def release(session_state):
+    """세션의 스냅샷과 임시 디렉터리를 즉시 삭제합니다."""
+    snap = session_state.pop(SESSION_KEY, None)
+    if snap is not None: snap.close()
@@ -0,0 +1,360 @@
+"""메모리보다 큰 CSV를 위한 청크 단위 스트리밍 통계 엔진.
+
+CSV를 일정 행 수(chunk)씩 읽으며 병합 가능한(mergeable) 1-pass 누적기로 통계량을 계산합니다.
+메모리 사용량은 행 수(N)가 아니라 변수 수와 스케치 크기에만 비례합니다.
+
+- Moments: Welford/Chan(Pébay) 병합식으로 평균, 표준편차, 왜도, 첨도
+- QuantileSketch: 고유값 수가 적으면 정확한 빈도 병합, 많으면 t-digest로 Q1/중앙값/Q3
+- ValueCounts: 청크별 value_counts 병합 (빈도분석, 결측 수 포함)
+- PairwiseMoments: 쌍별 결측 제외(pairwise complete) 상관행렬 (상관분석, 자기상관)
+- Comoments: 목록별 결측 제외(listwise) 공분산 행렬 (신뢰도 분석)
+- RegressionGram: [X, y]의 공적률 행렬과 인접 행 차분의 Gram 행렬 (선형 회귀분석, Durbin-Watson)
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from statera import frequency, ingest, jobs, profiler
+from statera.cache import LRUCache
+from statera.catalog import STREAM_METHODS as METHODS
+
+CHUNK_ROWS = int(os.environ.get("STATERA_CHUNK_ROWS", "200000"))
+
+
+def read_chunks(source, usecols=None, chunksize=CHUNK_ROWS):
+    """CSV 경로 또는 파일 객체를 청크 단위 DataFrame으로 순회합니다."""
+    if hasattr(source, "seek"): source.seek(0)
+    usecols = list(dict.fromkeys(usecols)) if usecols is not None else None
+    with pd.read_csv(source, usecols=usecols, chunksize=chunksize) as reader:
+        yield from jobs.checked(reader)
+
+
+def _numeric(s):
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype=float)
+
+
+class Moments:
+    """평균 및 2~4차 중심적률의 병합 가능한 누적기."""
+
+    def __init__(self):
+        self.n = 0; self.mean = 0.0; self.m2 = self.m3 = self.m4 = 0.0
+        self.min, self.max = np.inf, -np.inf
+
+    def update(self, x):
+        x = x[~np.isnan(x)]
+        if not x.size: return
+        mean = x.mean(); d = x - mean; d2 = d * d
+        self._merge(x.size, mean, d2.sum(), (d2 * d).sum(), (d2 * d2).sum())
+        self.min, self.max = min(self.min, x.min()), max(self.max, x.max())
+
+    def merge(self, other):
+        if other.n: self._merge(other.n, other.mean, other.m2, other.m3, other.m4)
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+
+    def _merge(self, nb, mean_b, m2b, m3b, m4b):
+        na, n = self.n, self.n + nb
+        d = mean_b - self.mean; dn = d / n
+        m2a, m3a, m4a = self.m2, self.m3, self.m4
+        self.m4 = (m4a + m4b + d * dn ** 3 * na * nb * (na * na - na * nb + nb * nb)
+                   + 6 * dn * dn * (na * na * m2b + nb * nb * m2a) + 4 * dn * (na * m3b - nb * m3a))
+        self.m3 = m3a + m3b + d * dn * dn * na * nb * (na - nb) + 3 * dn * (na * m2b - nb * m2a)
+        self.m2 = m2a + m2b + d * dn * na * nb
+        self.mean += dn * nb; self.n = n
+
+    @property
+    def var(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+    @property
+    def skew(self):
+        """pandas Series.skew()와 같은 수정 Fisher-Pearson 왜도(G1)."""
+        n = self.n
+        if n < 3: return np.nan
+        if self.m2 == 0: return 0.0
+        g1 = np.sqrt(n) * self.m3 / self.m2 ** 1.5
+        return np.sqrt(n * (n - 1)) / (n - 2) * g1
+
+    @property
+    def kurt(self):
+        """pandas Series.kurt()와 같은 초과 첨도(G2)."""
+        n = self.n
+        if n < 4: return np.nan
+        if self.m2 == 0: return 0.0
+        g2 = n * self.m4 / self.m2 ** 2 - 3
+        return ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+
+
+def _merge_counts(v1, c1, v2, c2):
+    values, inv = np.unique(np.concatenate([v1, v2]), return_inverse=True)
+    return values, np.bincount(inv, weights=np.concatenate([c1, c2]))
+
+
+def _compress(means, weights, delta):
+    """t-digest(k1 척도) 압축: 분위수 꼬리일수록 작은 centroid를 유지합니다."""
+    order = np.argsort(means, kind="mergesort")
+    m, w = means[order], weights[order]
+    q_left = (np.cumsum(w) - w) / w.sum()
+    bucket = np.floor(delta / (2 * np.pi) * np.arcsin(2 * q_left - 1) + delta / 4).astype(np.int64)
+    wsum = np.bincount(bucket, weights=w); msum = np.bincount(bucket, weights=w * m)
+    keep = wsum > 0
+    return msum[keep] / wsum[keep], wsum[keep]
+
+
+class QuantileSketch:
+    """고유값이 max_exact개 이하이면 정확한 분위수, 초과하면 t-digest 근사 분위수를 제공합니다."""
+
+    def __init__(self, max_exact=100_000, delta=1000):
+        self.max_exact, self.delta = max_exact, delta
+        self.values, self.counts = np.empty(0), np.empty(0)
+        self.exact = True
+        self.n = 0; self.min, self.max = np.inf, -np.inf
+
+    def update(self, x):
+        x = x[~np.isnan(x)]
+        if not x.size: return
+        self.n += x.size; self.min, self.max = min(self.min, x.min()), max(self.max, x.max())
+        if self.exact:
+            v, c = np.unique(x, return_counts=True)
+            self.values, self.counts = _merge_counts(self.values, self.counts, v, c)
+            if self.values.size > self.max_exact:
+                self.exact = False
+                self.values, self.counts = _compress(self.values, self.counts, self.delta)
+        else:
+            self.values, self.counts = _compress(np.concatenate([self.values, x]),
+                                                 np.concatenate([self.counts, np.ones(x.size)]), self.delta)
+
+    def quantile(self, q):
+        if not self.n: return np.nan
+        if self.exact:
+            # pandas 기본값(linear, type 7)과 동일한 보간
+            cum = np.cumsum(self.counts)
+            h = (self.n - 1) * q; lo = int(np.floor(h))
+            at = lambda pos: self.values[np.searchsorted(cum, pos, side="right")]
+            return at(lo) + (h - lo) * (at(min(lo + 1, self.n - 1)) - at(lo))
+        mids = np.cumsum(self.counts) - self.counts / 2
+        return float(np.interp(q * self.n, np.r_[0, mids, self.n], np.r_[self.min, self.values, self.max]))
+
+
+class ValueCounts:
+    """청크별 value_counts를 병합하는 빈도 누적기 (결측 제외)."""
+
+    def __init__(self):
+        self.counts = None; self.missing = 0
+
+    def update(self, s):
+        vc = s.value_counts(dropna=True)
+        self.missing += int(s.isna().sum())
+        self.counts = vc if self.counts is None else self.counts.add(vc, fill_value=0)
+
+    def result(self):
+        if self.counts is None: return pd.Series(dtype="int64")
+        return self.counts.astype("int64").sort_values(ascending=False, kind="stable")
+
+
+class PairwiseMoments:
+    """변수 쌍마다 두 값이 모두 관측된 행만 사용하는 Pearson 상관 누적기 (DataFrame.corr와 동일한 규칙).
+
+    상쇄 오차를 줄이기 위해 첫 청크의 평균만큼 이동(shift)한 값으로 마스크 행렬곱 합계를 누적합니다.
+    """
+
+    def __init__(self, p):
+        self.shift = None
+        self.n, self.s, self.ss, self.sxy = (np.zeros((p, p)) for _ in range(4))
+
+    def update(self, X):
+        if self.shift is None:
+            with np.errstate(all="ignore"):
+                self.shift = np.nan_to_num(np.nanmean(X, axis=0)) if len(X) else None
+            if self.shift is None: return
+        Z = X - self.shift; M = ~np.isnan(Z)
+        Z0 = np.where(M, Z, 0.0); Mf = M.astype(float)
+        self.n += Mf.T @ Mf; self.s += Z0.T @ Mf
+        self.ss += (Z0 * Z0).T @ Mf; self.sxy += Z0.T @ Z0
+
+    def corr(self):
+        with np.errstate(all="ignore"):
+            n = self.n
+            cov = self.sxy - self.s * self.s.T / n
+            var = self.ss - self.s ** 2 / n
+            r = cov / np.sqrt(var * var.T)
+        r[n < 2] = np.nan
+        diag = np.diag_indices_from(r)
+        r[diag] = np.where(np.isnan(r[diag]), np.nan, 1.0)
+        return np.clip(r, -1, 1)
+
+
+class Comoments:
+    """결측이 하나라도 있는 행을 제외(listwise)한 평균 벡터와 공적률 행렬 누적기 (Chan 병합)."""
+
+    def __init__(self, p):
+        self.n = 0; self.mean = np.zeros(p); self.C = np.zeros((p, p))
+
+    def update(self, X):
+        X = X[~np.isnan(X).any(axis=1)]
+        if not len(X): return
+        nb = len(X); mb = X.mean(axis=0); D = X - mb
+        n = self.n + nb; d = mb - self.mean
+        self.C += D.T @ D + np.outer(d, d) * self.n * nb / n
+        self.mean += d * nb / n; self.n = n
+
+    def cov(self):
+        return self.C / (self.n - 1) if self.n > 1 else np.full_like(self.C, np.nan)
+
+
+class RegressionGram:
+    """선형 회귀분석의 충분통계량 누적기. 메모리는 변수 수 p에 대해 O(p²)입니다.
+
+    열 순서는 [x_1, ..., x_p, y]이며 결측 행은 목록별로 제외합니다. 잔차의 1차 차분은
+    Δe = Δy - ΔX·β이므로 인접한 (유효) 행 차분의 Gram 행렬만 있으면 β를 구한 뒤
+    Durbin-Watson 분자 Σ(Δe)²를 잔차 없이 계산할 수 있습니다. 청크 경계의 차분은 직전 청크의
+    마지막 행으로 이어 붙여 계산합니다.
+    """
+
+    def __init__(self, p):
+        self.moments = Comoments(p + 1); self.lag = np.zeros((p + 1, p + 1)); self._last = None
+
+    @property
+    def n(self):
+        return self.moments.n
+
+    def update(self, X):
+        X = X[~np.isnan(X).any(axis=1)]
+        if not len(X): return
+        self.moments.update(X)
+        D = np.diff(X if self._last is None else np.vstack([self._last, X]), axis=0)
+        self.lag += D.T @ D; self._last = X[-1].copy()
+
+
+class Reservoir:
+    """청크를 넘어 균등 비복원 표본을 유지합니다 (시각화 전용; 통계량은 전체 데이터로 계산)."""
+
+    def __init__(self, size=50_000, seed=0):
+        self.size = size; self.rng = np.random.default_rng(seed)
+        self.keys = np.empty(0); self.rows = None
+
+    def update(self, rows):
+        keys = np.concatenate([self.keys, self.rng.random(len(rows))])
+        rows = rows if self.rows is None else np.concatenate([self.rows, rows])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size)[:self.size]
+            keys, rows = keys[keep], rows[keep]
+        self.keys, self.rows = keys, rows
+
+
+@dataclass(frozen=True)
+class DescribeResult:
+    table: pd.DataFrame
+    mean: float
+    std: float
+    skew: float
+    kurt: float
+    autocorr: float
+    sample: pd.Series
+
+
+def describe(source, v, chunksize=CHUNK_ROWS):
+    """df[[v]].describe(), 왜도/첨도, lag-1 자기상관을 1-pass로 계산합니다."""
+    mom, qs, ac, res = Moments(), QuantileSketch(), PairwiseMoments(2), Reservoir()
+    prev = np.nan
+    for chunk in read_chunks(source, [v], chunksize):
+        x = _numeric(chunk[v])
+        if not x.size: continue
+        ac.update(np.column_stack([np.r_[prev, x[:-1]], x])); prev = x[-1]
+        fin = x[~np.isnan(x)]
+        mom.update(fin); qs.update(fin); res.update(fin)
+    table = pd.DataFrame([{
+        "index": v, "count": float(mom.n), "mean": mom.mean if mom.n else np.nan, "std": mom.std,
+        "min": mom.min if mom.n else np.nan, "25%": qs.quantile(.25), "50%": qs.quantile(.5),
+        "75%": qs.quantile(.75), "max": mom.max if mom.n else np.nan,
+    }])
+    sample = pd.Series(res.rows if res.rows is not None else np.empty(0), name=v)
+    return DescribeResult(table, table.at[0, "mean"], mom.std, mom.skew, mom.kurt, ac.corr()[0, 1], sample)
+
+
+def value_counts(source, columns, chunksize=CHUNK_ROWS):
+    """열별 value_counts()를 청크 병합으로 계산합니다. {열: 빈도 Series} 반환."""
+    acc = _value_counts(source, columns, chunksize)
+    return {c: acc[c].result() for c in columns}
+
+
+def _value_counts(source, columns, chunksize):
+    acc = {c: ValueCounts() for c in columns}
+    for chunk in read_chunks(source, columns, chunksize):
+        for c in columns: acc[c].update(chunk[c])
+    return acc
+
+
+def frequencies(source, columns, chunksize=CHUNK_ROWS):
+    """frequency.frequencies와 같은 long 형식 빈도표(결측 행, 유효 비율 포함)를 청크 병합으로 계산합니다."""
+    acc = _value_counts(source, columns, chunksize)
+    return frequency.table([(c, vc.index, vc.to_numpy(), acc[c].missing) for c in columns for vc in [acc[c].result()]])
+
+
+def corr(source, columns, chunksize=CHUNK_ROWS, sample_size=50_000):
+    """df[columns].corr()와 같은 쌍별 Pearson 상관(correlation.CorrResult, 사례 수 포함)과 시각화용 표본 행을 반환합니다."""
+    columns = list(dict.fromkeys(columns))
+    acc, res = PairwiseMoments(len(columns)), Reservoir(sample_size)
+    for chunk in read_chunks(source, columns, chunksize):
+        X = np.column_stack([_numeric(chunk[c]) for c in columns])
+        acc.update(X); res.update(X)
+    sample = pd.DataFrame(res.rows if res.rows is not None else np.empty((0, len(columns))), columns=columns)
+    from statera import correlation  # scipy는 상관분석을 처음 실행할 때 불러옵니다 (업로드 스캔은 pandas만 사용)
+    return correlation.from_moments(acc.corr(), acc.n, columns), sample
+
+
+def item_covariance(source, items, chunksize=CHUNK_ROWS):
+    """결측 행을 목록별로 제외한 문항 공분산 행렬(ddof=1)을 반환합니다. 신뢰도 분석용."""
+    items = list(dict.fromkeys(items))
+    acc = Comoments(len(items))
+    for chunk in read_chunks(source, items, chunksize):
+        acc.update(np.column_stack([_numeric(chunk[c]) for c in items]))
+    return pd.DataFrame(acc.cov(), index=items, columns=items), acc.n
+
+
+def regression_gram(source, y, xs, chunksize=CHUNK_ROWS):
+    """선형 회귀분석용 RegressionGram을 청크 단위로 누적합니다 (statera.regression.fit에 전달)."""
+    cols = list(xs) + [y]; acc = RegressionGram(len(xs))
+    for chunk in read_chunks(source, cols, chunksize):
+        acc.update(np.column_stack([_numeric(chunk[c]) for c in cols]))
+    return acc
+
+
+def scan_columns(source, chunksize=CHUNK_ROWS, max_cardinality=10_000):
+    """전체 데이터를 적재하지 않고 ingest.ColumnMeta를 계산합니다 (고유값 수는 max_cardinality에서 절단)."""
+    n_rows, missing, numeric, seen, cols = 0, {}, {}, {}, None
+    for chunk in read_chunks(source, None, chunksize):
+        if cols is None:
+            cols = list(chunk.columns)
+            missing = dict.fromkeys(cols, 0); numeric = dict.fromkeys(cols, True); seen = {c: set() for c in cols}
+        n_rows += len(chunk)
+        num_now = set(chunk.select_dtypes(include=[np.number]).columns)
+        for c in cols:
+            missing[c] += int(chunk[c].isna().sum())
+            numeric[c] = numeric[c] and c in num_now
+            if len(seen[c]) < max_cardinality: seen[c].update(chunk[c].dropna().unique()[:max_cardinality])
+    cols = cols or []
+    num_cols = tuple(c for c in cols if numeric[c])
+    return ingest.ColumnMeta(
+        n_rows=n_rows, all_cols=tuple(cols), num_cols=num_cols,
+        cat_cols=tuple(c for c in cols if c not in num_cols),
+        cardinality={c: min(len(seen[c]), max_cardinality) for c in cols},
+        missing=missing, nbytes=0,
+    )
+
+
+_METAS = LRUCache(256, sizeof=lambda _: 1, data_key=lambda k, v: k)
+
+
+def scan_upload(up_file):
+    """업로드 파일의 스트리밍 메타데이터를 내용 해시 기준으로 캐시합니다."""
+    key = ingest.upload_key(up_file)
+    meta = _METAS.get(key)
+    if meta is not None: return meta
+    with profiler.stage("parse", mode="stream", bytes=up_file.size):
+        return _METAS.put(key, scan_columns(up_file))
@@ -0,0 +1,37 @@
+"""기법별 계산 함수 (statera.analyses): 작업 실행기와 같은 경로로 실행한 결과를 scipy와 비교합니다."""
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from statera import analyses, snapshot
+
+
+def source(df):
+    return analyses.Source("test", lambda cols: df)
+
+
+def test_paired_ttest_drops_rows_pairwise():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"pre": rng.normal(10, 2, 40), "post": rng.normal(11, 2, 40)})
+    df.loc[[1, 5], "pre"] = np.nan; df.loc[[2, 9, 30], "post"] = np.nan
+    res = analyses.run("대응표본 T-검정", source(df), dict(y1="pre", y2="post"))
+    d = df.dropna()
+    assert res.p_val == pytest.approx(stats.ttest_rel(d["pre"], d["post"]).pvalue)
+    assert res.final_df["Mean (평균)"].tolist() == pytest.approx([d["pre"].mean(), d["post"].mean()])
+
+
+@pytest.mark.skipif(not snapshot.AVAILABLE, reason="pyarrow 미설치")
+def test_snapshot_mode_matches_frame_mode():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"y": rng.normal(size=60), "x1": rng.normal(size=60), "x2": rng.normal(size=60)})
+    df["y"] += 0.4 * df["x1"]
+    params = dict(rtype="선형 회귀분석 (Linear)", xs=["x1", "x2"], y="y")
+    snap = snapshot.SessionSnapshot("snap-test", "data.csv", df)
+    try:
+        via_snapshot = analyses.run("회귀분석", analyses.Source("snap-test", snap.read), params)
+    finally:
+        snap.close()
+    via_frame = analyses.run("회귀분석", source(df), params)
+    assert via_snapshot.p_val == pytest.approx(via_frame.p_val)
+    pd.testing.assert_frame_equal(via_snapshot.final_df, via_frame.final_df)
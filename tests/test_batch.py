@@ -0,0 +1,112 @@
+"""일괄 분석 엔진 (statera.batch)과 명령행 진입점."""
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from statera import batch, groupstats
+from statera.__main__ import main
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"g2": rng.choice(["A", "B"], 60), "g3": rng.choice(["p", "q", "r"], 60), "label": rng.choice(["x", "y"], 60)})
+    for i in range(3): df[f"y{i}"] = rng.normal(size=60)
+    return df
+
+
+@pytest.mark.parametrize("method", ["ttest_ind", "anova"])
+def test_no_rows_with_a_group_raises(frame, method):
+    with pytest.raises(ValueError, match="사례"):
+        batch.run(frame.iloc[:0], method, ["y0"], "g2")
+
+
+def test_group_column_is_not_an_outcome(frame):
+    with pytest.raises(ValueError, match="집단 변수"):
+        batch.run(frame, "anova", ["y0", "g3"], "g3")
+
+
+@pytest.mark.parametrize("outcomes", [["y0", "g2"], ["y0", "label"]])
+def test_cli_rejects_group_and_non_numeric_outcomes(frame, tmp_path, outcomes):
+    path = tmp_path / "d.csv"; frame.to_csv(path, index=False)
+    with pytest.raises(SystemExit) as exc:
+        main([str(path), "ttest_ind", "--group", "g2", "--outcomes", *outcomes])
+    assert exc.value.code == 2
+
+
+def with_missing(frame):
+    frame = frame.copy(); frame.loc[[0, 7, 33], "y1"] = np.nan; frame.loc[[12], "g2"] = None
+    frame["empty"] = np.nan
+    return frame
+
+
+@pytest.mark.parametrize("method", ["holm", "bonferroni", "fdr_bh"])
+def test_adjust_matches_statsmodels(method):
+    multitest = pytest.importorskip("statsmodels.stats.multitest")
+    p = np.array([0.001, 0.04, np.nan, 0.03, 0.5, 0.012, 0.04])
+    ok = ~np.isnan(p); got = batch.adjust(p, method)
+    np.testing.assert_allclose(got[ok], multitest.multipletests(p[ok], method=method)[1], rtol=1e-12)
+    assert np.isnan(got[~ok]).all()
+
+
+def test_adjust_edge_cases():
+    assert batch.adjust([], "holm").size == 0
+    np.testing.assert_array_equal(batch.adjust([0.2, np.nan], "none"), [0.2, np.nan])
+    with pytest.raises(ValueError, match="보정 방법"):
+        batch.adjust([0.1], "sidak")
+
+
+def test_ttest_ind_matches_scipy_per_outcome(frame):
+    frame = with_missing(frame); frame["y2"] *= np.where(frame["g2"] == "A", 4.0, 1.0)   # 이분산 결과변수
+    outcomes = ["y0", "y1", "y2", "empty"]
+    res = batch.run(frame, "ttest_ind", outcomes, "g2", correction="none")
+    table = res.table.set_index("Outcome (결과변수)")
+    a, b = res.table.columns[1][3:-1], res.table.columns[4][3:-1]   # "N [A]" → A
+    for y in outcomes[:3]:
+        d = frame[["g2", y]].dropna(); x1, x2 = d.loc[d["g2"] == a, y], d.loc[d["g2"] == b, y]
+        welch = stats.levene(x1, x2).pvalue <= batch.ALPHA
+        ref = stats.ttest_ind(x1, x2, equal_var=not welch)
+        row = table.loc[y]
+        assert row["Test (검정)"] == ("Welch" if welch else "Student")
+        assert (row["t (t값)"], row[batch.P_COL]) == pytest.approx((ref.statistic, ref.pvalue), rel=1e-8)
+        assert (row[f"N [{a}]"], row[f"N [{b}]"]) == (len(x1), len(x2))
+    assert table.loc["y2", "Test (검정)"] == "Welch"
+    assert np.isnan(table.loc["empty", batch.P_COL]) and table.loc["empty", f"N [{a}]"] == 0
+
+
+def test_anova_matches_single_outcome_engine(frame):
+    frame = with_missing(frame); outcomes = ["y0", "y1", "y2"]
+    res = batch.run(frame, "anova", outcomes, "g3", correction="holm")
+    table = res.table.set_index("Outcome (결과변수)")
+    for y in outcomes:
+        gs = groupstats.group_stats(frame["g3"], frame[y]); fit = groupstats.oneway_anova(gs)
+        row = table.loc[y]
+        assert (row["F (F값)"], row[batch.P_COL], row["R²"]) == pytest.approx((fit.F, fit.p, fit.r2), rel=1e-10)
+        assert row["Levene p (등분산)"] == pytest.approx(groupstats.levene(gs)[1], rel=1e-10)
+        wf, _, _, wp = groupstats.welch_anova(gs)
+        assert (row["Welch F"], row["Welch p"]) == pytest.approx((wf, wp), rel=1e-10)
+    np.testing.assert_allclose(res.table[batch.ADJ_COL], batch.adjust(res.table[batch.P_COL], "holm"))
+
+
+def test_ttest_rel_and_describe_match_scipy_and_pandas(frame):
+    frame = with_missing(frame)
+    res = batch.run(frame, "ttest_rel", pairs=[("y0", "y1"), ("y1", "y2")], correction="bonferroni")
+    for (pre, post), (_, row) in zip([("y0", "y1"), ("y1", "y2")], res.table.iterrows()):
+        d = frame[[pre, post]].dropna(); ref = stats.ttest_rel(d[pre], d[post])
+        assert row["N (사례수)"] == len(d)
+        assert (row["t (t값)"], row[batch.P_COL]) == pytest.approx((ref.statistic, ref.pvalue), rel=1e-10)
+    desc = batch.run(frame, "describe", ["y0", "y1"]).table
+    ref = frame[["y0", "y1"]].describe().T
+    np.testing.assert_allclose(desc["Mean (평균)"], ref["mean"]); np.testing.assert_allclose(desc["SD (표준편차)"], ref["std"])
+    assert desc["N (사례수)"].tolist() == ref["count"].astype(int).tolist()
+
+
+def test_group_count_is_checked(frame):
+    one = frame.assign(g3="p")
+    with pytest.raises(ValueError, match="2개 이상"):
+        batch.run(one, "anova", ["y0"], "g3")
+    with pytest.raises(ValueError, match="정확히 2개"):
+        batch.run(frame, "ttest_ind", ["y0"], "g3")
+    with pytest.raises(ValueError, match="집단 변수가 필요"):
+        batch.run(frame, "anova", ["y0"])
@@ -0,0 +1,29 @@
+"""세션 간 공유 캐시: 용량 제한과 데이터 키별 삭제(hold/release)."""
+import gc
+
+from statera import cache
+from statera.cache import LRUCache
+
+
+def test_evicts_least_recently_used():
+    c = LRUCache(10, sizeof=len)
+    c.put("a", "xxxx"); c.put("b", "xxxx"); c.get("a"); c.put("c", "xxxx")
+    assert c.keys() == ["a", "c"] and c.nbytes == 8
+
+
+def test_oversized_item_is_not_cached():
+    c = LRUCache(3, sizeof=len)
+    assert c.put("a", "xxxx") == "xxxx" and "a" not in c
+
+
+def test_release_purges_data_entries_when_last_session_leaves():
+    c = LRUCache(100, sizeof=lambda _: 1, data_key=lambda k, v: k[0])
+    c.put(("d1", "x"), 1); c.put(("d1", "y"), 2); c.put(("d2", "x"), 3)
+    s1, s2 = {}, {}
+    cache.hold(s1, "d1"); cache.hold(s2, "d1")
+    cache.release(s1)
+    assert len(c) == 3            # 다른 세션이 아직 d1을 보고 있음
+    cache.hold(s2, "d2")          # 다른 파일 업로드 → d1을 보는 세션이 없음
+    assert c.keys() == [("d2", "x")]
+    del s2; gc.collect()          # 세션 종료 (세션 상태 소멸)
+    assert len(c) == 0
@@ -0,0 +1,75 @@
+"""교차표와 분할표 검정 엔진 (statera.contingency): pandas·scipy와 비교합니다."""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import special, stats
+
+from statera import contingency, frequency
+
+
+def test_mixed_labels_follow_pandas_order_and_stay_distinct():
+    rows = pd.Series(["1", 1, "a", 1, "1", 2]); cols = pd.Series(["x", "y", "x", "x", "y", "y"])
+    ct = contingency.crosstab(rows, cols)
+    assert list(ct.index) == [1, 2, "'1'", "a"]
+    assert ct.to_numpy().tolist() == pd.crosstab(rows, cols).to_numpy().tolist()
+
+
+def exact_ffh(table):
+    """2×c 표의 Fisher-Freeman-Halton 정확 p값 (주변합이 같은 모든 표를 나열)."""
+    table = np.asarray(table); top, cols = table[0].sum(), table.sum(axis=0)
+    logp = lambda t: -special.gammaln(np.asarray(t) + 1).sum()
+    obs = logp(table); total = hits = 0.0
+    for first in itertools.product(*(range(c + 1) for c in cols)):
+        if sum(first) != top: continue
+        t = np.array([first, cols - np.array(first)]); w = np.exp(logp(t) - obs)
+        total += w; hits += w if logp(t) <= obs + 1e-7 * abs(obs) else 0.0
+    return hits / total
+
+
+@pytest.fixture
+def survey():
+    rng = np.random.default_rng(12)
+    df = pd.DataFrame({"region": rng.choice(["north", "south", "east"], 300), "score": rng.integers(1, 5, 300)})
+    df.loc[[4, 80, 81], "region"] = None; df.loc[[80, 200], "score"] = np.nan
+    return df
+
+
+def test_crosstab_matches_pandas_and_uses_cached_codes(survey):
+    key = "test-crosstab"
+    try:
+        ct = contingency.crosstab(survey["region"], survey["score"], data_key=key)
+        pd.testing.assert_frame_equal(ct, pd.crosstab(survey["region"], survey["score"]), check_dtype=False)
+        assert (key, "region") in frequency._CODES and (key, "score") in frequency._CODES
+        pd.testing.assert_frame_equal(contingency.crosstab(survey["region"], survey["score"], data_key=key), ct)
+    finally:
+        frequency._CODES.discard(lambda k, v: k[0] == key)
+
+
+def test_crosstab_of_empty_input():
+    empty = pd.Series([], dtype=object, name="a")
+    assert contingency.crosstab(empty, empty.rename("b")).shape == (0, 0)
+
+
+def test_fisher_2x2_is_exact():
+    table = [[8, 2], [1, 5]]
+    res = contingency.fisher(table); ref = stats.fisher_exact(table)
+    assert res.method == "exact" and res.se == 0.0
+    assert (res.p, res.odds_ratio) == pytest.approx((ref.pvalue, ref.statistic))
+
+
+def test_fisher_rxc_monte_carlo_agrees_with_exact_enumeration():
+    table = np.array([[6, 1, 3], [1, 5, 2]])
+    res = contingency.fisher(table, iterations=20_000, seed=7, workers=1)
+    assert res.method == "monte-carlo" and res.iterations == 20_000 and res.seed == 7
+    assert abs(res.p - exact_ffh(table)) < 4 * res.se
+    # 배치별 시드를 쓰므로 결과는 작업자 수와 무관합니다.
+    assert contingency.fisher(table, iterations=20_000, seed=7, workers=4) == res
+
+
+def test_random_tables_keep_margins():
+    rows, cols = np.array([5, 0, 7, 3]), np.array([4, 6, 5])
+    tables = contingency.random_tables(rows, cols, 500, np.random.default_rng(0))
+    assert (tables >= 0).all()
+    assert (tables.sum(axis=2) == rows).all() and (tables.sum(axis=1) == cols).all()
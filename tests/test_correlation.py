@@ -0,0 +1,67 @@
+"""상관분석 엔진 (statera.correlation)을 pandas/scipy와 비교합니다."""
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from statera import correlation
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(4); f = rng.normal(size=150)
+    df = pd.DataFrame({f"v{i}": f * (i % 3) + rng.normal(size=150) for i in range(8)})
+    df["flat"] = 2.0
+    return df
+
+
+def with_missing(df):
+    rng = np.random.default_rng(8); df = df.copy()
+    values = df.to_numpy(copy=True); values[rng.random(values.shape) < 0.1] = np.nan
+    return pd.DataFrame(values, columns=df.columns)
+
+
+@pytest.mark.parametrize("tile", [3, 128])
+@pytest.mark.parametrize("missing", [False, True])
+def test_pearson_matches_pandas(frame, monkeypatch, tile, missing):
+    monkeypatch.setattr(correlation, "TILE", tile)
+    df = with_missing(frame) if missing else frame
+    res = correlation.corr(df)
+    pd.testing.assert_frame_equal(res.r, df.corr(), rtol=1e-10)
+    pd.testing.assert_frame_equal(res.n, df.notna().astype(float).T @ df.notna().astype(float), check_names=False)
+
+
+def test_pvalues_match_scipy(frame):
+    df = with_missing(frame).drop(columns="flat"); res = correlation.corr(df); p = res.p
+    for a, b in [("v0", "v1"), ("v2", "v5"), ("v3", "v7")]:
+        d = df[[a, b]].dropna()
+        assert p.loc[a, b] == pytest.approx(stats.pearsonr(d[a], d[b]).pvalue, rel=1e-8)
+    assert np.isnan(np.diag(p)).all()
+    sig, total = res.n_pairs_significant()
+    assert total == 28 and sig == int((p.to_numpy()[np.triu_indices(8, 1)] < 0.05).sum())
+
+
+def test_spearman_matches_pandas_without_missing(frame, monkeypatch):
+    monkeypatch.setattr(correlation, "TILE", 4)
+    frame = frame.round(1)   # 동점 포함
+    pd.testing.assert_frame_equal(correlation.corr(frame, "spearman").r, frame.corr("spearman"), rtol=1e-10)
+
+
+def test_spearman_ranks_within_observed_values(frame):
+    df = with_missing(frame).drop(columns="flat")
+    r = correlation.corr(df, "spearman").r
+    d = df[["v1", "v4"]].dropna()
+    ranked = df[["v1", "v4"]].rank()   # 각 변수의 관측값 안에서 매긴 순위
+    assert r.loc["v1", "v4"] == pytest.approx(ranked.loc[d.index].corr().loc["v1", "v4"], rel=1e-10)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")   # 빈 열의 nanmean/nanstd
+@pytest.mark.parametrize("rows", [0, 1])
+def test_too_few_rows_give_missing_coefficients(frame, rows):
+    res = correlation.corr(frame.iloc[:rows])
+    assert res.r.isna().all().all() and (res.n.to_numpy() == rows).all() and res.p.isna().all().all()
+
+
+def test_unknown_method(frame):
+    with pytest.raises(ValueError, match="지원하지 않는"):
+        correlation.corr(frame, "kendall")
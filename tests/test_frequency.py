@@ -0,0 +1,60 @@
+"""빈도분석 엔진 (statera.frequency)을 pandas value_counts와 비교합니다."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from statera import frequency
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({"grade": rng.choice(["C", "A", "B", "D"], 200, p=[0.4, 0.3, 0.2, 0.1]),
+                       "score": rng.integers(1, 6, 200).astype(float)})
+    df.loc[rng.choice(200, 15, replace=False), "grade"] = None; df.loc[[0, 1], "score"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("column", ["grade", "score"])
+def test_count_matches_value_counts(frame, column):
+    cats, counts, missing = frequency.count(frame[column])
+    ref = frame[column].value_counts(sort=True)
+    assert list(cats) == list(ref.index) and list(counts) == list(ref)
+    assert missing == frame[column].isna().sum()
+
+
+def test_ties_keep_first_appearance():
+    cats, counts, _ = frequency.count(pd.Series(["b", "a", "c", "a", "b", "c", "d"]))
+    assert list(cats) == ["b", "a", "c", "d"] and list(counts) == [2, 2, 2, 1]
+
+
+def test_table_percentages(frame):
+    out = frequency.frequencies(frame, ["grade", "score"])
+    assert list(out.columns) == list(frequency.COLUMNS)
+    for column in ["grade", "score"]:
+        part = out[out["Variable (변수명)"] == column]
+        ref = frame[column].value_counts(dropna=False)
+        assert part["Frequency (빈도)"].sum() == len(frame)
+        assert part["Category (범주)"].iloc[-1] == frequency.MISSING_LABEL
+        np.testing.assert_allclose(part["Percent (비율)"], (ref / len(frame) * 100).round(1).to_numpy())
+        valid = frame[column].value_counts(normalize=True) * 100
+        np.testing.assert_allclose(part["Valid Percent (유효 비율)"].iloc[:-1], valid.round(1).to_numpy())
+        assert np.isnan(part["Valid Percent (유효 비율)"].iloc[-1])
+
+
+def test_codes_are_cached_per_data_key(frame):
+    key = "test-frequency"
+    try:
+        first = frequency.factorize(frame["grade"], key)
+        assert frequency.factorize(frame["grade"], key) is first
+        assert first[0].dtype == np.int8 and first[0].min() == -1
+    finally:
+        frequency._CODES.discard(lambda k, v: k[0] == key)
+
+
+def test_empty_and_all_missing_columns():
+    df = pd.DataFrame({"none": [np.nan, np.nan]})
+    out = frequency.frequencies(df, ["none"])
+    assert out["Category (범주)"].tolist() == [frequency.MISSING_LABEL] and out["Percent (비율)"].tolist() == [100.0]
+    assert frequency.frequencies(df.iloc[:0], ["none"]).empty
+    assert frequency.frequencies(df, []).empty
@@ -0,0 +1,60 @@
+"""집단 비교 엔진 (statera.groupstats)을 scipy/statsmodels/pandas와 비교합니다."""
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from statera import analyses, groupstats
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(7)
+    g = pd.Series(rng.choice(["b", "a", "c"], 90))
+    y = pd.Series(1e6 + rng.normal(0, 1, 90) * np.where(g == "c", 3.0, 1.0))   # 큰 절편: centering 확인
+    g[[4, 17]] = None; y[[8, 40, 41]] = np.nan
+    return g, y
+
+
+def observed(g, y):
+    d = pd.DataFrame({"g": g, "y": y}).dropna()
+    return d, [d.loc[d["g"] == lab, "y"].to_numpy() for lab in d["g"].unique()]
+
+
+def test_group_stats_match_pandas_and_leave_input(data):
+    g, y = data; before = y.copy()
+    gs = groupstats.group_stats(g, y)
+    d, _ = observed(g, y)
+    agg = d.groupby("g", sort=False)["y"].agg(["count", "mean", "var", "median"])
+    assert list(gs.labels) == list(agg.index) and gs.N == len(d)
+    np.testing.assert_array_equal(gs.n, agg["count"])
+    np.testing.assert_allclose(gs.mean, agg["mean"], rtol=1e-14)
+    np.testing.assert_allclose(gs.var, agg["var"], rtol=1e-10)
+    np.testing.assert_allclose(gs.median, agg["median"], rtol=1e-14)
+    pd.testing.assert_series_equal(y, before)
+
+
+def test_tests_match_scipy(data):
+    g, y = data; gs = groupstats.group_stats(g, y); _, parts = observed(g, y)
+    for center in ["median", "mean"]:
+        assert groupstats.levene(gs, center) == pytest.approx(tuple(stats.levene(*parts, center=center)), rel=1e-8)
+    fit = groupstats.oneway_anova(gs); ref = stats.f_oneway(*parts)
+    assert (fit.F, fit.p) == pytest.approx((ref.statistic, ref.pvalue), rel=1e-8)
+    for equal_var in [True, False]:
+        ref = stats.ttest_ind(parts[0], parts[1], equal_var=equal_var)
+        assert groupstats.ttest_ind(gs, equal_var) == pytest.approx((ref.statistic, ref.pvalue), rel=1e-8)
+
+
+def test_welch_anova_matches_statsmodels(data):
+    oneway = pytest.importorskip("statsmodels.stats.oneway")
+    g, y = data; _, parts = observed(g, y)
+    ref = oneway.anova_oneway(parts, use_var="unequal")
+    F, df1, df2, p = groupstats.welch_anova(groupstats.group_stats(g, y))
+    assert (F, df1, df2, p) == pytest.approx((ref.statistic, *ref.df, ref.pvalue), rel=1e-8)
+
+
+@pytest.mark.parametrize("labels", [["a"] * 6, []])
+def test_anova_needs_two_groups(labels):
+    df = pd.DataFrame({"g": labels, "y": np.arange(len(labels), dtype=float)})
+    with pytest.raises(analyses.AnalysisError, match="2개 이상"):
+        analyses.run("분산분석(ANOVA)", analyses.Source("test", lambda cols: df), dict(g="g", y="y"))
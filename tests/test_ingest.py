@@ -0,0 +1,50 @@
+"""업로드 수집 계층: CSV/XLSX 파싱 결과, 열 메타데이터, 내용 해시 캐시."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from statera import ingest
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"id": [1, 2, 3, 4], "score": [1.5, np.nan, 3.0, 4.25], "group": ["A", "B", None, "A"]})
+
+
+class Upload:
+    """st.file_uploader의 UploadedFile 대역 (name, file_id, getvalue)."""
+
+    def __init__(self, name, data, file_id):
+        self.name, self.file_id, self._data, self.reads = name, file_id, data, 0
+
+    def getvalue(self):
+        self.reads += 1; return self._data
+
+
+def xlsx_bytes(df):
+    buf = io.BytesIO(); df.to_excel(buf, index=False); return buf.getvalue()
+
+
+@pytest.mark.parametrize("name, encode", [("data.csv", lambda df: df.to_csv(index=False).encode()), ("data.xlsx", xlsx_bytes)])
+def test_round_trip(frame, name, encode):
+    ds = ingest.load_bytes(name, encode(frame))
+    pd.testing.assert_frame_equal(ds.frame, frame, check_dtype=False)
+    assert ds.meta.n_rows == 4 and ds.meta.all_cols == ("id", "score", "group")
+    assert ds.meta.num_cols == ("id", "score") and ds.meta.cat_cols == ("group",)
+    assert ds.meta.missing == {"id": 0, "score": 1, "group": 1} and ds.meta.cardinality["group"] == 2
+
+
+def test_same_content_is_parsed_once(frame):
+    data = frame.to_csv(index=False).encode()
+    assert ingest.load_bytes("a.csv", data) is ingest.load_bytes("b.csv", data)
+    assert ingest.load_bytes("a.csv", data).key != ingest.load_bytes("a.xlsx", xlsx_bytes(frame)).key
+
+
+def test_upload_key_hashes_each_file_id_once(frame):
+    up = Upload("data.csv", frame.to_csv(index=False).encode(), "upload-test-1")
+    ds = ingest.load_upload(up)
+    assert ingest.upload_key(up) == ds.key == ingest.dataset_key(up.name, up._data)
+    ingest.load_upload(up)
+    assert up.reads == 1
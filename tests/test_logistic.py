@@ -0,0 +1,61 @@
+"""로지스틱 회귀 서비스 (statera.logistic): statsmodels Logit과 비교하고 캐시·warm start를 확인합니다."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from statera import logistic
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(9); n = 400
+    df = pd.DataFrame({f"x{i}": rng.normal(size=n) for i in range(3)})
+    eta = -0.5 + 1.2 * df["x0"] - 0.8 * df["x1"] + 0.3 * df["x2"]
+    df["y"] = (rng.random(n) < 1 / (1 + np.exp(-eta))).astype(float)
+    df.loc[[2, 30], "x1"] = np.nan; df.loc[[5], "y"] = np.nan
+    return df
+
+
+@pytest.fixture
+def data_key(request):
+    key = f"test-{request.node.name}"
+    yield key
+    logistic._FITS.discard(lambda k, v: k[0] == key)
+
+
+def test_fit_matches_statsmodels(frame):
+    sm = pytest.importorskip("statsmodels.api")
+    xs = ["x0", "x1", "x2"]; d = frame.dropna()
+    ref = sm.Logit(d["y"], sm.add_constant(d[xs])).fit(disp=0)
+    res = logistic.fit(frame, "y", xs)
+    assert res.converged and res.nobs == ref.nobs and res.warm_start is None
+    np.testing.assert_allclose(res.params, ref.params, rtol=1e-7)
+    np.testing.assert_allclose(res.bse, ref.bse, rtol=1e-7)
+    np.testing.assert_allclose(res.conf_int(), ref.conf_int(), rtol=1e-7)
+    for name in ["llf", "llnull", "llr", "llr_pvalue", "prsquared", "df_model"]:
+        assert getattr(res, name) == pytest.approx(getattr(ref, name), rel=1e-8), name
+    assert len(res.trace()) == len(res.iterations)
+
+
+def test_cache_and_warm_start(frame, data_key):
+    cold = logistic.fit(frame, "y", ["x0", "x1", "x2"])
+    small = logistic.fit(frame, "y", ["x0", "x1"], data_key=data_key)
+    assert not small.cached and small.warm_start is None
+    assert logistic.fit(frame, "y", ["x0", "x1"], data_key=data_key).cached
+    warm = logistic.fit(frame, "y", ["x0", "x1", "x2"], data_key=data_key)
+    assert warm.warm_start == ("x0", "x1") and len(warm.iterations) < len(cold.iterations)
+    np.testing.assert_allclose(warm.params, cold.params, rtol=1e-7)
+    # 다른 종속변수나 데이터의 모형은 시작값으로 쓰지 않습니다.
+    other = frame.assign(z=1 - frame["y"])
+    assert logistic.fit(other, "z", ["x0", "x1", "x2"], data_key=data_key).warm_start is None
+
+
+@pytest.mark.parametrize("rows, y, match", [
+    (slice(0, 0), None, "사례"),
+    (slice(0, 50), 1.0, "0과 1이 모두"),
+    (slice(0, 50), 2.0, "0과 1로 코딩"),
+])
+def test_invalid_input(frame, rows, y, match):
+    df = frame.iloc[rows] if y is None else frame.iloc[rows].assign(y=y)
+    with pytest.raises(ValueError, match=match):
+        logistic.fit(df, "y", ["x0"])
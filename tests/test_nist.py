@@ -0,0 +1,46 @@
+"""NIST StRD 기준 데이터 정확도 (LRE: 일치하는 유효숫자 수).
+
+SmLs01–09와 NumAcc1–4는 구성 규칙으로 생성하고, SiRstv와 AtmWtAg는 tests/data/nist_anova의 NIST 배포
+.dat 파일을 읽습니다. 다른 .dat 파일은 STATERA_NIST_DIR에 두면 함께 검증합니다.
+"""
+import os
+
+import pytest
+
+from benchmarks import nist_anova, suite
+from statera import streaming
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data", "nist_anova")
+REFERENCES = nist_anova.references(DATA_DIR)
+if os.environ.get("STATERA_NIST_DIR"):
+    known = {r.name for r in REFERENCES}
+    REFERENCES += [r for r in nist_anova.references(os.environ["STATERA_NIST_DIR"]) if r.name not in known]
+
+
+@pytest.mark.parametrize("ref", REFERENCES, ids=[r.name for r in REFERENCES])
+def test_oneway_anova_lre(ref):
+    scores = nist_anova.evaluate(ref)
+    assert set(scores) == set(ref.certified)
+    assert min(scores.values()) >= nist_anova.MIN_LRE[ref.difficulty], scores
+
+
+def test_bundled_reference_files_are_read():
+    names = {r.name for r in REFERENCES}
+    assert {"SiRstv", "AtmWtAg"} <= names
+    assert all(len(r.certified) == len(nist_anova.STATS) for r in REFERENCES)
+
+
+def test_anova_leaves_frame_unchanged_and_memory_flat():
+    unchanged, peaks = nist_anova.memory_check(nist_anova.smls(2))
+    assert unchanged
+    assert max(peaks[1:]) <= peaks[0] * 1.05 + 4096, peaks
+
+
+NUMACC = list(suite.numacc())
+
+
+@pytest.mark.parametrize("name, level, x, mean, sd", NUMACC, ids=[case[0] for case in NUMACC])
+def test_streaming_moments_lre(name, level, x, mean, sd):
+    m = streaming.Moments()
+    for part in (x[:len(x) // 3], x[len(x) // 3:]): m.update(part)   # 청크 병합 경로
+    assert min(suite.lre(m.mean, mean), suite.lre(m.std, sd)) >= nist_anova.MIN_LRE[level]
@@ -0,0 +1,60 @@
+"""정규성 검정 엔진 (statera.normality)을 scipy와 비교합니다."""
+import numpy as np
+import pytest
+from scipy import stats
+
+from statera import normality
+
+
+@pytest.fixture
+def grouped():
+    rng = np.random.default_rng(11)
+    parts = [rng.normal(size=120), rng.exponential(size=300), rng.standard_t(5, size=80)]
+    codes = np.repeat(np.arange(3), [len(p) for p in parts])
+    return codes, np.concatenate(parts), parts
+
+
+def test_small_groups_use_shapiro(grouped):
+    codes, y, parts = grouped
+    for res, x in zip(normality.check_groups(codes, y), parts):
+        ref = stats.shapiro(x)
+        assert res.test == "Shapiro-Wilk" and res.n == len(x)
+        assert (res.statistic, res.p) == pytest.approx((ref.statistic, ref.pvalue))
+
+
+@pytest.mark.parametrize("method, reference", [
+    ("dagostino", stats.normaltest),
+    ("jarque_bera", stats.jarque_bera),
+])
+def test_large_groups_match_scipy(grouped, monkeypatch, method, reference):
+    monkeypatch.setattr(normality, "SHAPIRO_MAX_N", 50)
+    codes, y, parts = grouped
+    for res, x in zip(normality.check_groups(codes, y, method=method), parts):
+        ref = reference(x)
+        assert res.n == len(x)
+        assert (res.statistic, res.p) == pytest.approx((ref.statistic, ref.pvalue), rel=1e-8)
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")   # SciPy 1.17+: anderson의 method 인자 안내
+def test_anderson_statistic_matches_scipy(grouped, monkeypatch):
+    monkeypatch.setattr(normality, "SHAPIRO_MAX_N", 50)
+    codes, y, parts = grouped
+    res = normality.check_groups(codes, y, method="anderson")
+    assert [r.statistic for r in res] == pytest.approx([stats.anderson(x).statistic for x in parts], rel=1e-10)
+    assert res[1].p < 0.001 < res[0].p   # 지수분포 집단만 정규성 기각
+
+
+def test_subsample_is_reproducible(grouped, monkeypatch):
+    monkeypatch.setattr(normality, "SHAPIRO_MAX_N", 50)
+    codes, y, _ = grouped
+    first = normality.check_groups(codes, y, subsample=60)
+    assert [r.test for r in first] == ["Shapiro-Wilk"] * 3 and [r.n for r in first] == [60] * 3
+    assert first == normality.check_groups(codes, y, subsample=60)
+
+
+def test_missing_and_degenerate_input():
+    x = np.array([np.nan, 1.0, 2.5, np.nan, 0.3, 4.0])
+    res = normality.check(x)
+    assert res.n == 4 and res.p == pytest.approx(stats.shapiro(x[~np.isnan(x)]).pvalue)
+    for values in ([], [np.nan, np.nan], [1.0, 2.0]):
+        assert np.isnan(normality.check(values).p)
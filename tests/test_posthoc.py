@@ -0,0 +1,66 @@
+"""사후검정 (statera.groupstats): 스튜던트화 범위 분포, Tukey HSD, Games-Howell을 scipy/statsmodels와 비교합니다."""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from statera import groupstats
+
+
+@pytest.fixture
+def groups():
+    rng = np.random.default_rng(3)
+    sizes, means, sds = [12, 20, 9, 15], [10.0, 11.5, 9.0, 12.0], [1.0, 2.5, 0.7, 1.8]
+    g = np.repeat(["d", "b", "c", "a"], sizes)
+    y = np.concatenate([rng.normal(m, s, n) for n, m, s in zip(sizes, means, sds)])
+    y[[3, 25]] = np.nan   # 결측 행은 집단 통계에서 제외됩니다
+    return pd.Series(g), pd.Series(y)
+
+
+@pytest.mark.parametrize("k", [2, 3, 5, 10])
+@pytest.mark.parametrize("df", [2, 5, 10, 30, 120, np.inf])
+def test_studentized_range_sf_matches_scipy(k, df):
+    q = np.array([0.0, 0.5, 2.0, 3.5, 6.0, 12.0])
+    got = groupstats.studentized_range_sf(q, k, np.full(q.shape, df))
+    np.testing.assert_allclose(got, stats.studentized_range.sf(q, k, df), atol=1e-9)
+
+
+def test_studentized_range_isf_inverts_sf():
+    df = np.array([3.0, 17.0, 60.0])
+    q = groupstats.studentized_range_isf(0.05, 4, df)
+    np.testing.assert_allclose(q, stats.studentized_range.ppf(0.95, 4, df), rtol=1e-8)
+
+
+def test_tukey_hsd_matches_statsmodels(groups):
+    multicomp = pytest.importorskip("statsmodels.stats.multicomp")
+    g, y = groups; keep = y.notna()
+    ref = multicomp.pairwise_tukeyhsd(y[keep], g[keep], alpha=0.05)
+    got = groupstats.tukey_hsd(groupstats.group_stats(g, y))
+    assert list(zip(got["group1"], got["group2"])) == list(itertools.combinations(ref.groupsunique, 2))
+    np.testing.assert_allclose(got["meandiff"], ref.meandiffs, rtol=1e-10)
+    np.testing.assert_allclose(got["p-adj"], ref.pvalues, atol=1e-6)
+    np.testing.assert_allclose(got[["lower", "upper"]], ref.confint, rtol=1e-6)
+    assert got["reject"].tolist() == list(ref.reject)
+
+
+def test_games_howell_matches_welch_reference(groups):
+    g, y = groups; d = pd.DataFrame({"g": g, "y": y}).dropna()
+    agg = d.groupby("g")["y"].agg(["mean", "var", "count"])
+    got = groupstats.games_howell(groupstats.group_stats(g, y)).set_index(["group1", "group2"])
+    k = len(agg)
+    for a, b in itertools.combinations(sorted(agg.index), 2):
+        va, vb = agg.loc[a, "var"] / agg.loc[a, "count"], agg.loc[b, "var"] / agg.loc[b, "count"]
+        df = (va + vb) ** 2 / (va ** 2 / (agg.loc[a, "count"] - 1) + vb ** 2 / (agg.loc[b, "count"] - 1))
+        diff = agg.loc[b, "mean"] - agg.loc[a, "mean"]; se = np.sqrt((va + vb) / 2)
+        row = got.loc[(a, b)]
+        assert row["meandiff"] == pytest.approx(diff)
+        assert row["p-adj"] == pytest.approx(stats.studentized_range.sf(abs(diff) / se, k, df), abs=1e-8)
+        crit = stats.studentized_range.ppf(0.95, k, df) * se
+        assert (row["lower"], row["upper"]) == pytest.approx((diff - crit, diff + crit), rel=1e-6)
+
+
+def test_single_group_has_no_pairs():
+    gs = groupstats.group_stats(["a"] * 5, [1.0, 2.0, 3.0, 4.0, 5.0])
+    assert groupstats.tukey_hsd(gs).empty and groupstats.games_howell(gs).empty
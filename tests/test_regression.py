@@ -0,0 +1,82 @@
+"""선형 회귀 엔진 (statera.regression): VIF와 OLS를 statsmodels와 비교합니다."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from statera import regression
+
+
+@pytest.fixture
+def predictors():
+    rng = np.random.default_rng(5)
+    f = rng.normal(size=200)
+    X = pd.DataFrame({f"x{i}": f * (i + 1) / 3 + rng.normal(size=200) for i in range(4)})
+    X.iloc[[3, 50], 1] = np.nan
+    return X
+
+
+def test_vif_matches_statsmodels(predictors):
+    sm = pytest.importorskip("statsmodels.api")
+    from statsmodels.stats.outliers_influence import variance_inflation_factor
+    X = predictors.dropna(); exog = sm.add_constant(X).to_numpy()
+    ref = [variance_inflation_factor(exog, j) for j in range(1, exog.shape[1])]
+    res = regression.vif(predictors)
+    assert not res.singular and res.max == pytest.approx(max(ref), rel=1e-8)
+    np.testing.assert_allclose(res.vif, ref, rtol=1e-8)
+
+
+def test_vif_collinear_and_constant_columns(predictors):
+    X = predictors.assign(total=predictors["x0"] + predictors["x2"], flat=1.0)
+    res = regression.vif(X)
+    assert res.singular
+    assert np.isinf(res.vif[["x0", "x2", "total"]]).all() and np.isfinite(res.vif[["x1", "x3"]]).all()
+    assert np.isnan(res.vif["flat"])
+
+
+def test_vif_without_variation():
+    res = regression.vif(pd.DataFrame({"a": [2.0, 2.0, 2.0]}))
+    assert np.isnan(res.vif["a"]) and res.max == 1.0
+
+
+@pytest.fixture
+def frame(predictors):
+    rng = np.random.default_rng(6); df = predictors.copy()
+    df["y"] = 50 + df["x0"] - 2 * df["x1"] + 0.5 * df["x3"] + rng.normal(size=len(df))
+    df.loc[[7, 90], "y"] = np.nan
+    return df
+
+
+def statsmodels_fit(df, xs):
+    sm = pytest.importorskip("statsmodels.api")
+    d = df[xs + ["y"]].dropna()
+    return sm.OLS(d["y"], sm.add_constant(d[xs])).fit()
+
+
+@pytest.mark.parametrize("chunk_rows", [13, 10_000])
+def test_ols_matches_statsmodels(frame, chunk_rows):
+    from statsmodels.stats.stattools import durbin_watson
+    xs = ["x0", "x1", "x2", "x3"]; ref = statsmodels_fit(frame, xs)
+    res = regression.ols(frame, "y", xs, chunk_rows=chunk_rows)
+    assert res.nobs == ref.nobs and (res.df_model, res.df_resid) == (ref.df_model, ref.df_resid)
+    for name in ["params", "bse", "tvalues", "pvalues"]:
+        np.testing.assert_allclose(getattr(res, name), getattr(ref, name), rtol=1e-8, err_msg=name)
+    for name in ["fvalue", "f_pvalue", "rsquared", "rsquared_adj", "ssr", "ess"]:
+        assert getattr(res, name) == pytest.approx(getattr(ref, name), rel=1e-8), name
+    assert res.durbin_watson == pytest.approx(durbin_watson(ref.resid), rel=1e-8)
+
+
+@pytest.mark.filterwarnings("ignore:The design matrix is rank-deficient")
+def test_ols_collinear_uses_minimum_norm_solution(frame):
+    frame = frame.assign(total=frame["x0"] + frame["x1"])
+    xs = ["x0", "x1", "total"]; ref = statsmodels_fit(frame, xs)
+    res = regression.ols(frame, "y", xs)
+    assert res.vif.singular and res.df_model == 2 == ref.df_model
+    np.testing.assert_allclose(res.params, ref.params, rtol=1e-8)
+    np.testing.assert_allclose(res.bse, ref.bse, rtol=1e-8)
+    assert res.ssr == pytest.approx(ref.ssr, rel=1e-8)
+
+
+@pytest.mark.parametrize("rows", [0, 3])
+def test_ols_needs_more_cases_than_predictors(frame, rows):
+    with pytest.raises(ValueError, match="사례"):
+        regression.ols(frame.dropna().iloc[:rows], "y", ["x0", "x1"])
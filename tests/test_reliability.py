@@ -0,0 +1,68 @@
+"""신뢰도 분석 엔진 (statera.reliability)을 문항을 빼고 다시 계산한 값과 비교합니다."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from statera import reliability
+
+
+def cronbach(df):
+    k = df.shape[1]
+    return k / (k - 1) * (1 - df.var().sum() / df.sum(axis=1).var())
+
+
+@pytest.fixture
+def scale():
+    rng = np.random.default_rng(21); trait = rng.normal(size=250)
+    df = pd.DataFrame({f"q{i}": np.clip(np.round(3 + trait * (0.5 + i / 6) + rng.normal(size=250)), 1, 5)
+                       for i in range(5)})
+    df.loc[[3, 77], "q2"] = np.nan
+    return df
+
+
+def test_indices_match_direct_computation(scale):
+    items = list(scale.columns); res = reliability.analyze(scale, items, iterations=0)
+    d = scale.dropna(); k = len(items)
+    assert (res.k, res.n, res.boot_ci) == (k, len(d), None)
+    assert res.alpha == pytest.approx(cronbach(d))
+    rbar = d.corr().to_numpy()[np.triu_indices(k, 1)].mean()
+    assert res.std_alpha == pytest.approx(k * rbar / (1 + (k - 1) * rbar))
+    for i, c in enumerate(items):
+        rest = d.drop(columns=c)
+        assert res.items["item_total_r"][i] == pytest.approx(d[c].corr(rest.sum(axis=1)))
+        assert res.items["alpha_if_deleted"][i] == pytest.approx(cronbach(rest))
+    lo, hi = res.feldt_ci
+    assert lo < res.alpha < hi
+
+
+def test_bootstrap_weights_equal_resampled_rows(scale):
+    X = scale.dropna().to_numpy(); Xc = X - X.mean(axis=0); t = Xc.sum(axis=1)
+    Z = np.column_stack([Xc, Xc * Xc, t, t * t]); seed = np.random.SeedSequence(5)
+    got = reliability._boot_batch((Z, 4, seed))
+    W = np.random.default_rng(seed).multinomial(len(X), np.full(len(X), 1 / len(X)), size=4)
+    ref = [cronbach(pd.DataFrame(np.repeat(X, w, axis=0))) for w in W]
+    np.testing.assert_allclose(got, ref, rtol=1e-10)
+
+
+def test_bootstrap_is_reproducible_and_independent_of_workers(scale, monkeypatch):
+    monkeypatch.setattr(reliability, "BATCH", 64)
+    X = scale.dropna().to_numpy()
+    one = reliability.bootstrap_alpha(X, 300, seed=1, workers=1)
+    assert len(one) == 300
+    np.testing.assert_array_equal(one, reliability.bootstrap_alpha(X, 300, seed=1, workers=4))
+    res = reliability.analyze(scale, list(scale.columns), iterations=300, seed=1)
+    assert res.boot_iterations == 300 and res.boot_ci == tuple(np.quantile(one, [0.025, 0.975]))
+
+
+def test_two_items_and_too_few_rows(scale):
+    res = reliability.analyze(scale, ["q0", "q1"], iterations=50)
+    assert res.items["alpha_if_deleted"].isna().all() and res.boot_ci is not None
+    small = reliability.analyze(scale.iloc[:2], ["q0", "q1", "q3"], iterations=50)
+    assert small.n == 2 and small.boot_ci is None
+
+
+@pytest.mark.parametrize("rows, items, match", [(slice(0, 0), ["q0", "q1"], "사례"), (slice(0, 1), ["q0", "q1"], "사례"),
+                                                (slice(None), ["q0"], "문항")])
+def test_degenerate_input(scale, rows, items, match):
+    with pytest.raises(ValueError, match=match):
+        reliability.analyze(scale.iloc[rows], items)
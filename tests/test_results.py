@@ -0,0 +1,21 @@
+"""결과 저장소: 키 정규화와 compute()가 기록한 결과의 재사용."""
+import numpy as np
+import pandas as pd
+
+from statera import analyses, results
+
+
+def test_key_normalizes_widget_values():
+    a = results.key("d", "frame", "기술통계", (False, [("v", "x"), ("n", np.int64(3))]))
+    b = results.key("d", "frame", "기술통계", (False, (("v", "x"), ("n", 3))))
+    assert a == b and hash(a) == hash(b)
+
+
+def test_compute_stores_result_under_key():
+    df = pd.DataFrame({"x": np.arange(20.0)})
+    src = analyses.Source("results-test", lambda cols: df)
+    k = results.key(src.data_key, "frame", "기술통계", (False, [("v", "x")]))
+    res = analyses.compute(k, "기술통계", src, dict(v="x"))
+    assert results.get(k) is res
+    assert res.method == "기술통계" and results.nbytes(res) > 0
+    assert results.get(results.key(src.data_key, "stream", "기술통계", (False, [("v", "x")]))) is None
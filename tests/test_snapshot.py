@@ -0,0 +1,48 @@
+"""대용량 모드 스냅샷: read()가 요청한 열 순서대로 원본과 같은 값을 돌려주는지 확인합니다."""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from statera import snapshot
+
+pytestmark = pytest.mark.skipif(not snapshot.AVAILABLE, reason="pyarrow 미설치")
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"y": rng.normal(size=50), "x1": rng.normal(size=50), "x2": rng.integers(0, 5, 50),
+                         "g": rng.choice(["A", "B", "C"], 50), 3: rng.normal(size=50)})
+
+
+@pytest.fixture
+def snap(frame):
+    snap = snapshot.SessionSnapshot("key", "data.csv", frame)
+    yield snap
+    snap.close()
+
+
+@pytest.mark.parametrize("columns", [list(p) for p in itertools.permutations(["y", "x1", "x2"])])
+def test_read_keeps_requested_order(frame, snap, columns):
+    pd.testing.assert_frame_equal(snap.read(columns), frame[columns], check_column_type=False)
+
+
+def test_read_mixed_and_duplicate_columns(frame, snap):
+    pd.testing.assert_frame_equal(snap.read([3, "g", "y", "g"]), frame[[3, "g", "y"]], check_column_type=False)
+
+
+def test_close_removes_file(frame):
+    snap = snapshot.SessionSnapshot("key", "data.csv", frame)
+    snap.close()
+    assert not snapshot.os.path.exists(snap.path)
+
+
+def test_names_that_collide_as_strings_stay_separate():
+    frame = pd.DataFrame({1: [1.0, 2.0], "1": [3.0, 4.0], "a": ["x", "y"]})
+    snap = snapshot.SessionSnapshot("key", "data.csv", frame)
+    try:
+        pd.testing.assert_frame_equal(snap.read(["1", 1]), frame[["1", 1]], check_column_type=False)
+    finally:
+        snap.close()
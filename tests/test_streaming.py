@@ -0,0 +1,94 @@
+"""청크 단위 스트리밍 누적기 (statera.streaming): 전체 데이터를 메모리에서 계산한 pandas 결과와 비교합니다."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from statera import frequency, regression, streaming
+
+CHUNK = 37   # 청크 경계가 결측·집단과 어긋나도록 작은 소수 크기
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(13); n = 500
+    df = pd.DataFrame({"a": 1e4 + rng.normal(size=n), "b": rng.exponential(size=n), "c": rng.normal(size=n),
+                       "g": rng.choice(["x", "y", "z"], n)})
+    df["y"] = 2 + df["a"] - 1e4 + 0.5 * df["b"] + rng.normal(size=n)
+    for col, frac in [("a", 0.05), ("b", 0.1), ("g", 0.08)]:
+        df.loc[rng.random(n) < frac, col] = None
+    return df
+
+
+@pytest.fixture
+def csv(frame, tmp_path):
+    path = tmp_path / "data.csv"; frame.to_csv(path, index=False)
+    return path
+
+
+def test_describe_matches_pandas(frame, csv):
+    res = streaming.describe(csv, "b", chunksize=CHUNK)
+    ref = pd.read_csv(csv)["b"]
+    pd.testing.assert_frame_equal(res.table.set_index("index"), ref.to_frame().describe().T, check_names=False, rtol=1e-10)
+    assert (res.skew, res.kurt) == pytest.approx((ref.skew(), ref.kurt()), rel=1e-9)
+    assert res.autocorr == pytest.approx(ref.autocorr(), rel=1e-9)
+    assert len(res.sample) == ref.notna().sum()
+
+
+def test_moments_merge_equals_single_pass(frame):
+    x = frame["a"].to_numpy(dtype=float); whole, left, right = streaming.Moments(), streaming.Moments(), streaming.Moments()
+    whole.update(x); left.update(x[:123]); right.update(x[123:]); left.merge(right)
+    for name in ["n", "mean", "var", "skew", "kurt", "min", "max"]:
+        assert getattr(left, name) == pytest.approx(getattr(whole, name), rel=1e-10), name
+
+
+def test_quantile_sketch(frame):
+    x = frame["c"].to_numpy(dtype=float); s = pd.Series(x)
+    exact = streaming.QuantileSketch()
+    for part in np.array_split(x, 7): exact.update(part)
+    assert exact.exact and [exact.quantile(q) for q in (.25, .5, .75)] == pytest.approx(s.quantile([.25, .5, .75]).tolist())
+    approx = streaming.QuantileSketch(max_exact=50, delta=100)
+    for part in np.array_split(x, 7): approx.update(part)
+    assert not approx.exact and approx.n == s.count()
+    assert [approx.quantile(q) for q in (.25, .5, .75)] == pytest.approx(s.quantile([.25, .5, .75]).tolist(), abs=0.05)
+
+
+def test_frequencies_match_in_memory_engine(csv):
+    got = streaming.frequencies(csv, ["g"], chunksize=CHUNK)
+    pd.testing.assert_frame_equal(got, frequency.frequencies(pd.read_csv(csv), ["g"]))
+    assert streaming.value_counts(csv, ["g"], chunksize=CHUNK)["g"].sum() == pd.read_csv(csv)["g"].count()
+
+
+def test_pairwise_corr_and_listwise_covariance(csv):
+    df = pd.read_csv(csv)[["a", "b", "c"]]
+    res, sample = streaming.corr(csv, ["a", "b", "c"], chunksize=CHUNK, sample_size=100)
+    pd.testing.assert_frame_equal(res.r, df.corr(), rtol=1e-9)
+    np.testing.assert_array_equal(res.n, df.notna().astype(int).T @ df.notna().astype(int))
+    assert sample.shape == (100, 3)
+    cov, n = streaming.item_covariance(csv, ["a", "b", "c"], chunksize=CHUNK)
+    assert n == len(df.dropna())
+    pd.testing.assert_frame_equal(cov, df.dropna().cov(), rtol=1e-9)
+
+
+def test_regression_gram_matches_in_memory_fit(csv):
+    df = pd.read_csv(csv); xs = ["a", "b"]
+    got = regression.fit(streaming.regression_gram(csv, "y", xs, chunksize=CHUNK), xs)
+    ref = regression.ols(df, "y", xs)
+    pd.testing.assert_series_equal(got.params, ref.params, rtol=1e-9)
+    assert (got.ssr, got.durbin_watson) == pytest.approx((ref.ssr, ref.durbin_watson), rel=1e-9)
+
+
+def test_scan_columns(frame, csv):
+    meta = streaming.scan_columns(csv, chunksize=CHUNK)
+    assert meta.n_rows == len(frame) and meta.all_cols == tuple(frame.columns)
+    assert meta.num_cols == ("a", "b", "c", "y") and meta.cat_cols == ("g",)
+    assert meta.missing == frame.isna().sum().to_dict() and meta.cardinality["g"] == 3
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_header_only_file(tmp_path):
+    path = tmp_path / "empty.csv"; path.write_text("a,b\n")
+    res = streaming.describe(path, "a")
+    assert res.table.at[0, "count"] == 0 and np.isnan(res.mean) and res.sample.empty
+    r, _ = streaming.corr(path, ["a", "b"])
+    assert r.r.isna().all().all() and (r.n.to_numpy() == 0).all()
+    assert streaming.scan_columns(path).n_rows == 0